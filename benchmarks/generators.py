@@ -0,0 +1,212 @@
+"""
+Deterministic synthetic data for the benchmarks.
+
+The same seed always yields the same tickets, reports and whitelists, so
+results of different releases are measured on identical inputs.
+"""
+
+import random
+
+class SyntheticData:
+
+    """
+    Generator of valid model parameters.
+    """
+
+    TLDS = ('com', 'net', 'org', 'it', 'eu', 'tv', 'io')
+
+    REASONS = ('ALREADY_BLOCKED', 'UNDEFINED', 'UNKNOWN')
+
+    def __init__(self, seed: int = 1):
+        """
+        Seeds the generator.
+
+        :param seed: the random seed.
+        """
+
+        self.random = random.Random(seed)
+
+    def identifier(self) -> str:
+        """
+        :return: a 32 characters hexadecimal identifier.
+        """
+
+        return f'{self.random.getrandbits(128):032x}'
+
+    def fqdn(self) -> str:
+        """
+        :return: a random FQDN with one to three labels before the TLD.
+        """
+
+        labels = [
+            ''.join(self.random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k = self.random.randint(3, 12)))
+            for _ in range(self.random.randint(1, 3))
+        ]
+
+        return '.'.join(labels) + '.' + self.random.choice(self.TLDS)
+
+    def ipv4(self) -> str:
+        """
+        :return: a random public IPv4.
+        """
+
+        first = self.random.choice([octet for octet in range(1, 224) if octet not in (10, 100, 127, 169, 172, 192)])
+
+        return f'{first}.{self.random.randint(0, 255)}.{self.random.randint(0, 255)}.{self.random.randint(1, 254)}'
+
+    def ipv6(self) -> str:
+        """
+        :return: a random global unicast IPv6.
+        """
+
+        groups = [self.random.randint(0x2000, 0x2fff)] + [self.random.randint(0, 0xffff) for _ in range(7)]
+
+        return ':'.join(f'{group:x}' for group in groups)
+
+    def values(self, count: int, mix: tuple = (0.6, 0.3, 0.1)) -> tuple:
+        """
+        Builds unique FQDN, IPv4 and IPv6 lists.
+
+        :param count: total number of values.
+        :param mix: share of FQDN, IPv4 and IPv6 values.
+        :return: the FQDN, IPv4 and IPv6 lists.
+        """
+
+        output = []
+
+        for generator, share in zip((self.fqdn, self.ipv4, self.ipv6), mix):
+            size = round(count * share)
+
+            values = set()
+
+            while len(values) < size:
+                values.add(generator())
+
+            output.append(sorted(values))
+
+        return tuple(output)
+
+    def mixed_values(self, count: int) -> list:
+        """
+        :return: a shuffled list of FQDN, IPv4 and IPv6 values.
+        """
+
+        fqdn, ipv4, ipv6 = self.values(count)
+
+        values = fqdn + ipv4 + ipv6
+
+        self.random.shuffle(values)
+
+        return values
+
+    def ticket(self, size: int) -> dict:
+        """
+        :param size: number of items.
+        :return: the parameters of a TicketModel.
+        """
+
+        fqdn, ipv4, ipv6 = self.values(size)
+
+        return {
+            'ticket_id': self.identifier(),
+            'dda_id': self.identifier(),
+            'fqdn': fqdn,
+            'ipv4': ipv4,
+            'ipv6': ipv6,
+            'assigned_to': [self.identifier() for _ in range(3)],
+            'description': 'Synthetic ticket'
+        }
+
+    def ticket_error(self, size: int) -> dict:
+        """
+        :param size: number of items.
+        :return: the parameters of a TicketErrorModel.
+        """
+
+        fqdn, ipv4, ipv6 = self.values(size)
+
+        return {
+            'ticket_error_id': self.identifier(),
+            'ticket_id': self.identifier(),
+            'fqdn': fqdn,
+            'ipv4': ipv4,
+            'ipv6': ipv6
+        }
+
+    def ticket_items(self, count: int) -> list:
+        """
+        :param count: number of items.
+        :return: a list of TicketItemModel parameters, sharing a ticket and a few providers.
+        """
+
+        ticket_id = self.identifier()
+
+        providers = [self.identifier() for _ in range(10)]
+
+        output = []
+
+        for value in self.mixed_values(count):
+            output.append({
+                'ticket_id': ticket_id,
+                'ticket_item_id': self.identifier(),
+                'provider_id': self.random.choice(providers),
+                'value': value,
+                'genre': 'ipv6' if ':' in value else ('fqdn' if value[-1].isalpha() else 'ipv4'),
+                'is_active': True,
+                'is_duplicate': False,
+                'is_whitelisted': False,
+                'is_error': False
+            })
+
+        return output
+
+    def report(self, count: int, unprocessed: float = 0.2) -> tuple:
+        """
+        Builds a provider report, timestamps are shared by many rows.
+
+        :param count: number of rows.
+        :param unprocessed: share of unprocessed rows.
+        :return: the provider identifier and the list of (value, status, reason, timestamp, note) rows.
+        """
+
+        timestamps = [f'2024-03-{day:02d}T{hour:02d}:{minute:02d}:00Z' for day in (1, 2) for hour in (9, 18) for minute in (0, 30)]
+
+        rows = []
+
+        for value in self.mixed_values(count):
+            timestamp = self.random.choice(timestamps)
+
+            if self.random.random() < unprocessed:
+                rows.append((value, 'unprocessed', self.random.choice(self.REASONS), timestamp, 'Not blocked'))
+
+            else:
+                rows.append((value, 'processed', None, timestamp, None))
+
+        return self.identifier(), rows
+
+    def whitelist(self, count: int) -> list:
+        """
+        :param count: number of items.
+        :return: a list of WhitelistModel parameters of every genre.
+        """
+
+        output = []
+
+        for index in range(count):
+            kind = index % 5
+
+            if kind < 2:
+                output.append({'genre': 'fqdn', 'value': self.fqdn(), 'is_active': True, 'registrar': 'Synthetic Registrar'})
+
+            elif kind == 2:
+                output.append({'genre': 'ipv4', 'value': self.ipv4(), 'is_active': True, 'as_code': f'AS{self.random.randint(1, 65000)}'})
+
+            elif kind == 3:
+                output.append({'genre': 'ipv6', 'value': self.ipv6(), 'is_active': True, 'as_code': f'AS{self.random.randint(1, 65000)}'})
+
+            else:
+                address = self.ipv4().rsplit('.', 1)[0]
+
+                output.append({'genre': 'cidr_ipv4', 'value': f'{address}.0/24', 'is_active': True, 'as_code': f'AS{self.random.randint(1, 65000)}'})
+
+        return output
@@ -0,0 +1,69 @@
+"""
+Import time budget of the models.
+
+Imports a module in fresh interpreters with -X importtime and fails when the
+best cumulative time exceeds the budget, so slow imports do not sneak back in.
+
+The default budget is the import time of the ticket model before the lazy
+loading work, about 23 ms, plus a small margin for noise.
+
+Usage: python benchmarks/import_time.py [budget_ms] [module] [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+def measure(module: str) -> float:
+    """
+    Imports a module in a fresh interpreter.
+
+    :param module: the dotted module name.
+    :return: the cumulative import time in milliseconds.
+    """
+
+    # the bytecode cache must be written, or every run compiles the sources again
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output = True,
+        text = True,
+        env = env,
+        check = True
+    )
+
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split('|')
+
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+
+    raise RuntimeError(f'{module} not found in the import time report')
+
+def main(budget: float = 25.0, module: str = 'piracyshield_data_model.ticket.model', runs: int = 5) -> int:
+    # the first run also warms up the bytecode cache
+    timings = sorted(measure(module) for _ in range(runs + 1))[:runs]
+
+    best = timings[0]
+
+    print(f'module:          {module}')
+    print(f'runs:            {runs}')
+    print(f'best:            {best:.1f} ms')
+    print(f'median:          {timings[len(timings) // 2]:.1f} ms')
+    print(f'budget:          {budget:.1f} ms')
+
+    if best > budget:
+        print('over budget')
+
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 25.0,
+        sys.argv[2] if len(sys.argv) > 2 else 'piracyshield_data_model.ticket.model',
+        int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    ))
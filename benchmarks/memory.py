@@ -0,0 +1,130 @@
+"""
+Per-instance memory footprint of the slots based models.
+
+Builds a large fan-out of ticket items and compares it against the same data
+stored in a dictionary based layout, which is how models were stored before,
+then compares the IPv4 and IPv6 lists of a big ticket stored as strings and
+packed (TicketModel.pack).
+
+The saving depends on the interpreter: since Python 3.12 plain instances keep
+their attributes inline, so their dictionaries are already much smaller.
+
+Usage: python benchmarks/memory.py [count]
+"""
+
+import sys
+import tracemalloc
+
+from piracyshield_data_model.plan import RulePlan
+
+from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+from piracyshield_data_model.ticket.item.model import TicketItemModel
+
+class DictTicketItem:
+
+    """
+    Ticket item stored in a per-instance dictionary, used as reference.
+    """
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+def measure(factory, count: int) -> int:
+    """
+    Measures the memory allocated by a batch of instances.
+
+    :param factory: a callable returning a new instance for the given index.
+    :param count: how many instances to build.
+    :return: the allocated bytes per instance.
+    """
+
+    tracemalloc.start()
+
+    before, _ = tracemalloc.get_traced_memory()
+
+    instances = [factory(index) for index in range(count)]
+
+    after, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    del instances
+
+    return (after - before) // count
+
+def measure_lists(count: int) -> None:
+    """
+    Compares the IPv4 and IPv6 lists of a ticket stored as strings and packed.
+
+    :param count: number of addresses of each list.
+    """
+
+    # built at each call, as strings loaded from storage are never shared
+    def ipv4() -> list:
+        return [f'{1 + (index >> 24)}.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}' for index in range(count)]
+
+    def ipv6() -> list:
+        return [f'2001:db8:{index >> 16:x}:{index & 0xffff:x}::1' for index in range(count)]
+
+    for name, build, packer in (('ipv4', ipv4, IPv4Array), ('ipv6', ipv6, IPv6Array)):
+        strings = measure(lambda index: build(), 1)
+
+        packed = measure(lambda index: packer(build()), 1)
+
+        print(f'{name} strings:    {strings // count} bytes per address')
+        print(f'{name} packed:     {packed // count} bytes per address')
+
+def main(count: int = 100000) -> None:
+    # the values remembered by the validation cache are not part of the instances
+    RulePlan.cache.configure(enabled = False)
+
+    ticket_id = 'a' * 32
+
+    provider_id = 'b' * 32
+
+    values = [f'10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}' for index in range(count)]
+
+    item_ids = [f'{index:032x}' for index in range(count)]
+
+    def build_model(index: int) -> TicketItemModel:
+        return TicketItemModel(
+            ticket_id = ticket_id,
+            ticket_item_id = item_ids[index],
+            provider_id = provider_id,
+            value = values[index],
+            genre = 'ipv4',
+            is_active = True,
+            is_duplicate = False,
+            is_whitelisted = False,
+            is_error = False
+        )
+
+    reference = build_model(0)
+
+    def build_dict(index: int) -> DictTicketItem:
+        fields = reference.to_dict()
+
+        fields['ticket_item_id'] = item_ids[index]
+
+        fields['value'] = values[index]
+
+        # every model owns its settings
+        fields['settings'] = dict(fields['settings'])
+
+        return DictTicketItem(**fields)
+
+    slots_size = measure(build_model, count)
+
+    dict_size = measure(build_dict, count)
+
+    print(f'python:          {sys.version.split()[0]}')
+    print(f'instances:       {count}')
+    print(f'slots layout:    {slots_size} bytes per instance')
+    print(f'dict layout:     {dict_size} bytes per instance')
+    print(f'reduction:       {100 - (slots_size * 100 // dict_size)}%')
+
+    measure_lists(count)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,172 @@
+"""
+Construction and export throughput of the models.
+
+Builds the models from deterministic synthetic data and reports throughput and
+latency percentiles for each case, optionally exported as JSON to compare
+releases.
+
+Usage: python benchmarks/models.py [--sizes 10,1000,100000] [--samples 5] [--seed 1] [--cache] [--json results.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from generators import SyntheticData
+
+from piracyshield_data_model.plan import RulePlan
+
+from piracyshield_data_model.ticket.model import TicketModel
+from piracyshield_data_model.ticket.error.model import TicketErrorModel
+from piracyshield_data_model.ticket.item.model import TicketItemModel
+from piracyshield_data_model.ticket.item.processed.model import TicketItemProcessedModel
+from piracyshield_data_model.ticket.item.unprocessed.model import TicketItemUnprocessedModel
+from piracyshield_data_model.ticket.item.report.model import TicketItemReportModel
+
+from piracyshield_data_model.whitelist.model import WhitelistModel
+
+def percentile(timings: list, share: float) -> float:
+    """
+    :param timings: a sorted list of timings.
+    :param share: the percentile, between 0 and 1.
+    :return: the nearest rank percentile.
+    """
+
+    return timings[min(len(timings) - 1, int(share * len(timings)))]
+
+def run(name: str, size: int, operation: callable, inputs: list, samples: int) -> dict:
+    """
+    Times an operation over every input, for a number of samples.
+
+    :param name: the case name.
+    :param size: number of items processed by each call.
+    :param operation: a callable taking one input.
+    :param inputs: the inputs of each call.
+    :param samples: how many times the inputs are processed.
+    :return: the case results.
+    """
+
+    clock = time.perf_counter_ns
+
+    timings = []
+
+    for _ in range(samples):
+        for value in inputs:
+            start = clock()
+
+            operation(value)
+
+            timings.append(clock() - start)
+
+    timings.sort()
+
+    total = sum(timings)
+
+    return {
+        'name': name,
+        'size': size,
+        'calls': len(timings),
+        'throughput': len(timings) * size / (total / 1e9) if total else None,
+        'p50_us': percentile(timings, 0.50) / 1000,
+        'p90_us': percentile(timings, 0.90) / 1000,
+        'p99_us': percentile(timings, 0.99) / 1000,
+        'max_us': timings[-1] / 1000
+    }
+
+def cases(data: SyntheticData, sizes: list) -> list:
+    """
+    Builds the benchmark cases.
+
+    :return: a list of (name, size, operation, inputs) tuples.
+    """
+
+    output = []
+
+    for size in sizes:
+        # keep the total work of each case roughly constant
+        calls = max(1, 10000 // size)
+
+        tickets = [data.ticket(size) for _ in range(calls)]
+
+        output.append(('TicketModel', size, lambda parameters: TicketModel(**parameters), tickets))
+
+        output.append(('TicketModel.to_dict', size, lambda model: model.to_dict(), [TicketModel(**parameters) for parameters in tickets]))
+
+        errors = [data.ticket_error(size) for _ in range(calls)]
+
+        output.append(('TicketErrorModel', size, lambda parameters: TicketErrorModel(**parameters), errors))
+
+        provider_id, rows = data.report(size)
+
+        output.append(('TicketItemReportModel', size, lambda rows, provider_id = provider_id: TicketItemReportModel(provider_id, rows), [rows] * calls))
+
+    items = data.ticket_items(10000)
+
+    output.append(('TicketItemModel', 1, lambda parameters: TicketItemModel(**parameters), items))
+
+    output.append(('TicketItemModel.to_dict', 1, lambda model: model.to_dict(), [TicketItemModel(**parameters) for parameters in items]))
+
+    provider_id, rows = data.report(10000)
+
+    processed = [row for row in rows if row[1] == 'processed']
+
+    unprocessed = [row for row in rows if row[1] == 'unprocessed']
+
+    output.append(('TicketItemProcessedModel', 1, lambda row: TicketItemProcessedModel(provider_id, row[0], row[3], row[4]), processed))
+
+    output.append(('TicketItemUnprocessedModel', 1, lambda row: TicketItemUnprocessedModel(provider_id, row[0], row[2], row[3], row[4]), unprocessed))
+
+    output.append(('TicketItemProcessedModel.to_dict', 1, lambda model: model.to_dict(), [TicketItemProcessedModel(provider_id, row[0], row[3], row[4]) for row in processed]))
+
+    whitelist = data.whitelist(10000)
+
+    output.append(('WhitelistModel', 1, lambda parameters: WhitelistModel(**parameters), whitelist))
+
+    output.append(('WhitelistModel.to_dict', 1, lambda model: model.to_dict(), [WhitelistModel(**parameters) for parameters in whitelist]))
+
+    return output
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = 'Model construction benchmarks.')
+
+    parser.add_argument('--sizes', default = '10,1000,100000', help = 'comma separated ticket sizes')
+    parser.add_argument('--samples', type = int, default = 5, help = 'passes over each case inputs')
+    parser.add_argument('--seed', type = int, default = 1, help = 'synthetic data seed')
+    parser.add_argument('--cache', action = 'store_true', help = 'keep the shared validation cache enabled')
+    parser.add_argument('--json', help = 'write the results to this file')
+
+    arguments = parser.parse_args()
+
+    # measure the validation itself, not the memo of the values seen in previous samples
+    RulePlan.cache.configure(enabled = arguments.cache)
+
+    sizes = [int(size) for size in arguments.sizes.split(',')]
+
+    results = []
+
+    print(f'{"case":<36} {"size":>7} {"items/s":>12} {"p50 us":>10} {"p90 us":>10} {"p99 us":>10}')
+
+    for name, size, operation, inputs in cases(SyntheticData(arguments.seed), sizes):
+        result = run(name, size, operation, inputs, arguments.samples)
+
+        results.append(result)
+
+        print(f'{name:<36} {size:>7} {result["throughput"]:>12.0f} {result["p50_us"]:>10.1f} {result["p90_us"]:>10.1f} {result["p99_us"]:>10.1f}')
+
+    if arguments.json:
+        with open(arguments.json, 'w') as handle:
+            json.dump({
+                'python': sys.version.split()[0],
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'seed': arguments.seed,
+                'samples': arguments.samples,
+                'cache': arguments.cache,
+                'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'results': results
+            }, handle, indent = 4)
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,30 @@
- 
+from piracyshield_data_model.lazy import lazy_exports
+
+# models are imported on first access, see lazy_exports
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'base': ['BaseModel'],
+    'plan': ['RulePlan', 'RuleCache', 'ParallelValidation'],
+    'address': ['IPv4Array', 'IPv6Array'],
+    'timestamp': ['Timestamp'],
+    'instrumentation': ['Instrumentation'],
+    'patch': ['PatchModel']
+}, (
+    'account',
+    'address',
+    'authentication',
+    'base',
+    'dda',
+    'forensic',
+    'guest',
+    'instrumentation',
+    'internal',
+    'log',
+    'patch',
+    'permission',
+    'plan',
+    'provider',
+    'reporter',
+    'ticket',
+    'timestamp',
+    'whitelist'
+))
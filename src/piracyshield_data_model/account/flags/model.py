@@ -2,13 +2,15 @@ from piracyshield_data_model.base import BaseModel
 
 class AccountFlagsModel(BaseModel):
 
-    flags = {
-        'change_password': False
-    }
+    __slots__ = (
+        'flags',
+    )
 
     def __init__(self, flags: dict):
-        # little hack
-        self.flags = self.flags
+        # each instance owns its flags, starting from the defaults
+        self.flags = {
+            'change_password': False
+        }
 
         if not all(flag in self.flags.keys() for flag in flags.keys()):
             raise AccountFlagsModelUnknownFlagException()
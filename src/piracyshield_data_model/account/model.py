@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.account.rule import AccountRule
 
@@ -12,17 +12,32 @@ class AccountModel(BaseModel):
     Central account data modeling class.
     """
 
-    account_id = None
-
-    name = None
-
-    email = None
-
-    password = None
-
-    role = None
-
-    is_active = True
+    __slots__ = (
+        'account_id',
+        'name',
+        'email',
+        'password',
+        'confirm_password',
+        'role',
+        'is_active'
+    )
+
+    # stored passwords are hashed and the confirmation is never stored
+    _unverified = (
+        'password',
+        'confirm_password'
+    )
+
+    # not editable by a patch
+    _identifiers = (
+        'account_id',
+    )
+
+    # hashed by the caller before storing, the confirmation is never stored
+    _transient = (
+        'password',
+        'confirm_password'
+    )
 
     def __init__(self, account_id: str, name: str, email: str, password: str, confirm_password: str, role: int, is_active: bool):
         """
@@ -51,6 +66,16 @@ class AccountModel(BaseModel):
 
         self.is_active = self._validate_is_active(is_active)
 
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        A new password always needs its confirmation.
+
+        :param changed: the names of the changed fields.
+        """
+
+        if 'password' in changed and 'confirm_password' not in changed:
+            self._validate_confirm_password(self.confirm_password)
+
     def _validate_account_id(self, value: str) -> str | Exception:
         """
         Validates the account identifier.
@@ -59,12 +84,10 @@ class AccountModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AccountRule.ACCOUNT_ID)
+        plan = RulePlan.compile(AccountRule.ACCOUNT_ID)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise AccountModelAccountIDException(validator.errors)
+        if not plan.is_valid(value):
+            raise AccountModelAccountIDException(plan.errors(value))
 
         return value
 
@@ -76,12 +99,10 @@ class AccountModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AccountRule.NAME)
-
-        validator.validate()
+        plan = RulePlan.compile(AccountRule.NAME)
 
-        if not validator.is_valid():
-            raise AccountModelNameException(validator.errors)
+        if not plan.is_valid(value):
+            raise AccountModelNameException(plan.errors(value))
 
         return value
 
@@ -93,12 +114,10 @@ class AccountModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AccountRule.EMAIL)
+        plan = RulePlan.compile(AccountRule.EMAIL)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise AccountModelEmailException(validator.errors)
+        if not plan.is_valid(value):
+            raise AccountModelEmailException(plan.errors(value))
 
         return value
 
@@ -110,12 +129,10 @@ class AccountModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AccountRule.PASSWORD)
-
-        validator.validate()
+        plan = RulePlan.compile(AccountRule.PASSWORD)
 
-        if not validator.is_valid():
-            raise AccountModelPasswordException(validator.errors)
+        if not plan.is_valid(value):
+            raise AccountModelPasswordException(plan.errors(value))
 
         return value
 
@@ -127,16 +144,14 @@ class AccountModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AccountRule.PASSWORD)
+        plan = RulePlan.compile(AccountRule.PASSWORD)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise AccountModelConfirmPasswordException(validator.errors)
+        if not plan.is_valid(value):
+            raise AccountModelConfirmPasswordException(plan.errors(value))
 
         # finally verify if the two passwords match
         if value != self.password:
-            raise AccountModelConfirmPasswordMismatchException(validator.errors)
+            raise AccountModelConfirmPasswordMismatchException()
 
         return value
 
@@ -148,12 +163,10 @@ class AccountModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AccountRule.ROLE)
-
-        validator.validate()
+        plan = RulePlan.compile(AccountRule.ROLE)
 
-        if not validator.is_valid():
-            raise AccountModelRoleException(validator.errors)
+        if not plan.is_valid(value):
+            raise AccountModelRoleException(plan.errors(value))
 
         try:
             enum = AccountRoleModel(value)
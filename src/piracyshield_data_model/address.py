@@ -0,0 +1,259 @@
+from array import array
+
+import socket
+
+class IPv4Array:
+
+    """
+    Compact list of IPv4 addresses stored as 32-bit unsigned integers.
+
+    The underlying array exposes the buffer protocol, so it can be wrapped without copies (e.g. numpy.frombuffer).
+    """
+
+    __slots__ = (
+        'items',
+    )
+
+    # smallest native unsigned type holding 32 bits
+    TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+
+    def __init__(self, values: list = ()):
+        """
+        Packs the addresses.
+
+        :param values: a list of IPv4 strings or integers.
+        """
+
+        self.items = array(self.TYPECODE, [value if isinstance(value, int) else self.pack(value) for value in values])
+
+    @staticmethod
+    def pack(value: str) -> int:
+        """
+        Converts an IPv4 string into its integer form.
+
+        :param value: a valid IPv4 string.
+        :return: the 32-bit integer.
+        """
+
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, value), 'big')
+
+    @staticmethod
+    def unpack(value: int) -> str:
+        """
+        Converts an integer back into the canonical IPv4 string.
+
+        :param value: a 32-bit integer.
+        :return: the dotted quad string.
+        """
+
+        return socket.inet_ntop(socket.AF_INET, value.to_bytes(4, 'big'))
+
+    def append(self, value: str) -> None:
+        """
+        Packs and appends an address.
+
+        :param value: a valid IPv4 string.
+        """
+
+        self.items.append(self.pack(value))
+
+    def integers(self) -> array:
+        """
+        Returns the packed integers.
+        """
+
+        return self.items
+
+    def to_set(self) -> set:
+        """
+        Returns the packed integers as a set, for cheap set operations.
+        """
+
+        return set(self.items)
+
+    def sort(self) -> None:
+        """
+        Sorts the addresses numerically, in place.
+        """
+
+        self.items = array(self.TYPECODE, sorted(self.items))
+
+    def tolist(self) -> list:
+        """
+        Converts the addresses back into strings.
+        """
+
+        return [self.unpack(value) for value in self.items]
+
+    def __contains__(self, value: str) -> bool:
+        return self.pack(value) in self.items
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, IPv4Array):
+            return self.items == other.items
+
+        # compares with a plain list of strings, e.g. the empty default of a ticket
+        if isinstance(other, list):
+            return len(other) == len(self) and self.tolist() == other
+
+        return NotImplemented
+
+    def __getitem__(self, index: int | slice) -> 'str | IPv4Array':
+        if isinstance(index, slice):
+            output = IPv4Array()
+
+            output.items = self.items[index]
+
+            return output
+
+        return self.unpack(self.items[index])
+
+    def __iter__(self):
+        for value in self.items:
+            yield self.unpack(value)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+class IPv6Array:
+
+    """
+    Compact list of IPv6 addresses stored as 128-bit values.
+
+    Each address takes two consecutive 64-bit unsigned integers, most significant half first.
+    """
+
+    __slots__ = (
+        'items',
+    )
+
+    TYPECODE = 'Q'
+
+    MASK = (1 << 64) - 1
+
+    def __init__(self, values: list = ()):
+        """
+        Packs the addresses.
+
+        :param values: a list of IPv6 strings or integers.
+        """
+
+        self.items = array(self.TYPECODE)
+
+        for value in values:
+            self._push(value if isinstance(value, int) else self.pack(value))
+
+    @staticmethod
+    def pack(value: str) -> int:
+        """
+        Converts an IPv6 string into its integer form.
+
+        :param value: a valid IPv6 string.
+        :return: the 128-bit integer.
+        """
+
+        return int.from_bytes(socket.inet_pton(socket.AF_INET6, value), 'big')
+
+    @staticmethod
+    def unpack(value: int) -> str:
+        """
+        Converts an integer back into the canonical (RFC 5952) IPv6 string.
+
+        Unlike ipaddress, the platform keeps the dotted form of IPv4 mapped addresses on every Python version.
+
+        :param value: a 128-bit integer.
+        :return: the compressed IPv6 string.
+        """
+
+        return socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, 'big'))
+
+    def _push(self, value: int) -> None:
+        self.items.append(value >> 64)
+
+        self.items.append(value & self.MASK)
+
+    def append(self, value: str) -> None:
+        """
+        Packs and appends an address.
+
+        :param value: a valid IPv6 string.
+        """
+
+        self._push(self.pack(value))
+
+    def integers(self) -> list:
+        """
+        Returns the packed addresses as 128-bit integers.
+        """
+
+        items = self.items
+
+        return [(items[index] << 64) | items[index + 1] for index in range(0, len(items), 2)]
+
+    def to_set(self) -> set:
+        """
+        Returns the packed integers as a set, for cheap set operations.
+        """
+
+        return set(self.integers())
+
+    def sort(self) -> None:
+        """
+        Sorts the addresses numerically, in place.
+        """
+
+        values = sorted(self.integers())
+
+        self.items = array(self.TYPECODE)
+
+        for value in values:
+            self._push(value)
+
+    def tolist(self) -> list:
+        """
+        Converts the addresses back into strings.
+        """
+
+        return [self.unpack(value) for value in self.integers()]
+
+    def __contains__(self, value: str) -> bool:
+        return self.pack(value) in self.to_set()
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, IPv6Array):
+            return self.items == other.items
+
+        # compares with a plain list of strings, e.g. the empty default of a ticket
+        if isinstance(other, list):
+            return len(other) == len(self) and self.tolist() == other
+
+        return NotImplemented
+
+    def __getitem__(self, index: int | slice) -> 'str | IPv6Array':
+        if isinstance(index, slice):
+            output = IPv6Array()
+
+            items = self.items
+
+            # each address takes two items
+            for position in range(len(self))[index]:
+                output.items.append(items[position * 2])
+
+                output.items.append(items[position * 2 + 1])
+
+            return output
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('address index out of range')
+
+        return self.unpack((self.items[index * 2] << 64) | self.items[index * 2 + 1])
+
+    def __iter__(self):
+        for value in self.integers():
+            yield self.unpack(value)
+
+    def __len__(self) -> int:
+        return len(self.items) // 2
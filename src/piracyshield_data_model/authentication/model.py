@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.authentication.rule import AuthenticationRule
 
@@ -10,9 +10,10 @@ class AuthenticationModel(BaseModel):
     Authentication data modeling class.
     """
 
-    email = None
-
-    password = None
+    __slots__ = (
+        'email',
+        'password'
+    )
 
     def __init__(self, email: str, password: str):
         """
@@ -34,12 +35,10 @@ class AuthenticationModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AuthenticationRule.EMAIL)
-
-        validator.validate()
+        plan = RulePlan.compile(AuthenticationRule.EMAIL)
 
-        if not validator.is_valid():
-            raise AuthenticationModelEmailException(validator.errors)
+        if not plan.is_valid(value):
+            raise AuthenticationModelEmailException(plan.errors(value))
 
         return value
 
@@ -51,12 +50,10 @@ class AuthenticationModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, AuthenticationRule.PASSWORD)
-
-        validator.validate()
+        plan = RulePlan.compile(AuthenticationRule.PASSWORD)
 
-        if not validator.is_valid():
-            raise AuthenticationModelPasswordException(validator.errors)
+        if not plan.is_valid(value):
+            raise AuthenticationModelPasswordException(plan.errors(value))
 
         return value
 
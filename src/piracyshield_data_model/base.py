@@ -1,19 +1,354 @@
+# placeholders generating the functions of a model class on first use, see BaseModel._compile
+def _export(model: 'BaseModel') -> dict:
+    return type(model)._compile()._export(model)
+
+def _load(model: 'BaseModel', data: dict) -> None:
+    type(model)._compile()._load(model, data)
+
+def _load_row(model: 'BaseModel', row: tuple) -> None:
+    type(model)._compile()._load_row(model, row)
 
 class BaseModel:
 
     """
     Base data modeling class with utilities.
+
+    Models declare their fields through __slots__, so instances carry no per-instance dictionary.
     """
 
-    def to_dict(self) -> dict:
+    __slots__ = ()
+
+    # public fields in export order, computed once per class
+    _fields = ()
+
+    # private slots, reset by a trusted load
+    _private = ()
+
+    # exports the fields, generated on first use per class
+    _export = staticmethod(_export)
+
+    # constructor defaults of the fields, left out of the export as they were never stored
+    _defaults = {}
+
+    # whether instances also carry a dictionary
+    _dynamic = False
+
+    # loads the fields from a trusted dictionary or row, generated on first use per class
+    _load = staticmethod(_load)
+
+    _load_row = staticmethod(_load_row)
+
+    # whether the functions above have been generated
+    _compiled = False
+
+    # fields not checked by verify, such as values stored in a different form
+    _unverified = ()
+
+    # (field, validator name) pairs checked by verify
+    _verified = ()
+
+    # optional fields, validated only when set and cleared by a patch without validating them
+    _optional = ()
+
+    # identifier fields, not editable by a patch unless explicitly allowed
+    _identifiers = ()
+
+    # fields validated but never stored as they are, left out of a patch diff
+    _transient = ()
+
+    # callables run on every new model class, such as the instrumentation of lazily imported models
+    _class_hooks = []
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precomputes the exported fields of each model class.
+
+        The export and trusted load functions are only generated on their first use, see _compile.
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        fields = []
+
+        private = []
+
+        for klass in reversed(cls.__mro__):
+            for key in klass.__dict__.get('__slots__', ()):
+                # private attributes are not part of the data
+                if key.startswith('_'):
+                    if key not in private and key not in ('__dict__', '__weakref__'):
+                        private.append(key)
+
+                elif key not in fields:
+                    fields.append(key)
+
+        cls._fields = tuple(fields)
+
+        cls._private = tuple(private)
+
+        # the functions of a parent class would miss the new fields
+        cls._export = staticmethod(_export)
+
+        cls._load = staticmethod(_load)
+
+        cls._load_row = staticmethod(_load_row)
+
+        cls._compiled = False
+
+        cls._verified = tuple(
+            (key, f'_validate_{key}') for key in fields
+            if key not in cls._unverified and hasattr(cls, f'_validate_{key}')
+        )
+
+        cls._dynamic = cls.__dictoffset__ != 0
+
+        for hook in BaseModel._class_hooks:
+            hook(cls)
+
+    @classmethod
+    def _compile(cls) -> type:
+        """
+        Generates the export and trusted load functions of the class, once.
+
+        Each function is generated with a plain attribute access per field, which avoids walking
+        the class hierarchy and any intermediate container on every call. Compiling them is left
+        to the first use, so importing a model does not pay for it.
+
+        :return: the same class.
+        """
+
+        if cls.__dict__.get('_compiled'):
+            return cls
+
+        lines = [
+            'def export(model):',
+            '    output = {}'
+        ]
+
+        for key in cls._fields:
+            lines.extend([
+                f'    value = model.{key}',
+                f'    if value is not None and value != defaults[{key!r}]:' if key in cls._defaults else '    if value is not None:',
+                f'        output[{key!r}] = value'
+            ])
+
+        lines.extend([
+            '    return output',
+            'def load(model, data):',
+            '    get = data.get'
+        ])
+
+        for key in cls._fields:
+            lines.extend(cls._load_field(key, f'get({key!r})'))
+
+        lines.extend(f'    model.{key} = None' for key in cls._private)
+
+        lines.append('def load_row(model, row):')
+
+        for index, key in enumerate(cls._fields):
+            lines.extend(cls._load_field(key, f'row[{index}]'))
+
+        lines.extend(f'    model.{key} = None' for key in cls._private)
+
+        # keeps the body valid for models without fields
+        lines.append('    return')
+
+        namespace = {
+            'defaults': cls._defaults
+        }
+
+        exec('\n'.join(lines), namespace)
+
+        cls._export = staticmethod(namespace['export'])
+
+        cls._load = staticmethod(namespace['load'])
+
+        cls._load_row = staticmethod(namespace['load_row'])
+
+        cls._compiled = True
+
+        return cls
+
+    @classmethod
+    def _load_field(cls, key: str, source: str) -> list:
+        """
+        Generates the lines loading a field, falling back to its constructor default.
+        """
+
+        if key not in cls._defaults:
+            return [f'    model.{key} = {source}']
+
+        # every model owns its copy of a mutable default
+        default = f'defaults[{key!r}].copy()' if hasattr(cls._defaults[key], 'copy') else f'defaults[{key!r}]'
+
+        return [
+            f'    value = {source}',
+            f'    model.{key} = {default} if value is None else value'
+        ]
+
+    @classmethod
+    def from_trusted(cls, data: dict, verify: bool = False) -> 'BaseModel':
+        """
+        Builds a model from data validated when it was stored, skipping the validation.
+
+        Missing fields are set to their constructor default or None, unknown keys, such as storage metadata, are ignored.
+
+        :param data: a dictionary with the same layout of to_dict.
+        :param verify: validate the fields anyway, see verify.
+        :return: a new model.
+        """
+
+        model = cls.__new__(cls)
+
+        cls._load(model, data)
+
+        if verify:
+            model.verify()
+
+        return model
+
+    @classmethod
+    def from_row(cls, row: tuple, verify: bool = False) -> 'BaseModel':
+        """
+        Builds a model from a trusted row of values, skipping the validation.
+
+        :param row: a sequence of values in the order of the model fields.
+        :param verify: validate the fields anyway, see verify.
+        :return: a new model.
+        """
+
+        if len(row) != len(cls._fields):
+            raise BaseModelRowNonValidException()
+
+        model = cls.__new__(cls)
+
+        cls._load_row(model, row)
+
+        if verify:
+            model.verify()
+
+        return model
+
+    @classmethod
+    def from_trusted_many(cls, items: list, sample: float = 0.0) -> list:
+        """
+        Builds many models from trusted dictionaries, validating only a random sample of them.
+
+        Sampling keeps the cost of a page of results low while still catching corrupted storage.
+
+        :param items: an iterable of dictionaries.
+        :param sample: share of the models to verify, between 0 and 1.
+        :return: a list of models.
+        """
+
+        from random import random
+
+        load = cls._compile()._load
+
+        output = []
+
+        for data in items:
+            model = cls.__new__(cls)
+
+            load(model, data)
+
+            if sample and random() < sample:
+                model.verify()
+
+            output.append(model)
+
+        return output
+
+    def verify(self) -> 'BaseModel':
+        """
+        Runs the validator of each field, raising the same exceptions of the constructor.
+
+        Optional fields are skipped when empty, as in the constructors.
+
+        Meant for models built from trusted data, to check them later or only when needed.
+
+        :return: the same model.
+        """
+
+        for key, validator in self._verified:
+            value = getattr(self, key, None)
+
+            # optional fields are only validated when set, as in the constructors
+            if key in self._optional and (value is None or (not value and hasattr(value, '__len__'))):
+                continue
+
+            getattr(self, validator)(value)
+
+        return self
+
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        Validates the rules spanning more fields, after a patch changed some of them.
+
+        :param changed: the names of the changed fields, already validated on their own.
+        """
+
+        pass
+
+    def to_dict(self, copy: bool = False, deep: bool = False) -> dict:
         """
         Exports the set data into a dictionary.
+
+        By default the values are exported by reference, so lists such as the ticket FQDNs are shared with the model.
+
+        :param copy: shallow copies lists, dictionaries and sets.
+        :param deep: deep copies every value.
+        :return: a dictionary of the non empty fields.
         """
 
-        output = {}
+        try:
+            output = self._export(self)
 
-        for key, value in self.__dict__.items():
-            if value is not None:
-                output[key] = value
+        # some field has never been set
+        except AttributeError:
+            output = {}
+
+            for key in self._fields:
+                value = getattr(self, key, None)
+
+                if value is not None and (key not in self._defaults or value != self._defaults[key]):
+                    output[key] = value
+
+        # subclasses not declaring __slots__ still store their attributes in a dictionary
+        if self._dynamic:
+            for key, value in self.__dict__.items():
+                if value is not None and not key.startswith('_'):
+                    output[key] = value
+
+        if deep:
+            from copy import deepcopy
+
+            return deepcopy(output)
+
+        if copy:
+            for key, value in output.items():
+                if isinstance(value, (list, dict, set)):
+                    output[key] = value.copy()
 
         return output
+
+    @staticmethod
+    def to_dicts(models: list, copy: bool = False, deep: bool = False) -> list:
+        """
+        Exports a collection of models into a list of dictionaries.
+
+        :param models: an iterable of models.
+        :param copy: shallow copies lists, dictionaries and sets.
+        :param deep: deep copies every value.
+        :return: a list of dictionaries.
+        """
+
+        return [model.to_dict(copy, deep) for model in models]
+
+class BaseModelRowNonValidException(Exception):
+
+    """
+    Row not matching the model fields.
+    """
+
+    pass
@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.dda.rule import DDARule
 
@@ -12,15 +12,19 @@ class DDAModel(BaseModel):
     DDA data modeling class.
     """
 
-    dda_id = None
+    __slots__ = (
+        'dda_id',
+        'description',
+        'instance',
+        'account_id',
+        'is_active'
+    )
 
-    description = None
-
-    instance = None
-
-    account_id = None
-
-    is_active = True
+    # not editable by a patch
+    _identifiers = (
+        'dda_id',
+        'account_id'
+    )
 
     def __init__(self, dda_id: str, description: str, instance: str, account_id: str, is_active: bool):
         """
@@ -51,12 +55,10 @@ class DDAModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, DDARule.DDA_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(DDARule.DDA_ID)
 
-        if not validator.is_valid():
-            raise DDAModelDDAIdException(validator.errors)
+        if not plan.is_valid(value):
+            raise DDAModelDDAIdException(plan.errors(value))
 
         return value
 
@@ -71,12 +73,10 @@ class DDAModel(BaseModel):
         if not value or not len(value):
             raise DDAModelDescriptionMissingException()
 
-        validator = Validator(value, DDARule.DESCRIPTION)
+        plan = RulePlan.compile(DDARule.DESCRIPTION)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise DDAModelDescriptionNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise DDAModelDescriptionNonValidException(plan.errors(value))
 
         return value
 
@@ -91,12 +91,10 @@ class DDAModel(BaseModel):
         if not value or not len(value):
             raise DDAModelInstanceMissingException()
 
-        validator = Validator(value, DDARule.INSTANCE)
-
-        validator.validate()
+        plan = RulePlan.compile(DDARule.INSTANCE)
 
-        if not validator.is_valid():
-            raise DDAModelInstanceNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise DDAModelInstanceNonValidException(plan.errors(value))
 
         return value
 
@@ -111,12 +109,10 @@ class DDAModel(BaseModel):
         if not value or not len(value):
             raise DDAModelAccountIdMissingException()
 
-        validator = Validator(value, AccountRule.ACCOUNT_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(AccountRule.ACCOUNT_ID)
 
-        if not validator.is_valid():
-            raise DDAModelAccountIdNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise DDAModelAccountIdNonValidException(plan.errors(value))
 
         return value
 
@@ -1 +1,19 @@
- 
+from piracyshield_data_model.lazy import lazy_exports
+
+# models are imported on first access, see lazy_exports
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'archive.model': ['ForensicArchiveModel'],
+    'archive.rule': ['ForensicArchiveRule'],
+    'format.model': ['ForensicFormatsModel'],
+    'format.inspector': ['ForensicFormatInspector'],
+    'hash.model': ['ForensicHashModel'],
+    'hash.rule': ['ForensicHashRule'],
+    'hash.registry': ['ForensicHashRegistry'],
+    'hash.verifier': ['ForensicHashVerifier'],
+    'status.model': ['ForensicArchiveStatusModel']
+}, (
+    'archive',
+    'format',
+    'hash',
+    'status'
+))
@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.forensic.status.model import ForensicArchiveStatusModel
 
@@ -15,11 +15,16 @@ class ForensicArchiveModel(BaseModel):
     This class refers to the physical forensic evidence archive.
     """
 
-    ticket_id = None
+    __slots__ = (
+        'ticket_id',
+        'name',
+        'status'
+    )
 
-    name = None
-
-    status = None
+    # not editable by a patch
+    _identifiers = (
+        'ticket_id',
+    )
 
     def __init__(self, ticket_id: str, name: str):
         """
@@ -43,12 +48,10 @@ class ForensicArchiveModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketRule.TICKET_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketRule.TICKET_ID)
 
-        if not validator.is_valid():
-            raise ForensicModelForensicIDException(validator.errors)
+        if not plan.is_valid(value):
+            raise ForensicModelForensicIDException(plan.errors(value))
 
         return value
 
@@ -60,12 +63,10 @@ class ForensicArchiveModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, ForensicArchiveRule.NAME)
-
-        validator.validate()
+        plan = RulePlan.compile(ForensicArchiveRule.NAME)
 
-        if not validator.is_valid():
-            raise ForensicArchiveModelNameException(validator.errors)
+        if not plan.is_valid(value):
+            raise ForensicArchiveModelNameException(plan.errors(value))
 
         return value
 
@@ -0,0 +1,454 @@
+import mmap
+import os
+import struct
+
+from piracyshield_data_model.forensic.format.model import ForensicFormatsModel
+
+class ForensicFormatInspector:
+
+    """
+    Reads the structure of a ZIP or RAR archive without extracting it.
+
+    The file is memory mapped and only the ZIP central directory or the RAR block headers
+    are parsed, so the cost depends on the number of entries and not on the archive size.
+    """
+
+    ZIP_LOCAL_MAGIC = b'PK\x03\x04'
+
+    ZIP_EMPTY_MAGIC = b'PK\x05\x06'
+
+    RAR4_MAGIC = b'Rar!\x1a\x07\x00'
+
+    RAR5_MAGIC = b'Rar!\x1a\x07\x01\x00'
+
+    # end of central directory record
+    ZIP_EOCD = struct.Struct('<4s4H2LH')
+
+    # the record is searched backwards, past the longest archive comment
+    ZIP_EOCD_SEARCH = 22 + 0xffff
+
+    ZIP64_LOCATOR = struct.Struct('<4sLQL')
+
+    ZIP64_EOCD = struct.Struct('<4sQ2H2L4Q')
+
+    ZIP_ENTRY = struct.Struct('<4s6H3L5H2L')
+
+    RAR4_BLOCK = struct.Struct('<HBHH')
+
+    RAR4_FILE = struct.Struct('<LLBLLBBHL')
+
+    def __init__(self, max_entries: int = None, max_uncompressed_size: int = None, max_ratio: float = None):
+        """
+        Registers the optional admission limits.
+
+        :param max_entries: maximum number of entries.
+        :param max_uncompressed_size: maximum total size once extracted, in bytes.
+        :param max_ratio: maximum compression ratio, to reject decompression bombs.
+        """
+
+        self.max_entries = max_entries
+
+        self.max_uncompressed_size = max_uncompressed_size
+
+        self.max_ratio = max_ratio
+
+    def inspect(self, path: str, archive_format: str = None) -> dict | Exception:
+        """
+        Reports the structure of an archive.
+
+        :param path: path of the archive.
+        :param archive_format: the expected format, zip or rar, otherwise detected from the magic bytes.
+        :return: a dictionary with format, entries, compressed_size, uncompressed_size, ratio and encrypted.
+        """
+
+        try:
+            with open(path, 'rb') as handle:
+                # empty files cannot be mapped
+                if not os.fstat(handle.fileno()).st_size:
+                    raise ForensicFormatInspectorMagicException()
+
+                with mmap.mmap(handle.fileno(), 0, access = mmap.ACCESS_READ) as mapped:
+                    detected = self.detect(mapped)
+
+                    if detected is None or (archive_format is not None and archive_format.lower() != detected):
+                        raise ForensicFormatInspectorMagicException()
+
+                    try:
+                        if detected == ForensicFormatsModel.ZIP:
+                            report = self._inspect_zip(mapped)
+
+                        else:
+                            report = self._inspect_rar(mapped)
+
+                    except (struct.error, IndexError):
+                        raise ForensicFormatInspectorNonValidException()
+
+        except FileNotFoundError:
+            raise ForensicFormatInspectorArchiveMissingException()
+
+        report['ratio'] = report['uncompressed_size'] / report['compressed_size'] if report['compressed_size'] else None
+
+        self._check_limits(report)
+
+        return report
+
+    def detect(self, data: bytes) -> str | None:
+        """
+        Detects the archive format from the leading magic bytes.
+
+        :param data: the archive content, or at least its first 8 bytes.
+        :return: zip, rar or None if unknown.
+        """
+
+        head = data[:8]
+
+        if head.startswith(self.ZIP_LOCAL_MAGIC) or head.startswith(self.ZIP_EMPTY_MAGIC):
+            return ForensicFormatsModel.ZIP
+
+        if head.startswith(self.RAR4_MAGIC) or head.startswith(self.RAR5_MAGIC):
+            return ForensicFormatsModel.RAR
+
+        return None
+
+    def _inspect_zip(self, mapped: mmap.mmap) -> dict:
+        """
+        Walks the central directory of a ZIP archive.
+        """
+
+        eocd = mapped.rfind(b'PK\x05\x06', max(0, len(mapped) - self.ZIP_EOCD_SEARCH))
+
+        if eocd < 0:
+            raise ForensicFormatInspectorNonValidException()
+
+        signature, disk, cd_disk, disk_entries, entries, cd_size, cd_offset, comment_size = self.ZIP_EOCD.unpack_from(mapped, eocd)
+
+        if entries == 0xffff or cd_size == 0xffffffff or cd_offset == 0xffffffff:
+            locator = eocd - self.ZIP64_LOCATOR.size
+
+            signature, disk, zip64_offset, disks = self.ZIP64_LOCATOR.unpack_from(mapped, locator)
+
+            if signature != b'PK\x06\x07':
+                raise ForensicFormatInspectorNonValidException()
+
+            fields = self.ZIP64_EOCD.unpack_from(mapped, zip64_offset)
+
+            if fields[0] != b'PK\x06\x06':
+                raise ForensicFormatInspectorNonValidException()
+
+            entries, cd_size, cd_offset = fields[7], fields[8], fields[9]
+
+        report = self._report(ForensicFormatsModel.ZIP)
+
+        position = cd_offset
+
+        for _ in range(entries):
+            fields = self.ZIP_ENTRY.unpack_from(mapped, position)
+
+            if fields[0] != b'PK\x01\x02':
+                raise ForensicFormatInspectorNonValidException()
+
+            flags, compressed_size, uncompressed_size = fields[3], fields[8], fields[9]
+
+            name_size, extra_size, comment_size = fields[10], fields[11], fields[12]
+
+            extra = position + self.ZIP_ENTRY.size + name_size
+
+            if compressed_size == 0xffffffff or uncompressed_size == 0xffffffff:
+                uncompressed_size, compressed_size = self._zip64_sizes(mapped, extra, extra + extra_size, uncompressed_size, compressed_size)
+
+            report['entries'] += 1
+
+            report['compressed_size'] += compressed_size
+
+            report['uncompressed_size'] += uncompressed_size
+
+            if flags & 0x1:
+                report['encrypted'] = True
+
+            position = extra + extra_size + comment_size
+
+        return report
+
+    def _zip64_sizes(self, mapped: mmap.mmap, start: int, stop: int, uncompressed_size: int, compressed_size: int) -> tuple:
+        """
+        Reads the 64 bit sizes from the extra field of a central directory entry.
+        """
+
+        position = start
+
+        while position + 4 <= stop:
+            tag, size = struct.unpack_from('<2H', mapped, position)
+
+            if tag == 0x0001:
+                field = position + 4
+
+                # only the overflowed values are present, in this order
+                if uncompressed_size == 0xffffffff:
+                    uncompressed_size, = struct.unpack_from('<Q', mapped, field)
+
+                    field += 8
+
+                if compressed_size == 0xffffffff:
+                    compressed_size, = struct.unpack_from('<Q', mapped, field)
+
+                return uncompressed_size, compressed_size
+
+            position += 4 + size
+
+        raise ForensicFormatInspectorNonValidException()
+
+    def _inspect_rar(self, mapped: mmap.mmap) -> dict:
+        """
+        Walks the block headers of a RAR archive.
+        """
+
+        report = self._report(ForensicFormatsModel.RAR)
+
+        if mapped[:8] == self.RAR5_MAGIC:
+            self._walk_rar5(mapped, len(self.RAR5_MAGIC), report)
+
+        else:
+            self._walk_rar4(mapped, len(self.RAR4_MAGIC), report)
+
+        return report
+
+    def _walk_rar4(self, mapped: mmap.mmap, position: int, report: dict) -> None:
+        """
+        Reads the RAR 1.5 to 4.x block headers.
+        """
+
+        end = len(mapped)
+
+        while position + self.RAR4_BLOCK.size <= end:
+            crc, block_type, flags, header_size = self.RAR4_BLOCK.unpack_from(mapped, position)
+
+            if header_size < self.RAR4_BLOCK.size:
+                raise ForensicFormatInspectorNonValidException()
+
+            data_size = 0
+
+            # file block
+            if block_type == 0x74:
+                fields = self.RAR4_FILE.unpack_from(mapped, position + self.RAR4_BLOCK.size)
+
+                compressed_size, uncompressed_size = fields[0], fields[1]
+
+                # large file, with the high 32 bits after the attributes
+                if flags & 0x100:
+                    high_compressed, high_uncompressed = struct.unpack_from('<2L', mapped, position + self.RAR4_BLOCK.size + self.RAR4_FILE.size)
+
+                    compressed_size |= high_compressed << 32
+
+                    uncompressed_size |= high_uncompressed << 32
+
+                data_size = compressed_size
+
+                report['entries'] += 1
+
+                report['compressed_size'] += compressed_size
+
+                report['uncompressed_size'] += uncompressed_size
+
+                if flags & 0x4:
+                    report['encrypted'] = True
+
+            elif flags & 0x8000:
+                data_size, = struct.unpack_from('<L', mapped, position + self.RAR4_BLOCK.size)
+
+            # archive header with encrypted headers
+            if block_type == 0x73 and flags & 0x80:
+                report['encrypted'] = True
+
+                return
+
+            # end of archive
+            if block_type == 0x7b:
+                return
+
+            position += header_size + data_size
+
+        # truncated before the end of archive block
+        raise ForensicFormatInspectorNonValidException()
+
+    def _walk_rar5(self, mapped: mmap.mmap, position: int, report: dict) -> None:
+        """
+        Reads the RAR 5.0 block headers.
+        """
+
+        end = len(mapped)
+
+        while position + 4 < end:
+            # skip the header CRC32
+            header_size, start = self._vint(mapped, position + 4)
+
+            header_end = start + header_size
+
+            if header_end > end:
+                raise ForensicFormatInspectorNonValidException()
+
+            block_type, field = self._vint(mapped, start)
+
+            flags, field = self._vint(mapped, field)
+
+            extra_size = 0
+
+            if flags & 0x1:
+                extra_size, field = self._vint(mapped, field)
+
+            data_size = 0
+
+            if flags & 0x2:
+                data_size, field = self._vint(mapped, field)
+
+            # file block
+            if block_type == 2:
+                file_flags, field = self._vint(mapped, field)
+
+                uncompressed_size, field = self._vint(mapped, field)
+
+                report['entries'] += 1
+
+                report['compressed_size'] += data_size
+
+                # unknown when flagged
+                if not file_flags & 0x8:
+                    report['uncompressed_size'] += uncompressed_size
+
+                # the extra area closes the header
+                if self._rar5_encrypted(mapped, header_end - extra_size, header_end):
+                    report['encrypted'] = True
+
+            # archive encryption header, nothing else can be read
+            elif block_type == 4:
+                report['encrypted'] = True
+
+                return
+
+            # end of archive
+            elif block_type == 5:
+                return
+
+            position = header_end + data_size
+
+        # truncated before the end of archive header
+        raise ForensicFormatInspectorNonValidException()
+
+    def _rar5_encrypted(self, mapped: mmap.mmap, position: int, stop: int) -> bool:
+        """
+        Looks for a file encryption record in the extra area of a RAR 5.0 file header.
+        """
+
+        while position < stop:
+            record_size, field = self._vint(mapped, position)
+
+            record_type, _ = self._vint(mapped, field)
+
+            # file encryption record
+            if record_type == 0x01:
+                return True
+
+            position = field + record_size
+
+        return False
+
+    def _vint(self, mapped: mmap.mmap, position: int) -> tuple:
+        """
+        Decodes a RAR 5.0 variable length integer.
+
+        :return: the value and the position after it.
+        """
+
+        value = 0
+
+        shift = 0
+
+        while True:
+            byte = mapped[position]
+
+            value |= (byte & 0x7f) << shift
+
+            position += 1
+
+            if not byte & 0x80:
+                return value, position
+
+            shift += 7
+
+            if shift > 63:
+                raise ForensicFormatInspectorNonValidException()
+
+    def _report(self, archive_format: str) -> dict:
+        """
+        Creates an empty report.
+        """
+
+        return {
+            'format': archive_format,
+            'entries': 0,
+            'compressed_size': 0,
+            'uncompressed_size': 0,
+            'ratio': None,
+            'encrypted': False
+        }
+
+    def _check_limits(self, report: dict) -> None | Exception:
+        """
+        Rejects the archives exceeding the admission limits.
+        """
+
+        if self.max_entries is not None and report['entries'] > self.max_entries:
+            raise ForensicFormatInspectorEntriesException()
+
+        if self.max_uncompressed_size is not None and report['uncompressed_size'] > self.max_uncompressed_size:
+            raise ForensicFormatInspectorSizeException()
+
+        if self.max_ratio is not None and report['ratio'] is not None and report['ratio'] > self.max_ratio:
+            raise ForensicFormatInspectorRatioException()
+
+class ForensicFormatInspectorArchiveMissingException(Exception):
+
+    """
+    Archive file not found.
+    """
+
+    pass
+
+class ForensicFormatInspectorMagicException(Exception):
+
+    """
+    Non supported or mismatched archive format.
+    """
+
+    pass
+
+class ForensicFormatInspectorNonValidException(Exception):
+
+    """
+    Corrupted or truncated archive structure.
+    """
+
+    pass
+
+class ForensicFormatInspectorEntriesException(Exception):
+
+    """
+    Too many archive entries.
+    """
+
+    pass
+
+class ForensicFormatInspectorSizeException(Exception):
+
+    """
+    Archive too large once extracted.
+    """
+
+    pass
+
+class ForensicFormatInspectorRatioException(Exception):
+
+    """
+    Compression ratio too high.
+    """
+
+    pass
@@ -9,5 +9,11 @@ class ForensicFormatsModel:
 
     RAR = 'rar'
 
+    # names of the formats above, listed once instead of scanning the class
+    FORMATS = (
+        'RAR',
+        'ZIP'
+    )
+
     def get_formats(self):
-        return [attr for attr in dir(self) if attr.isupper()]
+        return list(self.FORMATS)
@@ -1,10 +1,10 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.forensic.status.model import ForensicArchiveStatusModel
 
-from piracyshield_data_model.forensic.hash.rule import ForensicHashRule
+from piracyshield_data_model.forensic.hash.registry import ForensicHashRegistry
 
 class ForensicHashModel(BaseModel):
 
@@ -14,11 +14,11 @@ class ForensicHashModel(BaseModel):
     This is an extension to validate forensic evidences hashes.
     """
 
-    hash_string = None
-
-    hash_type = None
-
-    status = None
+    __slots__ = (
+        'hash_string',
+        'hash_type',
+        'status'
+    )
 
     def __init__(self, hash_string: str, hash_type: str):
         """
@@ -42,12 +42,9 @@ class ForensicHashModel(BaseModel):
         :return: the same value.
         """
 
-        # dirty hack to get the list of rules
-        hash_types = ForensicHashRule().get_hash_types()
-
         hash_type = hash_type.upper()
 
-        if hash_type not in hash_types:
+        if hash_type not in ForensicHashRegistry.TYPES:
             raise ForensicHashModelNotSupportedException()
 
         return hash_type
@@ -62,14 +59,14 @@ class ForensicHashModel(BaseModel):
         """
 
         if not len(hash_string):
-            raise ForensicHashModelHashMissingException()
+            raise ForensicHashModelStringMissingException()
 
-        validator = Validator(hash_string, getattr(ForensicHashRule, hash_type))
+        rules, length, constructor = ForensicHashRegistry.TYPES[hash_type]
 
-        validator.validate()
+        plan = RulePlan.compile(rules)
 
-        if not validator.is_valid():
-            raise ForensicHashModelNonValidException(validator.errors)
+        if not plan.is_valid(hash_string):
+            raise ForensicHashModelNonValidException(plan.errors(hash_string))
 
         return hash_string
 
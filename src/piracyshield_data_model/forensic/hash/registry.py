@@ -0,0 +1,102 @@
+import hashlib
+
+from piracyshield_data_model.forensic.hash.rule import ForensicHashRule
+
+class ForensicHashRegistry:
+
+    """
+    Supported hash types, built once at import time.
+
+    Each type maps to its (rules, digest length, hashlib constructor), the digest length being
+    the number of hexadecimal characters of the hash string.
+    """
+
+    TYPES = {
+        hash_type: (
+            getattr(ForensicHashRule, hash_type),
+            constructor().digest_size * 2,
+            constructor
+        )
+        for hash_type, constructor in (
+            ('SHA256', hashlib.sha256),
+            ('SHA384', hashlib.sha384),
+            ('SHA512', hashlib.sha512),
+            ('BLAKE2B', hashlib.blake2b),
+            ('BLAKE2S', hashlib.blake2s)
+        )
+    }
+
+    # candidate hash types by digest length
+    LENGTHS = {}
+
+    for hash_type, (rules, length, constructor) in TYPES.items():
+        LENGTHS.setdefault(length, []).append(hash_type)
+
+    del hash_type, rules, length, constructor
+
+    @classmethod
+    def get(cls, hash_type: str) -> tuple | None:
+        """
+        Looks up a hash type.
+
+        :param hash_type: the hash type, in any case.
+        :return: the (rules, digest length, hashlib constructor) tuple or None if not supported.
+        """
+
+        return cls.TYPES.get(hash_type.upper())
+
+    @classmethod
+    def is_supported(cls, hash_type: str) -> bool:
+        """
+        Checks whether a hash type is supported.
+
+        :param hash_type: the hash type, in any case.
+        :return: true if supported.
+        """
+
+        return hash_type.upper() in cls.TYPES
+
+    @classmethod
+    def types(cls) -> list:
+        """
+        Lists the supported hash types.
+
+        :return: a list of hash type names.
+        """
+
+        return list(cls.TYPES)
+
+    @classmethod
+    def new(cls, hash_type: str) -> any:
+        """
+        Creates a hashlib object of the given type, such as to verify an archive.
+
+        :param hash_type: a supported hash type.
+        :return: a new hash object.
+        """
+
+        entry = cls.get(hash_type)
+
+        if entry is None:
+            raise ForensicHashRegistryNotSupportedException()
+
+        return entry[2]()
+
+    @classmethod
+    def detect(cls, hash_string: str) -> list:
+        """
+        Guesses the candidate hash types of a hash string from its length.
+
+        :param hash_string: a hexadecimal hash string.
+        :return: a list of hash type names, empty if none matches.
+        """
+
+        return list(cls.LENGTHS.get(len(hash_string), ()))
+
+class ForensicHashRegistryNotSupportedException(Exception):
+
+    """
+    Non supported hash type.
+    """
+
+    pass
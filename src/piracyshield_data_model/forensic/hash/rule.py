@@ -35,7 +35,7 @@ class ForensicHashRule:
     BLAKE2S = [
         Required(),
         String(),
-        Length(minimum = 128, maximum = 128)    # accept only default digest size
+        Length(minimum = 64, maximum = 64)    # accept only default digest size
     ]
 
     def get_hash_types(self):
@@ -0,0 +1,264 @@
+import hmac
+import mmap
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+from piracyshield_data_model.forensic.status.model import ForensicArchiveStatusModel
+
+from piracyshield_data_model.forensic.hash.model import ForensicHashModel
+from piracyshield_data_model.forensic.hash.registry import ForensicHashRegistry
+
+class ForensicHashVerifier:
+
+    """
+    Checks a forensic archive against its declared hashes.
+
+    Archives can be several gigabytes, so the file is streamed through the hash in fixed size
+    chunks (or memory mapped) and never loaded into memory as a whole.
+    """
+
+    # 8 MiB, large enough to amortize the system calls
+    CHUNK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, use_mmap: bool = False):
+        """
+        Registers the settings.
+
+        :param chunk_size: number of bytes hashed at each step.
+        :param use_mmap: map the file in memory instead of reading it into a buffer.
+        """
+
+        if chunk_size < 1:
+            raise ForensicHashVerifierChunkSizeException()
+
+        self.chunk_size = chunk_size
+
+        self.use_mmap = use_mmap
+
+    def digest(self, path: str, hash_type: str) -> str | Exception:
+        """
+        Hashes a file.
+
+        :param path: path of the archive.
+        :param hash_type: a supported hash type.
+        :return: the hexadecimal digest.
+        """
+
+        return self.digests(path, [hash_type])[hash_type.upper()]
+
+    def digests(self, path: str, hash_types: list, threaded: bool = False) -> dict | Exception:
+        """
+        Hashes a file with many algorithms in a single read.
+
+        Every algorithm is fed from the same buffer; with threaded, the algorithms run in parallel
+        threads, as hashlib releases the GIL on large updates.
+
+        :param path: path of the archive.
+        :param hash_types: a list of supported hash types.
+        :param threaded: hash each algorithm in its own thread.
+        :return: a dictionary of hexadecimal digests by hash type.
+        """
+
+        # reading the whole archive for no hash would check nothing
+        if not hash_types:
+            raise ForensicHashVerifierHashMissingException()
+
+        hashers = {}
+
+        for hash_type in hash_types:
+            hashers[hash_type.upper()] = ForensicHashRegistry.new(hash_type)
+
+        executor = ThreadPoolExecutor(max_workers = len(hashers)) if threaded and len(hashers) > 1 else None
+
+        try:
+            with open(path, 'rb') as handle:
+                if self.use_mmap:
+                    self._update_mmap(list(hashers.values()), handle, executor)
+
+                else:
+                    self._update_buffer(list(hashers.values()), handle, executor)
+
+        except FileNotFoundError:
+            raise ForensicHashVerifierArchiveMissingException()
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return {hash_type: hasher.hexdigest() for hash_type, hasher in hashers.items()}
+
+    def hash_models(self, path: str, hash_types: list, threaded: bool = False) -> list | Exception:
+        """
+        Computes the hashes of an archive in a single read.
+
+        :param path: path of the archive.
+        :param hash_types: a list of supported hash types.
+        :param threaded: hash each algorithm in its own thread.
+        :return: a list of forensic hash models, one per hash type.
+        """
+
+        return [ForensicHashModel(digest, hash_type) for hash_type, digest in self.digests(path, hash_types, threaded).items()]
+
+    def _update_buffer(self, hashers: list, handle: any, executor: ThreadPoolExecutor = None) -> None:
+        """
+        Feeds the hashes through reused buffers.
+
+        In a pool, the next chunk is read into a second buffer while the current one is hashed.
+        """
+
+        buffers = [bytearray(self.chunk_size)]
+
+        if executor is not None:
+            buffers.append(bytearray(self.chunk_size))
+
+        pending = []
+
+        turn = 0
+
+        while True:
+            buffer = buffers[turn]
+
+            size = handle.readinto(buffer)
+
+            # each hash must see the chunks in order
+            for future in pending:
+                future.result()
+
+            if not size:
+                break
+
+            view = memoryview(buffer)[:size]
+
+            if executor is None:
+                for hasher in hashers:
+                    hasher.update(view)
+
+            else:
+                pending = [executor.submit(hasher.update, view) for hasher in hashers]
+
+            turn = (turn + 1) % len(buffers)
+
+    def _update_mmap(self, hashers: list, handle: any, executor: ThreadPoolExecutor = None) -> None:
+        """
+        Feeds the hashes with slices of the memory mapped file.
+
+        In a pool, each hash walks the whole mapping on its own.
+        """
+
+        # empty files cannot be mapped
+        if not os.fstat(handle.fileno()).st_size:
+            return
+
+        with mmap.mmap(handle.fileno(), 0, access = mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+
+            try:
+                if executor is None:
+                    for offset in range(0, len(view), self.chunk_size):
+                        chunk = view[offset:offset + self.chunk_size]
+
+                        for hasher in hashers:
+                            hasher.update(chunk)
+
+                        chunk.release()
+
+                else:
+                    for future in [executor.submit(self._walk, hasher, view) for hasher in hashers]:
+                        future.result()
+
+            finally:
+                view.release()
+
+    def _walk(self, hasher: any, view: memoryview) -> None:
+        """
+        Feeds a single hash with the whole view, chunk by chunk.
+        """
+
+        for offset in range(0, len(view), self.chunk_size):
+            with view[offset:offset + self.chunk_size] as chunk:
+                hasher.update(chunk)
+
+    def verify_many(self, hash_models: list, path: str, threaded: bool = False) -> bool | Exception:
+        """
+        Compares the archive with many pending hashes in a single read.
+
+        :param hash_models: a non empty list of forensic hash models in the pending status.
+        :param path: path of the archive.
+        :param threaded: hash each algorithm in its own thread.
+        :return: true if the archive matches every hash.
+        """
+
+        # an archive is never verified by an empty list
+        if not hash_models:
+            raise ForensicHashVerifierHashMissingException()
+
+        for hash_model in hash_models:
+            if hash_model.status != ForensicArchiveStatusModel.PENDING.value:
+                raise ForensicHashVerifierStatusException()
+
+        digests = self.digests(path, [hash_model.hash_type for hash_model in hash_models], threaded)
+
+        is_valid = True
+
+        for hash_model in hash_models:
+            is_valid = self._judge(hash_model, digests[hash_model.hash_type]) and is_valid
+
+        return is_valid
+
+    def verify(self, hash_model: any, path: str) -> bool | Exception:
+        """
+        Compares the archive with a pending hash, moving it to the approved or rejected status.
+
+        :param hash_model: a forensic hash model in the pending status.
+        :param path: path of the archive.
+        :return: true if the archive matches the hash.
+        """
+
+        if hash_model.status != ForensicArchiveStatusModel.PENDING.value:
+            raise ForensicHashVerifierStatusException()
+
+        return self._judge(hash_model, self.digest(path, hash_model.hash_type))
+
+    def _judge(self, hash_model: any, digest: str) -> bool:
+        """
+        Moves a hash to the approved or rejected status.
+        """
+
+        is_valid = hmac.compare_digest(digest.encode(), hash_model.hash_string.lower().encode())
+
+        hash_model.status = ForensicArchiveStatusModel.APPROVED.value if is_valid else ForensicArchiveStatusModel.REJECTED.value
+
+        return is_valid
+
+class ForensicHashVerifierChunkSizeException(Exception):
+
+    """
+    Non valid chunk size.
+    """
+
+    pass
+
+class ForensicHashVerifierHashMissingException(Exception):
+
+    """
+    No hash to verify.
+    """
+
+    pass
+
+class ForensicHashVerifierArchiveMissingException(Exception):
+
+    """
+    Archive file not found.
+    """
+
+    pass
+
+class ForensicHashVerifierStatusException(Exception):
+
+    """
+    Hash already verified.
+    """
+
+    pass
@@ -1 +1,8 @@
- 
+from piracyshield_data_model.lazy import lazy_exports
+
+# models are imported on first access, see lazy_exports
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'model': ['GuestModel']
+}, (
+    'model',
+))
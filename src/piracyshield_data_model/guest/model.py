@@ -9,11 +9,11 @@ class GuestModel(AccountModel):
     Currently not fully implemented.
     """
 
-    role = AccountRoleModel.GUEST
+    __slots__ = ()
 
     def __init__(self, account_id: str, name: str, email: str, password: str, confirm_password: str, is_active: bool):
         """
         Extends the functionality from a general account.
         """
 
-        super().__init__(account_id, name, email, password, confirm_password, self.role, is_active)
+        super().__init__(account_id, name, email, password, confirm_password, AccountRoleModel.GUEST, is_active)
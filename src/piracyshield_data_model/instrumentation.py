@@ -0,0 +1,398 @@
+from bisect import bisect_left
+from threading import Lock, local
+from time import perf_counter
+
+import functools
+import importlib
+import inspect
+
+from piracyshield_data_model.base import BaseModel
+
+from piracyshield_data_model.plan import RuleCache, RulePlan
+
+class Instrumentation:
+
+    """
+    Opt-in timing and counters of the model validation.
+
+    Once enabled, every _validate_* method of the models is wrapped and every rule evaluated by
+    a RulePlan is timed, keyed by (model, field) and (model, field, rule). When disabled the
+    original methods are restored, so the validation runs without any overhead.
+
+    A value found in the RuleCache skips its rules, so the rule metrics only count the actual
+    evaluations while the cache hits are counted apart, keyed by (model, field).
+    """
+
+    # histogram upper bounds, in seconds
+    BUCKETS = (0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, float('inf'))
+
+    # metric name prefix
+    PREFIX = 'piracyshield_validation'
+
+    # validators outside BaseModel, as module, class and the field reported for each method besides the _validate_* ones
+    VALIDATORS = (
+        ('piracyshield_data_model.ticket.item.report.model', 'TicketItemReportModel', {}),
+        ('piracyshield_data_model.ticket.item.batch.model', 'TicketItemBatchModel', {'from_ticket': 'provider_id', 'assign_identifiers': 'ticket_item_id'}),
+        ('piracyshield_data_model.ticket.item.genre.classifier', 'TicketItemGenreClassifier', {'classify': 'value'})
+    )
+
+    # cross-field checks, not a field of their own
+    EXCLUDED = ('_validate_patch',)
+
+    enabled = False
+
+    # (model, field) and (model, field, rule) -> [calls, failures, seconds, bucket counts]
+    _fields = {}
+
+    _rules = {}
+
+    # (model, field) -> rule cache hits
+    _hits = {}
+
+    # wrapped methods, to be restored
+    _originals = []
+
+    _evaluate = None
+
+    _contains = None
+
+    _lock = Lock()
+
+    # model and field being validated by the current thread
+    _context = local()
+
+    @classmethod
+    def enable(cls, models: list = None) -> None:
+        """
+        Wraps the validation methods and the rule evaluation.
+
+        :param models: the model classes to instrument, defaults to every BaseModel subclass, including the ones
+                       imported later, and the other validators.
+        """
+
+        if cls.enabled:
+            return
+
+        if models is None:
+            models = cls._subclasses(BaseModel) + [
+                getattr(importlib.import_module(module), name) for module, name, methods in cls.VALIDATORS
+            ]
+
+            BaseModel._class_hooks.append(cls._instrument)
+
+        for model in models:
+            cls._instrument(model)
+
+        cls._evaluate = RulePlan._evaluate
+
+        RulePlan._evaluate = cls._wrap_rules(RulePlan._evaluate)
+
+        cls._contains = RuleCache.contains
+
+        RuleCache.contains = cls._wrap_cache(RuleCache.contains)
+
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Restores the original methods, keeping the collected metrics.
+        """
+
+        if not cls.enabled:
+            return
+
+        if cls._instrument in BaseModel._class_hooks:
+            BaseModel._class_hooks.remove(cls._instrument)
+
+        for model, name, method in cls._originals:
+            setattr(model, name, method)
+
+        cls._originals = []
+
+        RulePlan._evaluate = cls._evaluate
+
+        RuleCache.contains = cls._contains
+
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forgets the collected metrics.
+        """
+
+        with cls._lock:
+            cls._fields = {}
+
+            cls._rules = {}
+
+            cls._hits = {}
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """
+        Copies the collected metrics.
+
+        :return: a dictionary with the fields and rules metrics, each a dictionary of calls, failures, seconds and buckets by key,
+                 and the rule cache hits by key.
+        """
+
+        with cls._lock:
+            return {
+                'fields': {key: cls._export(metric) for key, metric in cls._fields.items()},
+                'rules': {key: cls._export(metric) for key, metric in cls._rules.items()},
+                'cache_hits': dict(cls._hits)
+            }
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        """
+        Renders the collected metrics in the Prometheus text exposition format.
+
+        :return: the metrics text.
+        """
+
+        snapshot = cls.snapshot()
+
+        lines = []
+
+        for family, labels, metrics in (
+            ('field', ('model', 'field'), snapshot['fields']),
+            ('rule', ('model', 'field', 'rule'), snapshot['rules'])
+        ):
+            name = f'{cls.PREFIX}_{family}'
+
+            lines.append(f'# HELP {name}_calls_total Number of {family} validations.')
+            lines.append(f'# TYPE {name}_calls_total counter')
+
+            for key, metric in metrics.items():
+                lines.append(f'{name}_calls_total{{{cls._labels(labels, key)}}} {metric["calls"]}')
+
+            lines.append(f'# HELP {name}_failures_total Number of failed {family} validations.')
+            lines.append(f'# TYPE {name}_failures_total counter')
+
+            for key, metric in metrics.items():
+                lines.append(f'{name}_failures_total{{{cls._labels(labels, key)}}} {metric["failures"]}')
+
+            lines.append(f'# HELP {name}_seconds Latency of the {family} validations.')
+            lines.append(f'# TYPE {name}_seconds histogram')
+
+            for key, metric in metrics.items():
+                label = cls._labels(labels, key)
+
+                cumulative = 0
+
+                for bound, count in zip(cls.BUCKETS, metric['buckets']):
+                    cumulative += count
+
+                    lines.append(f'{name}_seconds_bucket{{{label},le="{"+Inf" if bound == float("inf") else repr(bound)}"}} {cumulative}')
+
+                lines.append(f'{name}_seconds_sum{{{label}}} {metric["seconds"]!r}')
+                lines.append(f'{name}_seconds_count{{{label}}} {metric["calls"]}')
+
+        name = f'{cls.PREFIX}_cache_hits_total'
+
+        lines.append(f'# HELP {name} Number of values found in the rule cache, whose rules were not evaluated.')
+        lines.append(f'# TYPE {name} counter')
+
+        for key, hits in snapshot['cache_hits'].items():
+            lines.append(f'{name}{{{cls._labels(("model", "field"), key)}}} {hits}')
+
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def _instrument(cls, model: type) -> None:
+        """
+        Wraps the validation methods defined by a class.
+        """
+
+        methods = {}
+
+        for module, name, extra in cls.VALIDATORS:
+            if model.__module__ == module and model.__name__ == name:
+                methods = extra
+
+        for name, method in list(vars(model).items()):
+            if name in methods:
+                field = methods[name]
+
+            elif name.startswith('_validate_') and name not in cls.EXCLUDED:
+                field = name[len('_validate_'):]
+
+            else:
+                continue
+
+            if isinstance(method, classmethod):
+                wrapped = classmethod(cls._wrap_field(field, method.__func__))
+
+            elif inspect.isfunction(method):
+                wrapped = cls._wrap_field(field, method)
+
+            else:
+                continue
+
+            cls._originals.append((model, name, method))
+
+            setattr(model, name, wrapped)
+
+    @classmethod
+    def _wrap_field(cls, field: str, method: callable) -> callable:
+        """
+        Times a validation method and sets the context of the rules it evaluates.
+        """
+
+        context = cls._context
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # the class itself for class methods
+            model = self.__name__ if isinstance(self, type) else type(self).__name__
+
+            previous = getattr(context, 'key', None)
+
+            context.key = (model, field)
+
+            failed = False
+
+            start = perf_counter()
+
+            try:
+                return method(self, *args, **kwargs)
+
+            except Exception:
+                failed = True
+
+                raise
+
+            finally:
+                elapsed = perf_counter() - start
+
+                context.key = previous
+
+                cls._record(cls._fields, (model, field), elapsed, failed)
+
+        return wrapper
+
+    @classmethod
+    def _wrap_rules(cls, evaluate: callable) -> callable:
+        """
+        Replaces RulePlan._evaluate with a version timing each rule.
+        """
+
+        context = cls._context
+
+        @functools.wraps(evaluate)
+        def wrapper(plan, value):
+            model, field = getattr(context, 'key', None) or ('', '')
+
+            for rule in plan._steps:
+                start = perf_counter()
+
+                rule(value)
+
+                elapsed = perf_counter() - start
+
+                failed = bool(rule.errors)
+
+                cls._record(cls._rules, (model, field, type(rule).__name__), elapsed, failed)
+
+                if failed:
+                    rule.errors = []
+
+                    return False
+
+            return True
+
+        return wrapper
+
+    @classmethod
+    def _wrap_cache(cls, contains: callable) -> callable:
+        """
+        Replaces RuleCache.contains with a version counting the hits.
+        """
+
+        context = cls._context
+
+        @functools.wraps(contains)
+        def wrapper(cache, key):
+            found = contains(cache, key)
+
+            if found:
+                key = getattr(context, 'key', None) or ('', '')
+
+                with cls._lock:
+                    cls._hits[key] = cls._hits.get(key, 0) + 1
+
+            return found
+
+        return wrapper
+
+    @classmethod
+    def _record(cls, metrics: dict, key: tuple, elapsed: float, failed: bool) -> None:
+        """
+        Updates the metric of a key.
+        """
+
+        with cls._lock:
+            metric = metrics.get(key)
+
+            if metric is None:
+                metric = metrics[key] = [0, 0, 0.0, [0] * len(cls.BUCKETS)]
+
+            metric[0] += 1
+
+            if failed:
+                metric[1] += 1
+
+            metric[2] += elapsed
+
+            metric[3][bisect_left(cls.BUCKETS, elapsed)] += 1
+
+    @staticmethod
+    def _export(metric: list) -> dict:
+        """
+        Converts a metric into a dictionary.
+        """
+
+        return {
+            'calls': metric[0],
+            'failures': metric[1],
+            'seconds': metric[2],
+            'buckets': list(metric[3])
+        }
+
+    @staticmethod
+    def _labels(names: tuple, values: tuple) -> str:
+        """
+        Formats a label set, escaping the values.
+        """
+
+        output = []
+
+        for name, value in zip(names, values):
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+            output.append(f'{name}="{value}"')
+
+        return ','.join(output)
+
+    @staticmethod
+    def _subclasses(model: type) -> list:
+        """
+        Collects the loaded subclasses of a model, recursively.
+        """
+
+        output = []
+
+        pending = list(model.__subclasses__())
+
+        while pending:
+            subclass = pending.pop()
+
+            if subclass not in output:
+                output.append(subclass)
+
+                pending.extend(subclass.__subclasses__())
+
+        return output
@@ -0,0 +1,50 @@
+import sys
+
+def _import(name: str) -> any:
+    """
+    Imports a module by its dotted name, without loading importlib.
+    """
+
+    __import__(name)
+
+    return sys.modules[name]
+
+def lazy_exports(package: str, exports: dict, submodules: tuple = ()) -> tuple:
+    """
+    Builds the module level __getattr__ and __dir__ (PEP 562) of a package.
+
+    Exported names are imported on first access and then stored in the package namespace,
+    so importing the package itself costs nothing and later lookups skip the hook.
+
+    :param package: the package name, usually __name__.
+    :param exports: a dictionary of exported names by their module, relative to the package.
+    :param submodules: names of the subpackages and modules reachable as attributes.
+    :return: the __getattr__ and __dir__ functions.
+    """
+
+    names = {}
+
+    for module, attributes in exports.items():
+        for attribute in attributes:
+            names[attribute] = module
+
+    def __getattr__(name: str) -> any:
+        module = names.get(name)
+
+        if module is not None:
+            value = getattr(_import(f'{package}.{module}'), name)
+
+        elif name in submodules:
+            value = _import(f'{package}.{name}')
+
+        else:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[package])) | set(names) | set(submodules))
+
+    return __getattr__, __dir__
@@ -1 +1,11 @@
- 
+from piracyshield_data_model.lazy import lazy_exports
+
+# models are imported on first access, see lazy_exports
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'rule': ['LogRule'],
+    'ticket.model': ['LogTicketModel'],
+    'ticket.item.model': ['LogTicketItemModel']
+}, (
+    'rule',
+    'ticket'
+))
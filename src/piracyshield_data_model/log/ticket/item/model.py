@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.ticket.item.rule import TicketItemRule
 
@@ -12,9 +12,15 @@ class LogTicketItemModel(BaseModel):
     Ticket item logging data modeling class.
     """
 
-    ticket_item_id = None
+    __slots__ = (
+        'ticket_item_id',
+        'message'
+    )
 
-    message = None
+    # not editable by a patch
+    _identifiers = (
+        'ticket_item_id',
+    )
 
     def __init__(self, ticket_item_id: str, message: str):
         """
@@ -39,12 +45,10 @@ class LogTicketItemModel(BaseModel):
         if not value or not len(value):
             raise LogTicketItemModelTicketItemIdentifierMissingException()
 
-        validator = Validator(value, TicketItemRule.TICKET_ITEM_ID)
+        plan = RulePlan.compile(TicketItemRule.TICKET_ITEM_ID)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise LogTicketItemModelTicketItemIdentifierNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise LogTicketItemModelTicketItemIdentifierNonValidException(plan.errors(value))
 
         return value
 
@@ -59,12 +63,10 @@ class LogTicketItemModel(BaseModel):
         if not value or not len(value):
             raise LogTicketItemModelMessageMissingException()
 
-        validator = Validator(value, LogRule.MESSAGE)
-
-        validator.validate()
+        plan = RulePlan.compile(LogRule.MESSAGE)
 
-        if not validator.is_valid():
-            raise LogTicketItemModelMessageNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise LogTicketItemModelMessageNonValidException(plan.errors(value))
 
         return value
 
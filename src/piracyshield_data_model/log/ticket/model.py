@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.ticket.rule import TicketRule
 
@@ -12,9 +12,15 @@ class LogTicketModel(BaseModel):
     Ticket logging data modeling class.
     """
 
-    ticket_id = None
+    __slots__ = (
+        'ticket_id',
+        'message'
+    )
 
-    message = None
+    # not editable by a patch
+    _identifiers = (
+        'ticket_id',
+    )
 
     def __init__(self, ticket_id: str, message: str):
         """
@@ -36,12 +42,10 @@ class LogTicketModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketRule.TICKET_ID)
+        plan = RulePlan.compile(TicketRule.TICKET_ID)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise LogTicketModelTicketIdentifierNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise LogTicketModelTicketIdentifierNonValidException(plan.errors(value))
 
         return value
 
@@ -53,12 +57,10 @@ class LogTicketModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, LogRule.MESSAGE)
-
-        validator.validate()
+        plan = RulePlan.compile(LogRule.MESSAGE)
 
-        if not validator.is_valid():
-            raise LogTicketModelMessageNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise LogTicketModelMessageNonValidException(plan.errors(value))
 
         return value
 
@@ -0,0 +1,153 @@
+from piracyshield_data_model.base import BaseModel
+
+from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+class PatchModel:
+
+    """
+    Partial update of a model.
+
+    Only the changed fields are validated, list fields only for their added items, so an edit
+    costs as much as the change and not as much as the whole model. The result is a patched
+    copy of the model and the minimal dictionary of changes to store, which leaves out the
+    transient fields of the model, such as a password confirmation.
+    """
+
+    def __init__(self, model: BaseModel, changes: dict, editable: tuple = None):
+        """
+        Validates the changes.
+
+        :param model: the current model, such as one loaded with from_trusted.
+        :param changes: a dictionary of new values by field, unchanged values are ignored.
+        :param editable: optional list of the fields allowed to change, defaults to every validated field but the identifiers.
+
+        Non valid list items are reported with their index in the added items, not in the whole list.
+        """
+
+        self.base = model
+
+        # only the references are copied, lists such as the ticket FQDNs are shared and packed lists stay packed
+        self.model = type(model).from_trusted(BaseModel.to_dict(model))
+
+        self.diff = {}
+
+        # every changed field, transient ones included
+        self.changed = ()
+
+        fields = type(model)._fields
+
+        if editable is None:
+            editable = tuple(key for key in fields if key not in model._identifiers)
+
+        pending = {}
+
+        for key, value in changes.items():
+            if key not in fields:
+                raise PatchModelFieldNonValidException(key)
+
+            if key not in editable or not hasattr(model, f'_validate_{key}'):
+                raise PatchModelFieldNotEditableException(key)
+
+            if value == getattr(model, key, None):
+                continue
+
+            pending[key] = value
+
+        # every change is applied first, so validators relying on other fields see the new values
+        for key, value in pending.items():
+            setattr(self.model, key, value)
+
+        for key, value in pending.items():
+            if self._is_empty(value):
+                if key not in model._optional:
+                    # let the validator raise its own missing value exception
+                    getattr(self.model, f'_validate_{key}')(value)
+
+                value = [] if isinstance(value, list) else None
+
+            else:
+                value = self._validate(key, value, getattr(model, key, None))
+
+            self.diff[key] = value
+
+            current = getattr(model, key, None)
+
+            # packed lists stay packed in the patched model
+            if isinstance(current, (IPv4Array, IPv6Array)):
+                value = type(current)(value)
+
+            setattr(self.model, key, value)
+
+        if not self.diff:
+            return
+
+        self.model._validate_patch(tuple(self.diff))
+
+        # fields derived by the validators, such as the genre of a value
+        for key in fields:
+            if key in self.diff:
+                continue
+
+            value = getattr(self.model, key, None)
+
+            current = getattr(model, key, None)
+
+            # untouched fields still share the same object
+            if value is not current and value != current:
+                self.diff[key] = value
+
+        self.changed = tuple(self.diff)
+
+        # never stored as they are
+        for key in model._transient:
+            self.diff.pop(key, None)
+
+    def _validate(self, key: str, value: any, current: any) -> any:
+        """
+        Validates a changed value, or only the items added to a list.
+        """
+
+        validator = getattr(self.model, f'_validate_{key}')
+
+        if isinstance(value, list) and isinstance(current, (list, IPv4Array, IPv6Array)) and current:
+            try:
+                existing = set(current)
+
+                added = [item for item in value if item not in existing]
+
+            # unhashable items are validated as a whole
+            except TypeError:
+                return validator(value)
+
+            # only removed or reordered items
+            if not added:
+                return value
+
+            validator(added)
+
+            return value
+
+        return validator(value)
+
+    @staticmethod
+    def _is_empty(value: any) -> bool:
+        return value is None or (not value and hasattr(value, '__len__'))
+
+    def __bool__(self) -> bool:
+        return bool(self.changed)
+
+class PatchModelFieldNonValidException(Exception):
+
+    """
+    Unknown field.
+    """
+
+    pass
+
+class PatchModelFieldNotEditableException(Exception):
+
+    """
+    Field not editable.
+    """
+
+    pass
@@ -0,0 +1,143 @@
+from piracyshield_data_model.permission.model import PermissionModel
+
+class PermissionSet:
+
+    """
+    Immutable set of permissions packed in a single integer.
+
+    Each permission owns one bit, so membership, union and subset checks are integer operations.
+    """
+
+    __slots__ = (
+        'mask',
+    )
+
+    # bit of each permission, by declaration order
+    BITS = {permission: 1 << index for index, permission in enumerate(PermissionModel)}
+
+    def __init__(self, mask: int = 0):
+        """
+        Wraps an existing mask.
+
+        :param mask: the permission bits.
+        """
+
+        self.mask = mask
+
+    @classmethod
+    def from_permissions(cls, permissions: list) -> 'PermissionSet':
+        """
+        Packs a collection of permissions.
+
+        :param permissions: an iterable of permission models or their integer codes.
+        :return: a new set.
+        """
+
+        return cls(cls.mask_of(permissions))
+
+    @classmethod
+    def mask_of(cls, permissions: list) -> int | Exception:
+        """
+        Builds the mask of a collection of permissions, e.g. to precompute the requirements of an endpoint.
+
+        :param permissions: an iterable of permission models or their integer codes.
+        :return: the permission bits.
+        """
+
+        mask = 0
+
+        try:
+            for permission in permissions:
+                mask |= cls.BITS[permission]
+
+        except KeyError:
+            raise PermissionSetNonValidException()
+
+        return mask
+
+    def has(self, permission: int) -> bool | Exception:
+        """
+        Checks a single permission.
+
+        :param permission: a permission model or its integer code.
+        :return: true if granted.
+        """
+
+        try:
+            return bool(self.mask & self.BITS[permission])
+
+        except KeyError:
+            raise PermissionSetNonValidException()
+
+    def has_all(self, mask: int) -> bool:
+        """
+        Checks that every permission of a mask is granted.
+
+        :param mask: the required permission bits, see mask_of.
+        :return: true if all granted.
+        """
+
+        return self.mask & mask == mask
+
+    def has_any(self, mask: int) -> bool:
+        """
+        Checks that at least one permission of a mask is granted.
+
+        :param mask: the permission bits, see mask_of.
+        :return: true if any granted.
+        """
+
+        return bool(self.mask & mask)
+
+    def to_list(self) -> list:
+        """
+        Unpacks the set, e.g. to store it.
+
+        :return: a list of permission codes.
+        """
+
+        return [permission.value for permission in self]
+
+    def __contains__(self, permission: int) -> bool:
+        bit = self.BITS.get(permission)
+
+        return bit is not None and bool(self.mask & bit)
+
+    def __iter__(self):
+        mask = self.mask
+
+        for permission, bit in self.BITS.items():
+            if mask & bit:
+                yield permission
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __or__(self, other: 'PermissionSet') -> 'PermissionSet':
+        return PermissionSet(self.mask | other.mask)
+
+    def __and__(self, other: 'PermissionSet') -> 'PermissionSet':
+        return PermissionSet(self.mask & other.mask)
+
+    def __sub__(self, other: 'PermissionSet') -> 'PermissionSet':
+        return PermissionSet(self.mask & ~other.mask)
+
+    def __le__(self, other: 'PermissionSet') -> bool:
+        return self.mask & other.mask == self.mask
+
+    def __eq__(self, other: any) -> bool:
+        return isinstance(other, PermissionSet) and self.mask == other.mask
+
+    def __hash__(self) -> int:
+        return hash(self.mask)
+
+    def __repr__(self) -> str:
+        return f'PermissionSet({[permission.name for permission in self]})'
+
+class PermissionSetNonValidException(Exception):
+
+    """
+    Non valid permission.
+    """
+
+    pass
@@ -0,0 +1,121 @@
+from piracyshield_data_model.account.role.model import AccountRoleModel
+
+from piracyshield_data_model.permission.bitset import PermissionSet
+
+class PermissionMatrix:
+
+    """
+    Permissions of each account role, packed once.
+
+    The assignments are an authorization policy, so they are supplied by the caller instead of
+    being defined by the data model. Roles left out of the assignments are granted nothing.
+    """
+
+    __slots__ = (
+        'roles',
+        'masks'
+    )
+
+    def __init__(self, assignments: dict):
+        """
+        Packs the permissions of each role.
+
+        :param assignments: a dictionary of iterables of permission models or their integer codes, by account role.
+        """
+
+        self.roles = {role: PermissionSet() for role in AccountRoleModel}
+
+        for role, permissions in assignments.items():
+            try:
+                role = AccountRoleModel(role)
+
+            except ValueError:
+                raise PermissionMatrixRoleNonValidException()
+
+            self.roles[role] = PermissionSet.from_permissions(permissions)
+
+        # raw masks for the hot path
+        self.masks = {role: permissions.mask for role, permissions in self.roles.items()}
+
+    def get(self, role: int) -> PermissionSet | Exception:
+        """
+        Returns the permissions of a role.
+
+        :param role: an account role model or its integer code.
+        :return: the permission set.
+        """
+
+        try:
+            return self.roles[role]
+
+        except KeyError:
+            raise PermissionMatrixRoleNonValidException()
+
+    def has_permission(self, role: int, permission: int) -> bool | Exception:
+        """
+        Checks a single permission of a role.
+
+        :param role: an account role model or its integer code.
+        :param permission: a permission model or its integer code.
+        :return: true if granted.
+        """
+
+        try:
+            return bool(self.masks[role] & PermissionSet.BITS[permission])
+
+        except KeyError:
+            raise PermissionMatrixRoleNonValidException() if role not in self.masks else PermissionMatrixPermissionNonValidException()
+
+    def has_permissions(self, role: int, mask: int) -> bool | Exception:
+        """
+        Checks that a role is granted every permission of a precomputed mask.
+
+        :param role: an account role model or its integer code.
+        :param mask: the required permission bits, see PermissionSet.mask_of.
+        :return: true if all granted.
+        """
+
+        try:
+            return self.masks[role] & mask == mask
+
+        except KeyError:
+            raise PermissionMatrixRoleNonValidException()
+
+    def check_many(self, role: int, permissions: list) -> list | Exception:
+        """
+        Checks many permissions of a role at once.
+
+        :param role: an account role model or its integer code.
+        :param permissions: a list of permission models or their integer codes.
+        :return: a list of booleans aligned with the permissions.
+        """
+
+        granted = self.get(role)
+
+        return [granted.has(permission) for permission in permissions]
+
+    def roles_with(self, permission: int) -> list:
+        """
+        Lists the roles granted a permission.
+
+        :param permission: a permission model or its integer code.
+        :return: a list of account role models.
+        """
+
+        return [role for role in self.roles if self.has_permission(role, permission)]
+
+class PermissionMatrixRoleNonValidException(Exception):
+
+    """
+    Non valid account role.
+    """
+
+    pass
+
+class PermissionMatrixPermissionNonValidException(Exception):
+
+    """
+    Non valid permission.
+    """
+
+    pass
@@ -0,0 +1,435 @@
+from collections import OrderedDict
+# the lock type of threading, without importing the whole module
+from _thread import allocate_lock as Lock
+
+from piracyshield_component.validation.validator import Validator
+
+class RuleCache:
+
+    """
+    Bounded, thread-safe memo of the values known to be valid, shared by every plan.
+
+    Entries are keyed by (plan, type, value), so equal values of different types such as 1,
+    1.0 and True stay apart, and are evicted in least recently used order.
+    Only successful validations are remembered.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        """
+        Creates an empty cache.
+
+        :param maxsize: maximum number of remembered values.
+        """
+
+        self.maxsize = maxsize
+
+        self.enabled = maxsize > 0
+
+        self.hits = 0
+
+        self.misses = 0
+
+        self._entries = OrderedDict()
+
+        self._lock = Lock()
+
+    def contains(self, key: tuple) -> bool:
+        """
+        Looks up a (plan, type, value) key, refreshing its position.
+
+        :param key: the (plan, type, value) key.
+        :return: true if the value is known to be valid.
+        """
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+                self.hits += 1
+
+                return True
+
+            self.misses += 1
+
+            return False
+
+    def add(self, key: tuple) -> None:
+        """
+        Remembers a valid (plan, type, value) key, evicting the oldest one when full.
+
+        :param key: the (plan, type, value) key.
+        """
+
+        with self._lock:
+            self._entries[key] = None
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last = False)
+
+    def configure(self, maxsize: int = None, enabled: bool = None) -> None:
+        """
+        Resizes, enables or disables the cache.
+
+        :param maxsize: the new maximum number of remembered values.
+        :param enabled: whether plans use the cache.
+        """
+
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last = False)
+
+            if enabled is not None:
+                self.enabled = enabled
+
+    def clear(self) -> None:
+        """
+        Forgets every value and resets the counters.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+            self.hits = 0
+
+            self.misses = 0
+
+    def info(self) -> dict:
+        """
+        Reports the cache statistics.
+
+        :return: a dictionary with hits, misses, size and maxsize.
+        """
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+class RulePlan:
+
+    """
+    Compiled validation plan for a list of rules.
+
+    A plan is built once per rule list and reused for every value, so the
+    success path only calls the rules without allocating a validator.
+    """
+
+    # compiled plans indexed by the identity of their rule list
+    _plans = {}
+
+    # values already validated, across all the models
+    cache = RuleCache()
+
+    def __init__(self, rules: list):
+        """
+        Compiles the rules.
+
+        :param rules: a list of validation rules.
+        """
+
+        self.rules = rules
+
+        self._steps = tuple(rules)
+
+    @classmethod
+    def compile(cls, rules: list) -> 'RulePlan':
+        """
+        Returns the plan of a rule list, compiling it on first use.
+
+        Rule lists are class level constants, so their identity is stable for the process lifetime.
+
+        :param rules: a list of validation rules.
+        :return: the compiled plan.
+        """
+
+        plan = cls._plans.get(id(rules))
+
+        if plan is None or plan.rules is not rules:
+            plan = cls._plans[id(rules)] = cls(rules)
+
+        return plan
+
+    def is_valid(self, value: any) -> bool:
+        """
+        Checks the value against every rule, stopping at the first failure.
+
+        :param value: the value to check.
+        :return: true if the value satisfies all the rules.
+        """
+
+        cache = self.cache
+
+        key = None
+
+        if cache.enabled:
+            try:
+                key = (self, type(value), value)
+
+                if cache.contains(key):
+                    return True
+
+            # unhashable garbage cannot be remembered
+            except TypeError:
+                key = None
+
+        if not self._evaluate(value):
+            return False
+
+        if key is not None:
+            cache.add(key)
+
+        return True
+
+    def _evaluate(self, value: any) -> bool:
+        """
+        Runs the rules, stopping at the first failure.
+
+        This is the hook replaced by the instrumentation to time each rule.
+
+        :param value: the value to check.
+        :return: true if the value satisfies all the rules.
+        """
+
+        for rule in self._steps:
+            rule(value)
+
+            if rule.errors:
+                # do not leak the errors into the next evaluation
+                rule.errors = []
+
+                return False
+
+        return True
+
+    def partition(self, values: list, parallel: 'ParallelValidation' = None) -> tuple:
+        """
+        Validates a whole list in one pass, without stopping at the first non valid item.
+
+        Repeated values are checked only once. The shared RuleCache is left alone: a long list of
+        unique values would only evict its entries and take its lock twice per value.
+
+        :param values: a list of values to check.
+        :param parallel: optional settings to shard oversized lists across processes.
+        :return: a tuple with the list of valid values and a list of (index, value, errors) for the non valid ones.
+        """
+
+        if parallel is not None and len(values) >= parallel.threshold:
+            return parallel.partition(self, values)
+
+        valid = []
+
+        invalid = []
+
+        checked = {}
+
+        evaluate = self._evaluate
+
+        for index, value in enumerate(values):
+            try:
+                key = (type(value), value)
+
+                is_valid = checked.get(key)
+
+                if is_valid is None:
+                    is_valid = checked[key] = evaluate(value)
+
+            # unhashable garbage cannot be remembered
+            except TypeError:
+                is_valid = evaluate(value)
+
+            if is_valid:
+                valid.append(value)
+
+            else:
+                invalid.append((index, value, self.errors(value)))
+
+        return valid, invalid
+
+    def errors(self, value: any) -> list:
+        """
+        Collects the full list of errors for a value.
+
+        This is the slow path, only meant to be used once a value is known to be non valid.
+
+        :param value: the value to check.
+        :return: a list of error messages.
+        """
+
+        validator = Validator(value, self.rules)
+
+        validator.validate()
+
+        return validator.errors
+
+    def require_all(self, values: any, missing: type, non_valid: type) -> list | Exception:
+        """
+        Checks every value, raising at the first missing or non valid one.
+
+        :param values: an iterable of values, read only once.
+        :param missing: exception raised for an empty value.
+        :param non_valid: exception raised with the errors of a non valid value.
+        :return: the values as a list.
+        """
+
+        values = list(values)
+
+        for value in values:
+            if not value:
+                raise missing()
+
+            if not self.is_valid(value):
+                raise non_valid(self.errors(value))
+
+        return values
+
+class ParallelValidation:
+
+    """
+    Opt-in settings to validate oversized lists in a process pool.
+
+    Validation is CPU bound, so lists above the threshold are split into chunks validated by
+    separate processes; smaller lists stay in process, where the pool overhead would dominate.
+
+    Without an executor, the models validate their lists in a session, so a model construction
+    starts at most one pool whatever the number of oversized lists.
+    """
+
+    def __init__(self, threshold: int = 50000, chunk_size: int = 10000, workers: int = None, executor: 'ProcessPoolExecutor' = None):
+        """
+        Registers the settings.
+
+        :param threshold: minimum list size to go parallel.
+        :param chunk_size: number of values per work unit.
+        :param workers: number of processes of the pool, defaults to the number of CPUs.
+        :param executor: an existing pool to reuse, otherwise one is created for each session or list.
+        """
+
+        if chunk_size < 1:
+            raise ParallelValidationChunkSizeException()
+
+        self.threshold = threshold
+
+        self.chunk_size = chunk_size
+
+        self.workers = workers
+
+        self.executor = executor
+
+        # pool started by this session, shut down by close
+        self._pool = None
+
+        self._session = False
+
+    def session(self) -> 'ParallelValidation':
+        """
+        Copies the settings for the lists of a single model.
+
+        The first oversized list starts the pool and the next ones reuse it until close.
+
+        :return: the new settings, to be closed after use.
+        """
+
+        session = ParallelValidation(self.threshold, self.chunk_size, self.workers, self.executor)
+
+        session._session = True
+
+        return session
+
+    def close(self) -> None:
+        """
+        Shuts down the pool started by a session, if any.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown()
+
+            self.executor = self._pool = None
+
+    def partition(self, plan: RulePlan, values: list) -> tuple:
+        """
+        Validates the chunks in the pool and merges them in their original order.
+
+        :param plan: the compiled plan to apply.
+        :param values: a list of values to check.
+        :return: the same output of RulePlan.partition.
+        """
+
+        offsets = range(0, len(values), self.chunk_size)
+
+        chunks = [values[offset:offset + self.chunk_size] for offset in offsets]
+
+        rules = [plan.rules] * len(chunks)
+
+        # the rule list identity in this process, for the workers to reuse their plan
+        keys = [id(plan.rules)] * len(chunks)
+
+        executor = self.executor
+
+        if executor is None:
+            # multiprocessing is expensive to import and most processes never go parallel
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(max_workers = self.workers)
+
+            # kept for the next lists of the session
+            if self._session:
+                self.executor = self._pool = executor
+
+        try:
+            results = list(executor.map(_partition_chunk, keys, rules, offsets, chunks))
+
+        finally:
+            if executor is not self.executor:
+                executor.shutdown()
+
+        invalid = []
+
+        for chunk_invalid in results:
+            invalid.extend(chunk_invalid)
+
+        if not invalid:
+            return list(values), invalid
+
+        # only the non valid items travel back from the workers
+        skip = {index for index, value, errors in invalid}
+
+        return [value for index, value in enumerate(values) if index not in skip], invalid
+
+# plans of a worker process, by the identity of their rule list in the parent process
+_worker_plans = {}
+
+def _partition_chunk(key: int, rules: list, offset: int, values: list) -> tuple:
+    """
+    Validates a chunk inside a worker process.
+
+    Every chunk unpickles a new copy of the rules, which RulePlan.compile would never find again,
+    so the plans are kept by the key of the parent process.
+
+    :param key: identity of the rule list in the parent process.
+    :param rules: the rule list, pickled along with the chunk.
+    :param offset: position of the chunk in the whole list.
+    :param values: the chunk values.
+    :return: the non valid items of the chunk, with indexes relative to the whole list.
+    """
+
+    plan = _worker_plans.get(key)
+
+    if plan is None:
+        plan = _worker_plans[key] = RulePlan(rules)
+
+    valid, invalid = plan.partition(values)
+
+    return [(offset + index, value, errors) for index, value, errors in invalid]
+
+class ParallelValidationChunkSizeException(Exception):
+
+    """
+    Non valid chunk size.
+    """
+
+    pass
@@ -7,11 +7,11 @@ class ProviderModel(AccountModel):
     Provider account data modeling class.
     """
 
-    role = AccountRoleModel.PROVIDER
+    __slots__ = ()
 
     def __init__(self, account_id: str, name: str, email: str, password: str, confirm_password: str, is_active: bool):
         """
         Extends the functionality from a general account.
         """
 
-        super().__init__(account_id, name, email, password, confirm_password, self.role, is_active)
+        super().__init__(account_id, name, email, password, confirm_password, AccountRoleModel.PROVIDER, is_active)
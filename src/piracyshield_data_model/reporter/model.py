@@ -7,11 +7,11 @@ class ReporterModel(AccountModel):
     Reporter account data modeling class.
     """
 
-    role = AccountRoleModel.REPORTER
+    __slots__ = ()
 
     def __init__(self, account_id: str, name: str, email: str, password: str, confirm_password: str, is_active: bool):
         """
         Extends the functionality from a general account.
         """
 
-        super().__init__(account_id, name, email, password, confirm_password, self.role, is_active)
+        super().__init__(account_id, name, email, password, confirm_password, AccountRoleModel.REPORTER, is_active)
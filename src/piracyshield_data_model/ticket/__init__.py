@@ -1 +1,18 @@
- 
+from piracyshield_data_model.lazy import lazy_exports
+
+# models are imported on first access, see lazy_exports
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'model': ['TicketModel'],
+    'rule': ['TicketRule'],
+    'error.model': ['TicketErrorModel'],
+    'error.rule': ['TicketErrorRule'],
+    'genre.model': ['TicketGenreModel'],
+    'status.model': ['TicketStatusModel']
+}, (
+    'error',
+    'genre',
+    'item',
+    'model',
+    'rule',
+    'status'
+))
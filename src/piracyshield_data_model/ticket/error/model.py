@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan, ParallelValidation
 
 from piracyshield_data_model.ticket.error.rule import TicketErrorRule
 
@@ -14,19 +14,36 @@ class TicketErrorModel(BaseModel):
     Ticket error data modeling class.
     """
 
-    ticket_error_id = None
-
-    genre = None
-
-    ticket_id = None
-
-    fqdn = []
-
-    ipv4 = []
-
-    ipv6 = []
-
-    def __init__(self, ticket_error_id: str, ticket_id: str, fqdn: list, ipv4: list, ipv6: list):
+    __slots__ = (
+        'ticket_error_id',
+        'genre',
+        'ticket_id',
+        'fqdn',
+        'ipv4',
+        'ipv6'
+    )
+
+    # not editable by a patch
+    _identifiers = (
+        'ticket_error_id',
+        'ticket_id'
+    )
+
+    # empty lists are not stored
+    _defaults = {
+        'fqdn': [],
+        'ipv4': [],
+        'ipv6': []
+    }
+
+    # fields a patch may clear
+    _optional = (
+        'fqdn',
+        'ipv4',
+        'ipv6'
+    )
+
+    def __init__(self, ticket_error_id: str, ticket_id: str, fqdn: list, ipv4: list, ipv6: list, parallel: ParallelValidation = None):
         """
         Validates the parameters.
 
@@ -35,8 +52,15 @@ class TicketErrorModel(BaseModel):
         :param fqdn: a list of FQDN items.
         :param ipv4: a list of IPv4 items.
         :param ipv6: a list of IPv6 items.
+        :param parallel: optional settings to validate oversized lists in a process pool.
         """
 
+        self.fqdn = []
+
+        self.ipv4 = []
+
+        self.ipv6 = []
+
         # FQDN, IPv4 and IPv6 should never be all empty
         if not any([bool(fqdn), bool(ipv4), bool(ipv6)]):
             raise TicketErrorModelNoDataException
@@ -48,14 +72,33 @@ class TicketErrorModel(BaseModel):
 
         self.ticket_id = self._validate_ticket_id(ticket_id)
 
-        if fqdn:
-            self.fqdn = self._validate_fqdn(fqdn)
+        # the lists share one process pool
+        if parallel is not None:
+            parallel = parallel.session()
+
+        try:
+            if fqdn:
+                self.fqdn = self._validate_fqdn(fqdn, parallel)
+
+            if ipv4:
+                self.ipv4 = self._validate_ipv4(ipv4, parallel)
 
-        if ipv4:
-            self.ipv4 = self._validate_ipv4(ipv4)
+            if ipv6:
+                self.ipv6 = self._validate_ipv6(ipv6, parallel)
 
-        if ipv6:
-            self.ipv6 = self._validate_ipv6(ipv6)
+        finally:
+            if parallel is not None:
+                parallel.close()
+
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        FQDN, IPv4 and IPv6 should never be all empty, not even after a patch.
+
+        :param changed: the names of the changed fields.
+        """
+
+        if not any([bool(self.fqdn), bool(self.ipv4), bool(self.ipv6)]):
+            raise TicketErrorModelNoDataException
 
     def _validate_ticket_error_id(self, value: str) -> str | Exception:
         """
@@ -65,12 +108,10 @@ class TicketErrorModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketErrorRule.TICKET_ERROR_ID)
+        plan = RulePlan.compile(TicketErrorRule.TICKET_ERROR_ID)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise TicketErrorModelTicketErrorIdentifierException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketErrorModelTicketErrorIdentifierException(plan.errors(value))
 
         return value
 
@@ -82,75 +123,67 @@ class TicketErrorModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketRule.TICKET_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketRule.TICKET_ID)
 
-        if not validator.is_valid():
-            raise TicketErrorModelTicketIdentifierException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketErrorModelTicketIdentifierException(plan.errors(value))
 
         return value
 
-    def _validate_fqdn(self, value: list) -> list | Exception:
+    def _validate_fqdn(self, value: list, parallel: ParallelValidation = None) -> list | Exception:
         """
         Validates the ticket FQDN list.
 
         :param value: a list of FQDNs.
+        :param parallel: optional settings to validate oversized lists in a process pool.
         :return: the same value.
         """
 
         if not value or not len(value):
             raise TicketErrorModelFQDNMissingException()
 
-        for item in value:
-            validator = Validator(item, TicketRule.FQDN)
-
-            validator.validate()
+        valid, invalid = RulePlan.compile(TicketRule.FQDN).partition(value, parallel)
 
-            if not validator.is_valid():
-                raise TicketErrorModelFQDNNonValidException(validator.errors)
+        if invalid:
+            raise TicketErrorModelFQDNNonValidException(invalid)
 
         return value
 
-    def _validate_ipv4(self, value: list) -> list | Exception:
+    def _validate_ipv4(self, value: list, parallel: ParallelValidation = None) -> list | Exception:
         """
         Validates the ticket IPv4 list.
 
         :param value: a list of IPv4s.
+        :param parallel: optional settings to validate oversized lists in a process pool.
         :return: the same value.
         """
 
         if not value or not len(value):
             raise TicketErrorModelIPv4MissingException()
 
-        for item in value:
-            validator = Validator(item, TicketRule.IPV4)
+        valid, invalid = RulePlan.compile(TicketRule.IPV4).partition(value, parallel)
 
-            validator.validate()
-
-            if not validator.is_valid():
-                raise TicketErrorModelIPv4NonValidException(validator.errors)
+        if invalid:
+            raise TicketErrorModelIPv4NonValidException(invalid)
 
         return value
 
-    def _validate_ipv6(self, value: list) -> list | Exception:
+    def _validate_ipv6(self, value: list, parallel: ParallelValidation = None) -> list | Exception:
         """
         Validates the ticket IPv6 list.
 
         :param value: a list of IPv6s.
+        :param parallel: optional settings to validate oversized lists in a process pool.
         :return: the same value.
         """
 
         if not value or not len(value):
             raise TicketErrorModelIPv6MissingException()
 
-        for item in value:
-            validator = Validator(item, TicketRule.IPV6)
-
-            validator.validate()
+        valid, invalid = RulePlan.compile(TicketRule.IPV6).partition(value, parallel)
 
-            if not validator.is_valid():
-                raise TicketErrorModelIPv6NonValidException(validator.errors)
+        if invalid:
+            raise TicketErrorModelIPv6NonValidException(invalid)
 
         return value
 
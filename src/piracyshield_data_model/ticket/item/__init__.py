@@ -1 +1,28 @@
- 
+from piracyshield_data_model.lazy import lazy_exports
+
+# models are imported on first access, see lazy_exports
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'model': ['TicketItemModel'],
+    'rule': ['TicketItemRule'],
+    'batch.model': ['TicketItemBatchModel'],
+    'duplicate': ['TicketItemDuplicateIndex'],
+    'genre.model': ['TicketItemGenreModel'],
+    'genre.classifier': ['TicketItemGenreClassifier'],
+    'processed.model': ['TicketItemProcessedModel'],
+    'processed.rule': ['TicketItemProcessedRule'],
+    'report.model': ['TicketItemReportModel'],
+    'status.model': ['TicketItemStatusModel'],
+    'unprocessed.model': ['TicketItemUnprocessedModel'],
+    'unprocessed.rule': ['TicketItemUnprocessedRule'],
+    'unprocessed.reason.model': ['TicketItemUnprocessedReasonModel']
+}, (
+    'batch',
+    'duplicate',
+    'genre',
+    'model',
+    'processed',
+    'report',
+    'rule',
+    'status',
+    'unprocessed'
+))
@@ -0,0 +1,316 @@
+from piracyshield_data_model.plan import RulePlan
+
+from piracyshield_data_model.ticket.item.model import TicketItemModel
+from piracyshield_data_model.ticket.item.rule import TicketItemRule
+
+from piracyshield_data_model.ticket.item.status.model import TicketItemStatusModel
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+from piracyshield_data_model.account.rule import AccountRule
+
+class TicketItemBatchModel:
+
+    """
+    Columnar batch of ticket items.
+
+    Holds the fan-out of a ticket to its providers as parallel arrays (one row per value and provider)
+    instead of one TicketItemModel per row. Fields shared by every item are stored once.
+
+    Rows are grouped by value, so the value and provider of a row follow from its index.
+    """
+
+    # genre codes, by position
+    GENRES = (
+        TicketItemGenreModel.FQDN.value,
+        TicketItemGenreModel.IPV4.value,
+        TicketItemGenreModel.IPV6.value
+    )
+
+    # packed boolean flags
+    FLAGS = {
+        'is_active': 1,
+        'is_duplicate': 2,
+        'is_whitelisted': 4,
+        'is_error': 8
+    }
+
+    def __init__(self, ticket_id: str, values: list, genres: list, provider_ids: list):
+        """
+        Builds every value and provider pair from already validated parameters.
+
+        :param ticket_id: a valid ticket identifier.
+        :param values: a list of valid FQDN, IPv4 or IPv6 values.
+        :param genres: a list, aligned with the values, of ticket item genres.
+        :param provider_ids: a list of valid provider account identifiers.
+        """
+
+        self.ticket_id = ticket_id
+
+        self.status = TicketItemStatusModel.PENDING.value
+
+        self.settings = {
+            'update_max_time': 172800 # 2 days
+        }
+
+        self.values = list(values)
+
+        # genre code of each value
+        self.genres = bytes(self.GENRES.index(genre) for genre in genres)
+
+        self.provider_ids = list(provider_ids)
+
+        self.flags = bytearray([self.FLAGS['is_active']]) * (len(self.values) * len(self.provider_ids))
+
+        # filled on demand
+        self.ticket_item_ids = None
+
+    @classmethod
+    def from_ticket(cls, ticket: any, provider_ids: list) -> 'TicketItemBatchModel':
+        """
+        Fans a ticket out to its providers, validating each provider identifier once.
+
+        :param ticket: a ticket model.
+        :param provider_ids: an iterable of provider account identifiers.
+        :return: a new batch.
+        """
+
+        # a generator would be exhausted by the validation, so it is collected first
+        provider_ids = RulePlan.compile(AccountRule.ACCOUNT_ID).require_all(
+            provider_ids,
+            TicketItemBatchModelProviderIdentifierMissingException,
+            TicketItemBatchModelProviderIdentifierNonValidException
+        )
+
+        values = []
+
+        genres = []
+
+        for genre, items in ((TicketItemGenreModel.FQDN.value, ticket.fqdn), (TicketItemGenreModel.IPV4.value, ticket.ipv4), (TicketItemGenreModel.IPV6.value, ticket.ipv6)):
+            values.extend(items)
+
+            genres.extend([genre] * len(items))
+
+        return cls(ticket.ticket_id, values, genres, provider_ids)
+
+    def assign_identifiers(self, identifier: callable) -> None:
+        """
+        Generates a ticket item identifier for each row.
+
+        :param identifier: a callable returning a new ticket item identifier at each call.
+        """
+
+        plan = RulePlan.compile(TicketItemRule.TICKET_ITEM_ID)
+
+        ticket_item_ids = []
+
+        for _ in range(len(self)):
+            ticket_item_id = identifier()
+
+            if not plan.is_valid(ticket_item_id):
+                raise TicketItemBatchModelTicketItemIdentifierNonValidException(plan.errors(ticket_item_id))
+
+            ticket_item_ids.append(ticket_item_id)
+
+        self.ticket_item_ids = ticket_item_ids
+
+    def get_flag(self, row: int, flag: str) -> bool:
+        """
+        Reads a flag of a row.
+
+        :param row: the row index.
+        :param flag: one of is_active, is_duplicate, is_whitelisted, is_error.
+        :return: the flag value.
+        """
+
+        return bool(self.flags[row] & self._bit(flag))
+
+    def set_flag(self, flag: str, rows: list, enabled: bool = True) -> None:
+        """
+        Updates a flag on many rows at once.
+
+        :param flag: one of is_active, is_duplicate, is_whitelisted, is_error.
+        :param rows: an iterable of row indexes.
+        :param enabled: the new flag value.
+        """
+
+        bit = self._bit(flag)
+
+        flags = self.flags
+
+        if enabled:
+            for row in rows:
+                flags[row] |= bit
+
+        else:
+            mask = 0xff ^ bit
+
+            for row in rows:
+                flags[row] &= mask
+
+    def set_flag_by_value(self, flag: str, values: set, enabled: bool = True) -> None:
+        """
+        Updates a flag on every row carrying one of the values, for all the providers.
+
+        Useful for value level properties such as duplicates or whitelisted items.
+
+        :param flag: one of is_active, is_duplicate, is_whitelisted, is_error.
+        :param values: a collection of values.
+        :param enabled: the new flag value.
+        """
+
+        values = set(values)
+
+        providers = len(self.provider_ids)
+
+        rows = []
+
+        for index, value in enumerate(self.values):
+            if value in values:
+                rows.extend(range(index * providers, (index + 1) * providers))
+
+        self.set_flag(flag, rows, enabled)
+
+    def rows_with(self, flag: str, enabled: bool = True) -> list:
+        """
+        Lists the rows having a flag set or unset.
+
+        :param flag: one of is_active, is_duplicate, is_whitelisted, is_error.
+        :param enabled: the flag value to look for.
+        :return: a list of row indexes.
+        """
+
+        bit = self._bit(flag)
+
+        return [row for row, flags in enumerate(self.flags) if bool(flags & bit) == enabled]
+
+    def row(self, row: int) -> dict:
+        """
+        Exports a single row with the same layout of TicketItemModel.to_dict.
+
+        :param row: the row index.
+        :return: the item dictionary.
+        """
+
+        value_index, provider_index = divmod(row, len(self.provider_ids))
+
+        flags = self.flags[row]
+
+        output = {
+            'ticket_id': self.ticket_id
+        }
+
+        if self.ticket_item_ids is not None:
+            output['ticket_item_id'] = self.ticket_item_ids[row]
+
+        output['provider_id'] = self.provider_ids[provider_index]
+
+        output['value'] = self.values[value_index]
+
+        output['genre'] = self.GENRES[self.genres[value_index]]
+
+        output['status'] = self.status
+
+        output['is_active'] = bool(flags & 1)
+
+        output['is_duplicate'] = bool(flags & 2)
+
+        output['is_whitelisted'] = bool(flags & 4)
+
+        output['is_error'] = bool(flags & 8)
+
+        # every item owns its settings
+        output['settings'] = self.settings.copy()
+
+        return output
+
+    def item(self, row: int) -> TicketItemModel:
+        """
+        Materializes a single row as a ticket item model, once the identifiers are assigned.
+
+        :param row: the row index.
+        :return: a ticket item.
+        """
+
+        if self.ticket_item_ids is None:
+            raise TicketItemBatchModelTicketItemIdentifierMissingException()
+
+        value_index, provider_index = divmod(row, len(self.provider_ids))
+
+        flags = self.flags[row]
+
+        return TicketItemModel.from_validated(
+            self.ticket_id,
+            self.ticket_item_ids[row],
+            self.provider_ids[provider_index],
+            self.values[value_index],
+            self.GENRES[self.genres[value_index]],
+            bool(flags & 1),
+            bool(flags & 2),
+            bool(flags & 4),
+            bool(flags & 8)
+        )
+
+    def to_dicts(self, start: int = 0, stop: int = None) -> list:
+        """
+        Exports a range of rows.
+
+        :param start: first row.
+        :param stop: row after the last one, defaults to the end of the batch.
+        :return: a list of item dictionaries.
+        """
+
+        return [self.row(row) for row in range(start, len(self) if stop is None else stop)]
+
+    def _bit(self, flag: str) -> int:
+        """
+        Resolves a flag name into its bit.
+        """
+
+        try:
+            return self.FLAGS[flag]
+
+        except KeyError:
+            raise TicketItemBatchModelFlagNonValidException()
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+class TicketItemBatchModelProviderIdentifierMissingException(Exception):
+
+    """
+    Missing provider account identifier.
+    """
+
+    pass
+
+class TicketItemBatchModelProviderIdentifierNonValidException(Exception):
+
+    """
+    Non valid provider account identifier.
+    """
+
+    pass
+
+class TicketItemBatchModelTicketItemIdentifierMissingException(Exception):
+
+    """
+    Ticket item identifiers not assigned yet, see assign_identifiers.
+    """
+
+    pass
+
+class TicketItemBatchModelTicketItemIdentifierNonValidException(Exception):
+
+    """
+    Non valid ticket item identifier.
+    """
+
+    pass
+
+class TicketItemBatchModelFlagNonValidException(Exception):
+
+    """
+    Non valid flag.
+    """
+
+    pass
@@ -0,0 +1,279 @@
+from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+class BloomFilter:
+
+    """
+    Fixed size Bloom filter over hashable keys.
+
+    Answers "definitely not present" or "maybe present", never a false negative.
+    """
+
+    __slots__ = (
+        'size',
+        'hashes',
+        'bits'
+    )
+
+    def __init__(self, size: int, hashes: int = 4):
+        """
+        Allocates the bit array.
+
+        :param size: number of bits.
+        :param hashes: number of bit positions per key.
+        """
+
+        self.size = size
+
+        self.hashes = hashes
+
+        self.bits = bytearray((size + 7) // 8)
+
+    def _positions(self, key: any):
+        """
+        Derives the bit positions of a key through double hashing.
+        """
+
+        first = hash(key)
+
+        second = hash((key, self.size)) | 1
+
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, key: any) -> None:
+        """
+        Sets the bits of a key.
+
+        :param key: a hashable key.
+        """
+
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: any) -> bool:
+        for position in self._positions(key):
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+
+        return True
+
+class TicketItemDuplicateIndex:
+
+    """
+    In-memory index of the active ticket item values, to compute TicketItemModel.is_duplicate.
+
+    Values are keyed on their canonical (genre, value) form, so differently written
+    FQDNs or IP addresses are still recognized as the same item.
+
+    A complete index answers from its exact dictionary alone. A partial index, holding only some of
+    the active values (e.g. the recent ones) in memory, answers None for the values it cannot tell;
+    the optional Bloom filter, fed with every active value, turns most of those into a sure False.
+    """
+
+    def __init__(self, bloom_size: int = None, bloom_hashes: int = 4, partial: bool = False):
+        """
+        Creates an empty index.
+
+        :param bloom_size: enables a Bloom filter of this many bits.
+        :param bloom_hashes: number of bit positions per key in the Bloom filter.
+        :param partial: the exact index does not hold every active value, see add.
+        """
+
+        # canonical key -> number of active items carrying it
+        self._counts = {}
+
+        self._bloom = BloomFilter(bloom_size, bloom_hashes) if bloom_size else None
+
+        self.partial = partial
+
+    @staticmethod
+    def key(genre: str, value: str) -> tuple:
+        """
+        Builds the canonical key of a value.
+
+        :param genre: a ticket item genre.
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :return: the (genre, canonical value) tuple.
+        """
+
+        match genre:
+            case TicketItemGenreModel.FQDN.value:
+                return (genre, value.lower().rstrip('.'))
+
+            case TicketItemGenreModel.IPV4.value:
+                return (genre, IPv4Array.pack(value))
+
+            case TicketItemGenreModel.IPV6.value:
+                return (genre, IPv6Array.pack(value))
+
+        raise TicketItemDuplicateIndexGenreException()
+
+    def add(self, genre: str, value: str, exact: bool = True) -> None:
+        """
+        Registers an active value.
+
+        :param genre: a ticket item genre.
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :param exact: also keep the value in the exact index, a partial index may record it in the Bloom filter only.
+        """
+
+        key = self.key(genre, value)
+
+        if exact:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+        elif not self.partial:
+            raise TicketItemDuplicateIndexNotPartialException()
+
+        if self._bloom is not None:
+            self._bloom.add(key)
+
+    def add_items(self, items: list) -> None:
+        """
+        Registers the active ticket items.
+
+        :param items: an iterable of ticket item models, non active ones are skipped.
+        """
+
+        for item in items:
+            if item.is_active:
+                self.add(item.genre, item.value)
+
+    def remove(self, genre: str, value: str) -> None:
+        """
+        Unregisters a value, such as when the item is unblocked.
+
+        The Bloom filter cannot forget keys, it just keeps answering "maybe" for them.
+
+        :param genre: a ticket item genre.
+        :param value: a valid FQDN, IPv4 or IPv6.
+        """
+
+        key = self.key(genre, value)
+
+        count = self._counts.get(key)
+
+        if count is None:
+            return
+
+        if count > 1:
+            self._counts[key] = count - 1
+
+        else:
+            del self._counts[key]
+
+    def remove_items(self, items: list) -> None:
+        """
+        Unregisters a collection of ticket items.
+
+        :param items: an iterable of ticket item models.
+        """
+
+        for item in items:
+            self.remove(item.genre, item.value)
+
+    def contains(self, genre: str, value: str) -> bool | None:
+        """
+        Checks whether a value is already carried by an active item.
+
+        :param genre: a ticket item genre.
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :return: true if duplicate, false if not, None if a partial index cannot tell.
+        """
+
+        return self._lookup(self.key(genre, value))
+
+    def might_contain(self, genre: str, value: str) -> bool:
+        """
+        Asks only the Bloom filter, e.g. to skip a storage query when the index is partial.
+
+        :param genre: a ticket item genre.
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :return: false if the value is surely not present.
+        """
+
+        if self._bloom is None:
+            return self.contains(genre, value) is not False
+
+        return self.key(genre, value) in self._bloom
+
+    def contains_many(self, genre: str, values: list) -> list:
+        """
+        Checks a whole list of values of the same genre.
+
+        :param genre: a ticket item genre.
+        :param values: a list of valid values.
+        :return: a list of booleans, or None where a partial index cannot tell, aligned with the values.
+        """
+
+        key = self.key
+
+        if not self.partial:
+            counts = self._counts
+
+            return [key(genre, value) in counts for value in values]
+
+        lookup = self._lookup
+
+        return [lookup(key(genre, value)) for value in values]
+
+    def _lookup(self, key: tuple) -> bool | None:
+        """
+        Looks up a canonical key, the exact index first.
+        """
+
+        if key in self._counts:
+            return True
+
+        if not self.partial:
+            return False
+
+        # only the filter can tell the surely absent values
+        if self._bloom is not None and key not in self._bloom:
+            return False
+
+        return None
+
+    def find_duplicates(self, fqdn: list = None, ipv4: list = None, ipv6: list = None) -> dict:
+        """
+        Finds the values of a new ticket already carried by active items.
+
+        A partial index leaves out the values it cannot tell, see contains_many.
+
+        :param fqdn: a list of FQDN items.
+        :param ipv4: a list of IPv4 items.
+        :param ipv6: a list of IPv6 items.
+        :return: a dictionary of duplicate values by genre.
+        """
+
+        output = {}
+
+        for genre, values in ((TicketItemGenreModel.FQDN.value, fqdn), (TicketItemGenreModel.IPV4.value, ipv4), (TicketItemGenreModel.IPV6.value, ipv6)):
+            if values:
+                duplicates = [value for value, is_duplicate in zip(values, self.contains_many(genre, values)) if is_duplicate]
+
+                if duplicates:
+                    output[genre] = duplicates
+
+        return output
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+class TicketItemDuplicateIndexGenreException(Exception):
+
+    """
+    Non valid genre.
+    """
+
+    pass
+
+class TicketItemDuplicateIndexNotPartialException(Exception):
+
+    """
+    Value left out of the exact index of a complete index.
+    """
+
+    pass
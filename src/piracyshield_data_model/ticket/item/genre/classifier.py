@@ -0,0 +1,59 @@
+from piracyshield_data_model.plan import RulePlan
+
+from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+
+from piracyshield_data_model.ticket.rule import TicketRule
+
+class TicketItemGenreClassifier:
+
+    """
+    Detects the genre of a ticket item value.
+
+    The value is inspected once to pick the only plausible genre, then just that validator runs.
+    """
+
+    # characters of a dotted quad, which no valid FQDN is made of alone
+    IPV4_CHARACTERS = frozenset('0123456789.')
+
+    @classmethod
+    def candidate(cls, value: str) -> str:
+        """
+        Picks the only genre the value could belong to, without validating it.
+
+        :param value: a FQDN, IPv4 or IPv6 string.
+        :return: the candidate genre.
+        """
+
+        if ':' in value:
+            return TicketItemGenreModel.IPV6.value
+
+        if cls.IPV4_CHARACTERS.issuperset(value):
+            return TicketItemGenreModel.IPV4.value
+
+        return TicketItemGenreModel.FQDN.value
+
+    @classmethod
+    def classify(cls, value: str) -> str | None:
+        """
+        Validates the value against its candidate genre only.
+
+        :param value: a FQDN, IPv4 or IPv6 string.
+        :return: the detected genre or None if the value is not valid.
+        """
+
+        genre = cls.candidate(value)
+
+        match genre:
+            case TicketItemGenreModel.IPV6.value:
+                rules = TicketRule.IPV6
+
+            case TicketItemGenreModel.IPV4.value:
+                rules = TicketRule.IPV4
+
+            case _:
+                rules = TicketRule.FQDN
+
+        if not RulePlan.compile(rules).is_valid(value):
+            return None
+
+        return genre
@@ -1,6 +1,7 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
+from piracyshield_data_model.address import IPv4Array, IPv6Array
 
 from piracyshield_data_model.ticket.item.rule import TicketItemRule
 
@@ -16,27 +17,26 @@ class TicketItemModel(BaseModel):
     Ticket item data modeling class.
     """
 
-    ticket_id = None
-
-    ticket_item_id = None
-
-    provider_id = None
-
-    value = None
-
-    genre = None
-
-    status = None
-
-    is_active = True
-
-    is_duplicate = False
-
-    is_whitelisted = False
-
-    is_error = False
-
-    settings = None
+    __slots__ = (
+        'ticket_id',
+        'ticket_item_id',
+        'provider_id',
+        'value',
+        'genre',
+        'status',
+        'is_active',
+        'is_duplicate',
+        'is_whitelisted',
+        'is_error',
+        'settings'
+    )
+
+    # not editable by a patch
+    _identifiers = (
+        'ticket_id',
+        'ticket_item_id',
+        'provider_id'
+    )
 
     def __init__(self,
         ticket_id: str,
@@ -63,21 +63,9 @@ class TicketItemModel(BaseModel):
 
         self.ticket_item_id = self._validate_ticket_item_id(ticket_item_id)
 
-        match genre:
-            case TicketItemGenreModel.FQDN.value:
-                self.genre = TicketItemGenreModel.FQDN.value
-                self.value = self._validate_fqdn(value)
+        self.genre = self._validate_genre(genre)
 
-            case TicketItemGenreModel.IPV4.value:
-                self.genre = TicketItemGenreModel.IPV4.value
-                self.value = self._validate_ipv4(value)
-
-            case TicketItemGenreModel.IPV6.value:
-                self.genre = TicketItemGenreModel.IPV6.value
-                self.value = self._validate_ipv6(value)
-
-            case _:
-                raise TicketItemModelGenreNonValidException()
+        self.value = self._validate_value(value)
 
         self.provider_id = self._validate_provider_id(provider_id)
 
@@ -95,6 +83,85 @@ class TicketItemModel(BaseModel):
             'update_max_time': 172800 # 2 days
         }
 
+    @classmethod
+    def from_validated(cls,
+        ticket_id: str,
+        ticket_item_id: str,
+        provider_id: str,
+        value: str,
+        genre: str,
+        is_active: bool = True,
+        is_duplicate: bool = False,
+        is_whitelisted: bool = False,
+        is_error: bool = False
+    ) -> 'TicketItemModel':
+        """
+        Builds an item from parameters already validated elsewhere, such as by the originating ticket.
+
+        :param ticket_id: a valid ticket identifier.
+        :param ticket_item_id: a valid ticket item identifier.
+        :param provider_id: a valid account identifier assigned to the ticket item.
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :param genre: a valid ticket item type.
+        :return: a new ticket item.
+        """
+
+        item = cls.__new__(cls)
+
+        item.ticket_id = ticket_id
+
+        item.ticket_item_id = ticket_item_id
+
+        item.genre = genre
+
+        item.value = value
+
+        item.provider_id = provider_id
+
+        item.status = TicketItemStatusModel.PENDING.value
+
+        item.is_active = is_active
+
+        item.is_duplicate = is_duplicate
+
+        item.is_whitelisted = is_whitelisted
+
+        item.is_error = is_error
+
+        item.settings = {
+            'update_max_time': 172800 # 2 days
+        }
+
+        return item
+
+    def packed_value(self) -> int | None:
+        """
+        Converts the IPv4 or IPv6 value into its integer form, e.g. for numeric comparisons.
+
+        The item keeps its string value, see TicketModel.pack to keep a whole ticket packed.
+
+        :return: the packed address or None for FQDN items.
+        """
+
+        match self.genre:
+            case TicketItemGenreModel.IPV4.value:
+                return IPv4Array.pack(self.value)
+
+            case TicketItemGenreModel.IPV6.value:
+                return IPv6Array.pack(self.value)
+
+        return None
+
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        A new genre needs the value to be checked again.
+
+        :param changed: the names of the changed fields.
+        """
+
+        if 'genre' in changed and 'value' not in changed:
+            self._validate_value(self.value)
+
     def _validate_ticket_id(self, value: str) -> str | Exception:
         """
         Validates the ticket identifier.
@@ -103,12 +170,10 @@ class TicketItemModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketRule.TICKET_ID)
+        plan = RulePlan.compile(TicketRule.TICKET_ID)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise TicketItemModelTicketIdentifierNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemModelTicketIdentifierNonValidException(plan.errors(value))
 
         return value
 
@@ -120,15 +185,47 @@ class TicketItemModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketItemRule.TICKET_ITEM_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketItemRule.TICKET_ITEM_ID)
 
-        if not validator.is_valid():
-            raise TicketItemModelTicketIdentifierNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemModelTicketIdentifierNonValidException(plan.errors(value))
 
         return value
 
+    def _validate_genre(self, value: str) -> str | Exception:
+        """
+        Validates the ticket item genre.
+
+        :param value: a valid ticket item type.
+        :return: the same value.
+        """
+
+        try:
+            return TicketItemGenreModel(value).value
+
+        except ValueError:
+            raise TicketItemModelGenreNonValidException()
+
+    def _validate_value(self, value: str) -> str | Exception:
+        """
+        Validates the value against the ticket item genre.
+
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :return: the same value.
+        """
+
+        match self.genre:
+            case TicketItemGenreModel.FQDN.value:
+                return self._validate_fqdn(value)
+
+            case TicketItemGenreModel.IPV4.value:
+                return self._validate_ipv4(value)
+
+            case TicketItemGenreModel.IPV6.value:
+                return self._validate_ipv6(value)
+
+        raise TicketItemModelGenreNonValidException()
+
     def _validate_fqdn(self, value: str) -> list | Exception:
         """
         Validates the FQDN genre.
@@ -140,12 +237,10 @@ class TicketItemModel(BaseModel):
         if not value or not len(value):
             raise TicketItemModelFQDNMissingException()
 
-        validator = Validator(value, TicketRule.FQDN)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketRule.FQDN)
 
-        if not validator.is_valid():
-            raise TicketItemModelFQDNNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemModelFQDNNonValidException(plan.errors(value))
 
         return value
 
@@ -160,12 +255,10 @@ class TicketItemModel(BaseModel):
         if not value or not len(value):
             raise TicketItemModelIPv4MissingException()
 
-        validator = Validator(value, TicketRule.IPV4)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketRule.IPV4)
 
-        if not validator.is_valid():
-            raise TicketItemModelIPv4NonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemModelIPv4NonValidException(plan.errors(value))
 
         return value
 
@@ -180,12 +273,10 @@ class TicketItemModel(BaseModel):
         if not value or not len(value):
             raise TicketItemModelIPv6MissingException()
 
-        validator = Validator(value, TicketRule.IPV6)
+        plan = RulePlan.compile(TicketRule.IPV6)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise TicketItemModelIPv6NonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemModelIPv6NonValidException(plan.errors(value))
 
         return value
 
@@ -200,12 +291,10 @@ class TicketItemModel(BaseModel):
         if not value or not len(value):
             raise TicketItemModelProviderIdentifierMissingException()
 
-        validator = Validator(value, AccountRule.ACCOUNT_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(AccountRule.ACCOUNT_ID)
 
-        if not validator.is_valid():
-            raise TicketItemModelProviderIdentifierNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemModelProviderIdentifierNonValidException(plan.errors(value))
 
         return value
 
@@ -1,13 +1,14 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
-from piracyshield_component.utils.time import Time, TimeFormatException
+from piracyshield_data_model.plan import RulePlan
+from piracyshield_data_model.timestamp import Timestamp, TimestampFormatException
 
 from piracyshield_data_model.ticket.item.processed.rule import TicketItemProcessedRule
 
 from piracyshield_data_model.ticket.item.status.model import TicketItemStatusModel
 
-from piracyshield_data_model.ticket.rule import TicketRule
+from piracyshield_data_model.ticket.item.genre.classifier import TicketItemGenreClassifier
+
 from piracyshield_data_model.account.rule import AccountRule
 
 class TicketItemProcessedModel(BaseModel):
@@ -16,15 +17,26 @@ class TicketItemProcessedModel(BaseModel):
     Ticket item processed data modeling class.
     """
 
-    provider_id = None
-
-    value = None
-
-    status = None
-
-    timestamp = None
-
-    note = None
+    __slots__ = (
+        'provider_id',
+        'value',
+        'genre',
+        'status',
+        'timestamp',
+        'timestamp_epoch',
+        'note'
+    )
+
+    # not editable by a patch
+    _identifiers = (
+        'provider_id',
+    )
+
+    # fields a patch may clear
+    _optional = (
+        'timestamp',
+        'note'
+    )
 
     def __init__(self, provider_id: str, value: str, timestamp: str = None, note: str = None):
         """
@@ -36,6 +48,12 @@ class TicketItemProcessedModel(BaseModel):
         :param note: an optional string.
         """
 
+        self.timestamp = None
+
+        self.timestamp_epoch = None
+
+        self.note = None
+
         self.provider_id = self._validate_provider_id(provider_id)
 
         self.value = self._validate_value(value)
@@ -48,6 +66,16 @@ class TicketItemProcessedModel(BaseModel):
         if note:
             self.note = self._validate_note(note)
 
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        Clears the epoch value of a cleared timestamp.
+
+        :param changed: the names of the changed fields.
+        """
+
+        if 'timestamp' in changed and self.timestamp is None:
+            self.timestamp_epoch = None
+
     def _validate_provider_id(self, value: str) -> str | Exception:
         """
         Validates the provider account identifier.
@@ -59,18 +87,16 @@ class TicketItemProcessedModel(BaseModel):
         if not value or not len(value):
             raise TicketItemProcessedModelProviderIdentifierMissingException()
 
-        validator = Validator(value, AccountRule.ACCOUNT_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(AccountRule.ACCOUNT_ID)
 
-        if not validator.is_valid():
-            raise TicketItemProcessedModelProviderIdentifierException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemProcessedModelProviderIdentifierException(plan.errors(value))
 
         return value
 
     def _validate_value(self, value: str) -> str | Exception:
         """
-        Validates the ticket item value.
+        Validates the ticket item value against its detected genre only, recording the genre.
 
         :param value: a valid FQDN, IPv4 or IPv6.
         :return: the same value.
@@ -79,88 +105,29 @@ class TicketItemProcessedModel(BaseModel):
         if not value or not len(value):
             raise TicketItemProcessedModelValueMissingException()
 
-        validators = [
-            self._validate_fqdn,
-            self._validate_ipv4,
-            self._validate_ipv6
-        ]
-
-        is_valid = False
+        genre = TicketItemGenreClassifier.classify(value)
 
-        for validator in validators:
-            if validator(value):
-                is_valid = True
-
-        if not is_valid:
+        if genre is None:
             raise TicketItemProcessedModelValueNonValidException()
 
-        return value
-
-    def _validate_fqdn(self, value: str) -> list | Exception:
-        """
-        Validates the FQDN genre.
-
-        :param value: a valid FQDN.
-        :return: the same value.
-        """
-
-        validator = Validator(value, TicketRule.FQDN)
-
-        validator.validate()
-
-        if not validator.is_valid():
-            return False
-
-        return value
-
-    def _validate_ipv4(self, value: str) -> list | Exception:
-        """
-        Validates the IPv4 genre.
-
-        :param value: a valid IPv4.
-        :return: the same value.
-        """
-
-        validator = Validator(value, TicketRule.IPV4)
-
-        validator.validate()
-
-        if not validator.is_valid():
-            return False
-
-        return value
-
-    def _validate_ipv6(self, value: str) -> list | Exception:
-        """
-        Validates the IPv6 genre.
-
-        :param value: a valid IPv6.
-        :return: the same value.
-        """
-
-        validator = Validator(value, TicketRule.IPV6)
-
-        validator.validate()
-
-        if not validator.is_valid():
-            return False
+        self.genre = genre
 
         return value
 
     def _validate_timestamp(self, value: str) -> list | Exception:
         """
-        Validates the timestamp against the ISO8601 format.
+        Validates the timestamp against the ISO8601 format, keeping its epoch value.
 
         :param value: a valid ISO8601 date.
         :return: the same value.
         """
 
         try:
-            Time.is_valid_iso8601(value)
+            self.timestamp_epoch = Timestamp.epoch(value)
 
             return value
 
-        except TimeFormatException:
+        except TimestampFormatException:
             raise TicketItemProcessedModelTimestampNonValidException()
 
     def _validate_note(self, value: str) -> str | Exception:
@@ -171,12 +138,10 @@ class TicketItemProcessedModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketItemProcessedRule.NOTE)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketItemProcessedRule.NOTE)
 
-        if not validator.is_valid():
-            raise TicketItemProcessedModelNoteNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketItemProcessedModelNoteNonValidException(plan.errors(value))
 
         return value
 
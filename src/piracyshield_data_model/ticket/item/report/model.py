@@ -0,0 +1,358 @@
+from piracyshield_data_model.plan import RulePlan
+from piracyshield_data_model.timestamp import Timestamp, TimestampFormatException
+
+from piracyshield_data_model.ticket.item.unprocessed.reason.model import TicketItemUnprocessedReasonModel
+
+from piracyshield_data_model.ticket.item.unprocessed.rule import TicketItemUnprocessedRule
+from piracyshield_data_model.ticket.item.processed.rule import TicketItemProcessedRule
+
+from piracyshield_data_model.ticket.item.status.model import TicketItemStatusModel
+
+from piracyshield_data_model.ticket.item.genre.classifier import TicketItemGenreClassifier
+
+from piracyshield_data_model.account.rule import AccountRule
+
+class TicketItemReportModel:
+
+    """
+    Bulk report of processed and unprocessed ticket items from a single provider.
+
+    The provider identifier is validated once, then every (value, status, reason, timestamp, note)
+    row is validated in a single pass. Valid rows are kept as parallel columns, non valid ones
+    are collected in a per-row error list instead of aborting the whole report.
+    """
+
+    # status codes, by position
+    STATUSES = (
+        TicketItemStatusModel.PROCESSED.value,
+        TicketItemStatusModel.UNPROCESSED.value
+    )
+
+    def __init__(self, provider_id: str, rows: list):
+        """
+        Validates the parameters.
+
+        :param provider_id: the account identifier of the reporting provider.
+        :param rows: an iterable of (value, status, reason, timestamp, note) tuples, reason, timestamp and note may be None.
+        """
+
+        self.provider_id = self._validate_provider_id(provider_id)
+
+        self.values = []
+
+        self.genres = []
+
+        # status code of each row
+        self.statuses = bytearray()
+
+        self.reasons = []
+
+        self.timestamps = []
+
+        # seconds since the epoch of each timestamp
+        self.timestamp_epochs = []
+
+        self.notes = []
+
+        # (index, row, exception) of each non valid row
+        self.errors = []
+
+        for index, row in enumerate(rows):
+            try:
+                value, status, reason, timestamp, note = row
+
+            except (TypeError, ValueError):
+                self.errors.append((index, row, TicketItemReportModelRowNonValidException()))
+
+                continue
+
+            try:
+                genre = self._validate_value(value)
+
+                status = self._validate_status(status)
+
+                if status == TicketItemStatusModel.UNPROCESSED.value:
+                    reason = self._validate_reason(reason)
+
+                # processed items carry no reason
+                else:
+                    reason = None
+
+                if timestamp:
+                    timestamp_epoch = self._validate_timestamp(timestamp)
+
+                else:
+                    timestamp = timestamp_epoch = None
+
+                if note:
+                    self._validate_note(note, status)
+
+                else:
+                    note = None
+
+            except TicketItemReportModelRowException as e:
+                self.errors.append((index, row, e))
+
+                continue
+
+            self.values.append(value)
+
+            self.genres.append(genre)
+
+            self.statuses.append(self.STATUSES.index(status))
+
+            self.reasons.append(reason)
+
+            self.timestamps.append(timestamp)
+
+            self.timestamp_epochs.append(timestamp_epoch)
+
+            self.notes.append(note)
+
+    def _validate_provider_id(self, value: str) -> str | Exception:
+        """
+        Validates the provider account identifier.
+
+        :param value: a valid account identifier.
+        :return: the same value.
+        """
+
+        if not value or not len(value):
+            raise TicketItemReportModelProviderIdentifierMissingException()
+
+        plan = RulePlan.compile(AccountRule.ACCOUNT_ID)
+
+        if not plan.is_valid(value):
+            raise TicketItemReportModelProviderIdentifierNonValidException(plan.errors(value))
+
+        return value
+
+    def _validate_value(self, value: str) -> str | Exception:
+        """
+        Validates the ticket item value.
+
+        :param value: a valid FQDN, IPv4 or IPv6.
+        :return: the detected genre.
+        """
+
+        if not value or not isinstance(value, str):
+            raise TicketItemReportModelValueMissingException()
+
+        genre = TicketItemGenreClassifier.classify(value)
+
+        if genre is None:
+            raise TicketItemReportModelValueNonValidException()
+
+        return genre
+
+    def _validate_status(self, value: str) -> str | Exception:
+        """
+        Validates the reported status.
+
+        :param value: either processed or unprocessed.
+        :return: the same value.
+        """
+
+        if value not in self.STATUSES:
+            raise TicketItemReportModelStatusNonValidException()
+
+        return value
+
+    def _validate_reason(self, value: str) -> str | Exception:
+        """
+        Validates the unprocessed reason.
+
+        :param value: a valid predefined reason.
+        :return: the same value.
+        """
+
+        if not value:
+            raise TicketItemReportModelReasonMissingException()
+
+        try:
+            return TicketItemUnprocessedReasonModel(value).value
+
+        except ValueError:
+            raise TicketItemReportModelReasonNonValidException()
+
+    def _validate_timestamp(self, value: str) -> float | Exception:
+        """
+        Validates the timestamp against the ISO8601 format.
+
+        Reports usually repeat a handful of timestamps, which are parsed only once.
+
+        :param value: a valid ISO8601 date.
+        :return: the seconds since the epoch.
+        """
+
+        # unhashable values would break the parse memo
+        if not isinstance(value, str):
+            raise TicketItemReportModelTimestampNonValidException()
+
+        try:
+            return Timestamp.epoch(value)
+
+        except TimestampFormatException:
+            raise TicketItemReportModelTimestampNonValidException()
+
+    def _validate_note(self, value: str, status: str) -> str | Exception:
+        """
+        Validates the note text with the rules of the reported status.
+
+        :param value: a string.
+        :param status: either processed or unprocessed.
+        :return: the same value.
+        """
+
+        if status == TicketItemStatusModel.UNPROCESSED.value:
+            plan = RulePlan.compile(TicketItemUnprocessedRule.NOTE)
+
+        else:
+            plan = RulePlan.compile(TicketItemProcessedRule.NOTE)
+
+        if not plan.is_valid(value):
+            raise TicketItemReportModelNoteNonValidException(plan.errors(value))
+
+        return value
+
+    def rows_with(self, status: str) -> list:
+        """
+        Lists the valid rows reporting a status.
+
+        :param status: either processed or unprocessed.
+        :return: a list of row indexes.
+        """
+
+        code = self.STATUSES.index(self._validate_status(status))
+
+        return [row for row, row_status in enumerate(self.statuses) if row_status == code]
+
+    def row(self, row: int) -> dict:
+        """
+        Exports a single valid row with the same layout of the processed and unprocessed models.
+
+        :param row: the row index.
+        :return: the item dictionary.
+        """
+
+        status = self.STATUSES[self.statuses[row]]
+
+        output = {
+            'provider_id': self.provider_id,
+            'value': self.values[row],
+            'genre': self.genres[row],
+            'status': status
+        }
+
+        if status == TicketItemStatusModel.UNPROCESSED.value:
+            output['reason'] = self.reasons[row]
+
+        output['timestamp'] = self.timestamps[row]
+
+        output['timestamp_epoch'] = self.timestamp_epochs[row]
+
+        output['note'] = self.notes[row]
+
+        return output
+
+    def to_dicts(self, start: int = 0, stop: int = None) -> list:
+        """
+        Exports a range of valid rows.
+
+        :param start: first row.
+        :param stop: row after the last one, defaults to the end of the report.
+        :return: a list of item dictionaries.
+        """
+
+        return [self.row(row) for row in range(start, len(self) if stop is None else stop)]
+
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+class TicketItemReportModelProviderIdentifierMissingException(Exception):
+
+    """
+    Missing provider account identifier.
+    """
+
+    pass
+
+class TicketItemReportModelProviderIdentifierNonValidException(Exception):
+
+    """
+    Non valid provider account identifier.
+    """
+
+    pass
+
+class TicketItemReportModelRowException(Exception):
+
+    """
+    Non valid report row.
+    """
+
+    pass
+
+class TicketItemReportModelRowNonValidException(TicketItemReportModelRowException):
+
+    """
+    Malformed report row.
+    """
+
+    pass
+
+class TicketItemReportModelValueMissingException(TicketItemReportModelRowException):
+
+    """
+    Missing ticket item value.
+    """
+
+    pass
+
+class TicketItemReportModelValueNonValidException(TicketItemReportModelRowException):
+
+    """
+    Non valid ticket item value.
+    """
+
+    pass
+
+class TicketItemReportModelStatusNonValidException(TicketItemReportModelRowException):
+
+    """
+    Non valid status.
+    """
+
+    pass
+
+class TicketItemReportModelReasonMissingException(TicketItemReportModelRowException):
+
+    """
+    Missing reason.
+    """
+
+    pass
+
+class TicketItemReportModelReasonNonValidException(TicketItemReportModelRowException):
+
+    """
+    Non valid reason.
+    """
+
+    pass
+
+class TicketItemReportModelTimestampNonValidException(TicketItemReportModelRowException):
+
+    """
+    Non valid timestamp.
+    """
+
+    pass
+
+class TicketItemReportModelNoteNonValidException(TicketItemReportModelRowException):
+
+    """
+    Non valid note.
+    """
+
+    pass
@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan, ParallelValidation
 
 from piracyshield_data_model.ticket.status.model import TicketStatusModel
 
@@ -18,25 +18,43 @@ class TicketModel(BaseModel):
     Ticket data modeling class.
     """
 
-    ticket_id = None
-
-    genre = None
-
-    description = None
-
-    fqdn = []
-
-    ipv4 = []
-
-    ipv6 = []
-
-    assigned_to = []
-
-    status = None
-
-    settings = None
-
-    def __init__(self, ticket_id: str, dda_id: str, fqdn: list, ipv4: list, ipv6: list, assigned_to: list, description: str = None):
+    __slots__ = (
+        'ticket_id',
+        'dda_id',
+        'genre',
+        'description',
+        'fqdn',
+        'ipv4',
+        'ipv6',
+        'assigned_to',
+        'status',
+        'settings',
+        '_rejected'
+    )
+
+    # not editable by a patch
+    _identifiers = (
+        'ticket_id',
+        'dda_id'
+    )
+
+    # empty lists are not stored
+    _defaults = {
+        'fqdn': [],
+        'ipv4': [],
+        'ipv6': []
+    }
+
+    # fields a patch may clear
+    _optional = (
+        'description',
+        'fqdn',
+        'ipv4',
+        'ipv6',
+        'assigned_to'
+    )
+
+    def __init__(self, ticket_id: str, dda_id: str, fqdn: list, ipv4: list, ipv6: list, assigned_to: list, description: str = None, partial: bool = False, parallel: ParallelValidation = None, packed: bool = False):
         """
         Validates the parameters.
 
@@ -47,8 +65,19 @@ class TicketModel(BaseModel):
         :param ipv6: a list of IPv6 items.
         :param assigned_to: a list of account identifiers assigned to the ticket.
         :param description: a generic, non mandatory, description of the ticket.
+        :param partial: drop the non valid FQDN, IPv4 and IPv6 items instead of refusing the whole ticket.
+        :param parallel: optional settings to validate oversized lists in a process pool.
+        :param packed: store the IPv4 and IPv6 lists packed as integers, exported in their canonical form, see pack.
         """
 
+        self.description = None
+
+        self.fqdn = []
+
+        self.ipv4 = []
+
+        self.ipv6 = []
+
         # FQDN, IPv4 and IPv6 should never be all empty
         if not any([bool(fqdn), bool(ipv4), bool(ipv6)]):
             raise TicketModelNoDataException
@@ -60,14 +89,30 @@ class TicketModel(BaseModel):
         if description:
             self.description = self._validate_description(description)
 
-        if fqdn:
-            self.fqdn = self._validate_fqdn(fqdn)
+        # non valid items dropped in partial mode
+        self._rejected = {}
+
+        # the lists share one process pool
+        if parallel is not None:
+            parallel = parallel.session()
 
-        if ipv4:
-            self.ipv4 = self._validate_ipv4(ipv4)
+        try:
+            if fqdn:
+                self.fqdn = self._validate_fqdn(fqdn, partial, parallel)
 
-        if ipv6:
-            self.ipv6 = self._validate_ipv6(ipv6)
+            if ipv4:
+                self.ipv4 = self._validate_ipv4(ipv4, partial, parallel)
+
+            if ipv6:
+                self.ipv6 = self._validate_ipv6(ipv6, partial, parallel)
+
+        finally:
+            if parallel is not None:
+                parallel.close()
+
+        # every item might have been dropped
+        if partial and not any([bool(self.fqdn), bool(self.ipv4), bool(self.ipv6)]):
+            raise TicketModelNoDataException
 
         self.assigned_to = self._validate_assigned_to(assigned_to) if assigned_to else None
 
@@ -83,6 +128,218 @@ class TicketModel(BaseModel):
             'report_error_time': 86400 # 1 day
         }
 
+        if packed:
+            self.pack()
+
+    def fan_out(self, provider_ids: list, identifier: callable, chunk_size: int = 1000):
+        """
+        Lazily builds the ticket items, one for each value and provider pair.
+
+        The values have already been validated by the ticket and each provider identifier
+        is validated once, so the items are built without validating them again.
+
+        :param provider_ids: an iterable of provider account identifiers.
+        :param identifier: a callable returning a new ticket item identifier at each call.
+        :param chunk_size: maximum number of items per chunk.
+        :return: a generator of lists of ticket items.
+        """
+
+        if chunk_size < 1:
+            raise TicketModelChunkSizeNonValidException()
+
+        # read once per value below, so generators are collected here
+        provider_ids = RulePlan.compile(AccountRule.ACCOUNT_ID).require_all(
+            provider_ids,
+            TicketModelProviderIdMissingException,
+            TicketModelProviderIdNonValidException
+        )
+
+        # only needed here, kept out of the import of the ticket model
+        from piracyshield_data_model.ticket.item.model import TicketItemModel
+        from piracyshield_data_model.ticket.item.genre.model import TicketItemGenreModel
+        from piracyshield_data_model.ticket.item.rule import TicketItemRule
+
+        item_plan = RulePlan.compile(TicketItemRule.TICKET_ITEM_ID)
+
+        chunk = []
+
+        for genre, values in ((TicketItemGenreModel.FQDN.value, self.fqdn), (TicketItemGenreModel.IPV4.value, self.ipv4), (TicketItemGenreModel.IPV6.value, self.ipv6)):
+            for value in values:
+                for provider_id in provider_ids:
+                    ticket_item_id = identifier()
+
+                    if not item_plan.is_valid(ticket_item_id):
+                        raise TicketModelTicketItemIdNonValidException(item_plan.errors(ticket_item_id))
+
+                    chunk.append(TicketItemModel.from_validated(self.ticket_id, ticket_item_id, provider_id, value, genre))
+
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+
+                        chunk = []
+
+        if chunk:
+            yield chunk
+
+    def pack(self) -> 'TicketModel':
+        """
+        Stores the IPv4 and IPv6 lists packed as integers, e.g. for big tickets loaded with from_trusted.
+
+        The packed lists still iterate, index and export as strings, but in their canonical form:
+        an IPv6 such as 2001:DB8:0000::1 comes back as 2001:db8::1, so the exported values may
+        differ from the original input.
+
+        Values accepted by the rules but not by the platform, such as an IPv6 with a zone index,
+        raise the non valid exception of their list.
+
+        :return: the same model.
+        """
+
+        from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+        if not isinstance(self.ipv4, IPv4Array):
+            self.ipv4 = self._pack(IPv4Array, self.ipv4, TicketModelIPv4NonValidException)
+
+        if not isinstance(self.ipv6, IPv6Array):
+            self.ipv6 = self._pack(IPv6Array, self.ipv6, TicketModelIPv6NonValidException)
+
+        return self
+
+    @staticmethod
+    def _pack(array: type, values: list, exception: type) -> any:
+        """
+        Packs a list, reporting the values that cannot be packed as the validation does.
+        """
+
+        try:
+            return array(values)
+
+        except (OSError, ValueError):
+            pass
+
+        invalid = []
+
+        for index, value in enumerate(values):
+            try:
+                array.pack(value)
+
+            except (OSError, ValueError) as error:
+                invalid.append((index, value, [str(error)]))
+
+        raise exception(invalid)
+
+    def unpack(self) -> 'TicketModel':
+        """
+        Stores the IPv4 and IPv6 lists as strings again.
+
+        :return: the same model.
+        """
+
+        from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+        if isinstance(self.ipv4, IPv4Array):
+            self.ipv4 = self.ipv4.tolist()
+
+        if isinstance(self.ipv6, IPv6Array):
+            self.ipv6 = self.ipv6.tolist()
+
+        return self
+
+    def packed_ipv4(self) -> 'IPv4Array':
+        """
+        Returns the IPv4 list packed as 32-bit integers.
+
+        :return: the stored array when packed, otherwise a compact copy.
+        """
+
+        from piracyshield_data_model.address import IPv4Array
+
+        return self.ipv4 if isinstance(self.ipv4, IPv4Array) else IPv4Array(self.ipv4)
+
+    def packed_ipv6(self) -> 'IPv6Array':
+        """
+        Returns the IPv6 list packed as 128-bit values.
+
+        :return: the stored array when packed, otherwise a compact copy.
+        """
+
+        from piracyshield_data_model.address import IPv6Array
+
+        return self.ipv6 if isinstance(self.ipv6, IPv6Array) else IPv6Array(self.ipv6)
+
+    def to_dict(self, copy: bool = False, deep: bool = False) -> dict:
+        """
+        Exports the set data into a dictionary, packed lists as strings.
+
+        :param copy: shallow copies lists, dictionaries and sets.
+        :param deep: deep copies every value.
+        :return: a dictionary of the non empty fields.
+        """
+
+        output = super().to_dict(copy, deep)
+
+        for key in ('ipv4', 'ipv6'):
+            value = output.get(key)
+
+            # packed arrays, checked without importing them
+            if value is not None and not isinstance(value, list):
+                output[key] = value.tolist()
+
+        return output
+
+    @property
+    def rejected(self) -> dict:
+        """
+        Non valid items dropped in partial mode.
+
+        :return: a dictionary of (index, value, errors) lists by FQDN, IPv4 and IPv6.
+        """
+
+        # tickets loaded from storage have nothing rejected
+        return self._rejected if self._rejected is not None else {}
+
+    @staticmethod
+    def validate_lists(fqdn: list = None, ipv4: list = None, ipv6: list = None, parallel: ParallelValidation = None) -> dict:
+        """
+        Validates the FQDN, IPv4 and IPv6 lists in one pass each, reporting every non valid item.
+
+        :param fqdn: a list of FQDN items.
+        :param ipv4: a list of IPv4 items.
+        :param ipv6: a list of IPv6 items.
+        :param parallel: optional settings to validate oversized lists in a process pool.
+        :return: a dictionary of (index, value, errors) lists by FQDN, IPv4 and IPv6, empty if everything is valid.
+        """
+
+        report = {}
+
+        # the lists share one process pool
+        if parallel is not None:
+            parallel = parallel.session()
+
+        try:
+            for name, value, rules in (('fqdn', fqdn, TicketRule.FQDN), ('ipv4', ipv4, TicketRule.IPV4), ('ipv6', ipv6, TicketRule.IPV6)):
+                if value:
+                    valid, invalid = RulePlan.compile(rules).partition(value, parallel)
+
+                    if invalid:
+                        report[name] = invalid
+
+        finally:
+            if parallel is not None:
+                parallel.close()
+
+        return report
+
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        FQDN, IPv4 and IPv6 should never be all empty, not even after a patch.
+
+        :param changed: the names of the changed fields.
+        """
+
+        if not any([bool(self.fqdn), bool(self.ipv4), bool(self.ipv6)]):
+            raise TicketModelNoDataException
+
     def _validate_ticket_id(self, value: str) -> str | Exception:
         """
         Validates the ticket identifier.
@@ -91,12 +348,10 @@ class TicketModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketRule.TICKET_ID)
+        plan = RulePlan.compile(TicketRule.TICKET_ID)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise TicketModelTicketIdException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketModelTicketIdException(plan.errors(value))
 
         return value
 
@@ -111,12 +366,10 @@ class TicketModel(BaseModel):
         if not value or not len(value):
             raise TicketModelDDAIdMissingException()
 
-        validator = Validator(value, DDARule.DDA_ID)
-
-        validator.validate()
+        plan = RulePlan.compile(DDARule.DDA_ID)
 
-        if not validator.is_valid():
-            raise TicketModelDDAIdNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketModelDDAIdNonValidException(plan.errors(value))
 
         return value
 
@@ -128,77 +381,87 @@ class TicketModel(BaseModel):
         :return: the same value.
         """
 
-        validator = Validator(value, TicketRule.DESCRIPTION)
+        plan = RulePlan.compile(TicketRule.DESCRIPTION)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise TicketModelDescriptionException(validator.errors)
+        if not plan.is_valid(value):
+            raise TicketModelDescriptionException(plan.errors(value))
 
         return value
 
-    def _validate_fqdn(self, value: list) -> list | Exception:
+    def _validate_fqdn(self, value: list, partial: bool = False, parallel: ParallelValidation = None) -> list | Exception:
         """
         Validates the ticket FQDN list.
 
         :param value: a list of FQDNs.
-        :return: the same value.
+        :param partial: drop the non valid items instead of raising.
+        :param parallel: optional settings to validate oversized lists in a process pool.
+        :return: the same value or, in partial mode, the list of valid items.
         """
 
         if not value or not len(value):
             raise TicketModelFQDNMissingException()
 
-        for item in value:
-            validator = Validator(item, TicketRule.FQDN)
+        valid, invalid = RulePlan.compile(TicketRule.FQDN).partition(value, parallel)
 
-            validator.validate()
+        if not invalid:
+            return value
 
-            if not validator.is_valid():
-                raise TicketModelFQDNNonValidException(validator.errors)
+        if not partial:
+            raise TicketModelFQDNNonValidException(invalid)
 
-        return value
+        self._rejected['fqdn'] = invalid
 
-    def _validate_ipv4(self, value: list) -> list | Exception:
+        return valid
+
+    def _validate_ipv4(self, value: list, partial: bool = False, parallel: ParallelValidation = None) -> list | Exception:
         """
         Validates the ticket IPv4 list.
 
         :param value: a list of IPv4s.
-        :return: the same value.
+        :param partial: drop the non valid items instead of raising.
+        :param parallel: optional settings to validate oversized lists in a process pool.
+        :return: the same value or, in partial mode, the list of valid items.
         """
 
         if not value or not len(value):
             raise TicketModelIPv4MissingException()
 
-        for item in value:
-            validator = Validator(item, TicketRule.IPV4)
+        valid, invalid = RulePlan.compile(TicketRule.IPV4).partition(value, parallel)
 
-            validator.validate()
+        if not invalid:
+            return value
 
-            if not validator.is_valid():
-                raise TicketModelIPv4NonValidException(validator.errors)
+        if not partial:
+            raise TicketModelIPv4NonValidException(invalid)
 
-        return value
+        self._rejected['ipv4'] = invalid
+
+        return valid
 
-    def _validate_ipv6(self, value: list) -> list | Exception:
+    def _validate_ipv6(self, value: list, partial: bool = False, parallel: ParallelValidation = None) -> list | Exception:
         """
         Validates the ticket IPv6 list.
 
         :param value: a list of IPv6s.
-        :return: the same value.
+        :param partial: drop the non valid items instead of raising.
+        :param parallel: optional settings to validate oversized lists in a process pool.
+        :return: the same value or, in partial mode, the list of valid items.
         """
 
         if not value or not len(value):
             raise TicketModelIPv6MissingException()
 
-        for item in value:
-            validator = Validator(item, TicketRule.IPV6)
+        valid, invalid = RulePlan.compile(TicketRule.IPV6).partition(value, parallel)
 
-            validator.validate()
+        if not invalid:
+            return value
 
-            if not validator.is_valid():
-                raise TicketModelIPv6NonValidException(validator.errors)
+        if not partial:
+            raise TicketModelIPv6NonValidException(invalid)
 
-        return value
+        self._rejected['ipv6'] = invalid
+
+        return valid
 
     def _validate_assigned_to(self, value: list) -> list | Exception:
         """
@@ -209,12 +472,10 @@ class TicketModel(BaseModel):
         """
 
         if not value or not len(value):
-            validator = Validator(item, AccountRule.ACCOUNT_ID)
-
-            validator.validate()
+            plan = RulePlan.compile(AccountRule.ACCOUNT_ID)
 
-            if not validator.is_valid():
-                raise TicketModelAssignedToNonValidException(validator.errors)
+            if not plan.is_valid(item):
+                raise TicketModelAssignedToNonValidException(plan.errors(item))
 
         return value
 
@@ -313,3 +574,35 @@ class TicketModelAssignedToNonValidException(Exception):
     """
 
     pass
+
+class TicketModelProviderIdMissingException(Exception):
+
+    """
+    Missing provider account identifier.
+    """
+
+    pass
+
+class TicketModelProviderIdNonValidException(Exception):
+
+    """
+    Non valid provider account identifier.
+    """
+
+    pass
+
+class TicketModelTicketItemIdNonValidException(Exception):
+
+    """
+    Non valid ticket item identifier.
+    """
+
+    pass
+
+class TicketModelChunkSizeNonValidException(Exception):
+
+    """
+    Non valid chunk size.
+    """
+
+    pass
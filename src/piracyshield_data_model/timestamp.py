@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import re
+
+class Timestamp:
+
+    """
+    Fast ISO8601 parsing into epoch seconds.
+
+    Parsed strings are memoized, as reports usually repeat a handful of timestamps.
+
+    The accepted profile is pinned by FORMAT instead of datetime.fromisoformat, whose grammar
+    grew between Python 3.10 and 3.11, so the same dates are accepted on every version.
+    """
+
+    # YYYY-MM-DD, optionally followed by T or a space, HH:MM[:SS[.f to ffffff]] and Z or a ±HH:MM offset
+    FORMAT = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})(?:[T ]([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,6}))?)?([Zz]|[+-][0-9]{2}:[0-9]{2})?)?')
+
+    @staticmethod
+    def epoch(value: str) -> float | Exception:
+        """
+        Parses an ISO8601 date.
+
+        Dates without an offset are taken as UTC. The basic format (20240101T000000Z), week and
+        ordinal dates are not accepted.
+
+        :param value: a valid ISO8601 date, see FORMAT.
+        :return: the seconds since the epoch.
+        """
+
+        # checked before the memo, which cannot hash lists and dictionaries
+        if not isinstance(value, str):
+            raise TimestampFormatException()
+
+        return Timestamp._parse(value)
+
+    @staticmethod
+    @lru_cache(maxsize = 4096)
+    def _parse(value: str) -> float | Exception:
+        """
+        Parses an ISO8601 string, memoized.
+        """
+
+        match = Timestamp.FORMAT.fullmatch(value)
+
+        if match is None:
+            raise TimestampFormatException()
+
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+        try:
+            if offset is None or offset in ('Z', 'z'):
+                tzinfo = timezone.utc
+
+            else:
+                hours, minutes = int(offset[1:3]), int(offset[4:6])
+
+                if minutes > 59:
+                    raise ValueError()
+
+                delta = timedelta(hours = hours, minutes = minutes)
+
+                tzinfo = timezone(-delta if offset[0] == '-' else delta)
+
+            parsed = datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour or 0),
+                int(minute or 0),
+                int(second or 0),
+                int((fraction or '0').ljust(6, '0')),
+                tzinfo
+            )
+
+        # out of range fields, such as the 13th month or a +24:00 offset
+        except ValueError:
+            raise TimestampFormatException()
+
+        return parsed.timestamp()
+
+    @staticmethod
+    def cache_info() -> tuple:
+        """
+        Reports the memo statistics.
+
+        :return: the lru_cache statistics.
+        """
+
+        return Timestamp._parse.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """
+        Empties the memo.
+        """
+
+        Timestamp._parse.cache_clear()
+
+class TimestampFormatException(Exception):
+
+    """
+    Non valid ISO8601 date.
+    """
+
+    pass
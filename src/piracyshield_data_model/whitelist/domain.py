@@ -0,0 +1,128 @@
+from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
+
+class WhitelistDomainMatcher:
+
+    """
+    Suffix matcher for the FQDN whitelist items.
+
+    Domains are stored in a trie of their labels in reverse order (com -> example -> www),
+    so a lookup walks one node per label and matches the domain itself or any of its parents.
+    """
+
+    # marks the node of a whitelisted domain
+    ITEM = None
+
+    def __init__(self, items: list = ()):
+        """
+        Builds the index.
+
+        :param items: a collection of whitelist models, non active ones are skipped.
+        """
+
+        self._root = {}
+
+        self._count = 0
+
+        for item in items:
+            self.add(item)
+
+    @staticmethod
+    def labels(value: str) -> list:
+        """
+        Splits a FQDN into its labels, from the top level domain.
+
+        :param value: a FQDN string.
+        :return: the list of reversed labels.
+        """
+
+        labels = value.lower().rstrip('.').split('.')
+
+        labels.reverse()
+
+        return labels
+
+    def add(self, item: any) -> None:
+        """
+        Indexes a whitelist item.
+
+        :param item: a whitelist model.
+        """
+
+        if not item.is_active or item.genre != WhitelistGenreModel.FQDN.value:
+            return
+
+        node = self._root
+
+        for label in self.labels(item.value):
+            node = node.setdefault(label, {})
+
+        if self.ITEM not in node:
+            self._count += 1
+
+        node[self.ITEM] = item
+
+    def match(self, value: str) -> any:
+        """
+        Finds the most specific whitelisted domain covering a FQDN.
+
+        :param value: a FQDN string.
+        :return: the matching whitelist model or None.
+        """
+
+        node = self._root
+
+        found = None
+
+        for label in self.labels(value):
+            node = node.get(label)
+
+            if node is None:
+                break
+
+            found = node.get(self.ITEM, found)
+
+        return found
+
+    def match_exact(self, value: str) -> any:
+        """
+        Finds the whitelist item of exactly this FQDN, ignoring parent domains.
+
+        :param value: a FQDN string.
+        :return: the matching whitelist model or None.
+        """
+
+        node = self._root
+
+        for label in self.labels(value):
+            node = node.get(label)
+
+            if node is None:
+                return None
+
+        return node.get(self.ITEM)
+
+    def match_many(self, values: list) -> list:
+        """
+        Matches a whole list of FQDNs, such as the ticket FQDN list.
+
+        :param values: a list of FQDN strings.
+        :return: a list, aligned with the values, of matching whitelist models or None.
+        """
+
+        if not self._count:
+            return [None] * len(values)
+
+        return [self.match(value) for value in values]
+
+    def is_whitelisted(self, value: str) -> bool:
+        """
+        Checks whether a FQDN or any of its parent domains is whitelisted.
+
+        :param value: a FQDN string.
+        :return: true if covered.
+        """
+
+        return self.match(value) is not None
+
+    def __len__(self) -> int:
+        return self._count
@@ -1,6 +1,6 @@
 from piracyshield_data_model.base import BaseModel
 
-from piracyshield_component.validation.validator import Validator
+from piracyshield_data_model.plan import RulePlan
 
 from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
 from piracyshield_data_model.whitelist.rule import WhitelistRule
@@ -12,15 +12,19 @@ class WhitelistModel(BaseModel):
     Whitelist data modeling class.
     """
 
-    genre = None
+    __slots__ = (
+        'genre',
+        'value',
+        'registrar',
+        'as_code',
+        'is_active'
+    )
 
-    value = None
-
-    registrar = None
-
-    as_code = None
-
-    is_active = True
+    # fields a patch may clear
+    _optional = (
+        'registrar',
+        'as_code'
+    )
 
     def __init__(self, genre: str, value: str, is_active: bool, registrar: str = None, as_code: str = None):
         """
@@ -33,33 +37,84 @@ class WhitelistModel(BaseModel):
         :param as_code: AS code of the IPv4, IPv6 or CIDR classes.
         """
 
-        match genre:
+        self.registrar = None
+
+        self.as_code = None
+
+        self.genre = self._validate_genre(genre)
+
+        self.value = self._validate_value(value)
+
+        if self.genre == WhitelistGenreModel.FQDN.value:
+            self.registrar = self._validate_registrar(registrar)
+
+        else:
+            self.as_code = self._validate_as_code(as_code)
+
+        self.is_active = is_active
+
+    def _validate_patch(self, changed: tuple) -> None:
+        """
+        A new genre needs the value to be checked again, the registrar or AS code of the genre stays mandatory.
+
+        :param changed: the names of the changed fields.
+        """
+
+        if 'genre' in changed and 'value' not in changed:
+            self._validate_value(self.value)
+
+        if self.genre == WhitelistGenreModel.FQDN.value:
+            required, dropped = 'registrar', 'as_code'
+
+        else:
+            required, dropped = 'as_code', 'registrar'
+
+        # a cleared or not yet checked field raises its missing exception
+        if ('genre' in changed or required in changed) and not (required in changed and getattr(self, required)):
+            getattr(self, f'_validate_{required}')(getattr(self, required))
+
+        if 'genre' in changed:
+            setattr(self, dropped, None)
+
+    def _validate_genre(self, value: str) -> str | Exception:
+        """
+        Validates the whitelist item genre.
+
+        :param value: FQDN, IPv4, IPv6 or a CIDR IPv4/IPv6 class.
+        :return: the same value.
+        """
+
+        try:
+            return WhitelistGenreModel(value).value
+
+        except ValueError:
+            raise WhitelistModelGenreException()
+
+    def _validate_value(self, value: str) -> str | Exception:
+        """
+        Validates the value against the whitelist item genre.
+
+        :param value: value of the item.
+        :return: the same value.
+        """
+
+        match self.genre:
             case WhitelistGenreModel.FQDN.value:
-                self.value = self._validate_fqdn(value)
-                self.registrar = self._validate_registrar(registrar)
+                return self._validate_fqdn(value)
 
             case WhitelistGenreModel.IPV4.value:
-                self.value = self._validate_ipv4(value)
-                self.as_code = self._validate_as_code(as_code)
+                return self._validate_ipv4(value)
 
             case WhitelistGenreModel.IPV6.value:
-                self.value = self._validate_ipv6(value)
-                self.as_code = self._validate_as_code(as_code)
+                return self._validate_ipv6(value)
 
             case WhitelistGenreModel.CIDR_IPV4.value:
-                self.value = self._validate_cidr_ipv4(value)
-                self.as_code = self._validate_as_code(as_code)
+                return self._validate_cidr_ipv4(value)
 
             case WhitelistGenreModel.CIDR_IPV6.value:
-                self.value = self._validate_cidr_ipv6(value)
-                self.as_code = self._validate_as_code(as_code)
+                return self._validate_cidr_ipv6(value)
 
-            case _:
-                raise WhitelistModelGenreException()
-
-        self.genre = genre
-
-        self.is_active = is_active
+        raise WhitelistModelGenreException()
 
     def _validate_fqdn(self, value: str) -> str | Exception:
         """
@@ -72,12 +127,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelFQDNMissingException()
 
-        validator = Validator(value, TicketRule.FQDN)
+        plan = RulePlan.compile(TicketRule.FQDN)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise WhitelistModelFQDNNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelFQDNNonValidException(plan.errors(value))
 
         return value
 
@@ -92,12 +145,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelIPv4MissingException()
 
-        validator = Validator(value, TicketRule.IPV4)
-
-        validator.validate()
+        plan = RulePlan.compile(TicketRule.IPV4)
 
-        if not validator.is_valid():
-            raise WhitelistModelIPv4NonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelIPv4NonValidException(plan.errors(value))
 
         return value
 
@@ -112,12 +163,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelIPv6MissingException()
 
-        validator = Validator(value, TicketRule.IPV6)
+        plan = RulePlan.compile(TicketRule.IPV6)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise WhitelistModelIPv6NonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelIPv6NonValidException(plan.errors(value))
 
         return value
 
@@ -132,12 +181,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelCIDRIPv4MissingException()
 
-        validator = Validator(value, WhitelistRule.CIDR_IPV4)
-
-        validator.validate()
+        plan = RulePlan.compile(WhitelistRule.CIDR_IPV4)
 
-        if not validator.is_valid():
-            raise WhitelistModelCIDRIPv4NonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelCIDRIPv4NonValidException(plan.errors(value))
 
         return value
 
@@ -152,12 +199,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelCIDRIPv6MissingException()
 
-        validator = Validator(value, WhitelistRule.CIDR_IPV6)
-
-        validator.validate()
+        plan = RulePlan.compile(WhitelistRule.CIDR_IPV6)
 
-        if not validator.is_valid():
-            raise WhitelistModelCIDRIPv6NonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelCIDRIPv6NonValidException(plan.errors(value))
 
         return value
 
@@ -172,12 +217,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelRegistrarMissingException()
 
-        validator = Validator(value, WhitelistRule.REGISTRAR)
+        plan = RulePlan.compile(WhitelistRule.REGISTRAR)
 
-        validator.validate()
-
-        if not validator.is_valid():
-            raise WhitelistModelRegistrarNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelRegistrarNonValidException(plan.errors(value))
 
         return value
 
@@ -192,12 +235,10 @@ class WhitelistModel(BaseModel):
         if not value or not len(value):
             raise WhitelistModelASCodeMissingException()
 
-        validator = Validator(value, WhitelistRule.AS_CODE)
-
-        validator.validate()
+        plan = RulePlan.compile(WhitelistRule.AS_CODE)
 
-        if not validator.is_valid():
-            raise WhitelistModelASCodeNonValidException(validator.errors)
+        if not plan.is_valid(value):
+            raise WhitelistModelASCodeNonValidException(plan.errors(value))
 
         return value
 
@@ -0,0 +1,150 @@
+from ipaddress import ip_network
+
+from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+from piracyshield_data_model.whitelist.genre.model import WhitelistGenreModel
+
+class WhitelistNetworkMatcher:
+
+    """
+    Longest prefix matcher for the IPv4, IPv6 and CIDR whitelist items.
+
+    Networks are indexed by prefix length, so a lookup costs at most one dictionary
+    probe per distinct prefix length in the whitelist, longest first.
+    """
+
+    def __init__(self, items: list = ()):
+        """
+        Builds the index.
+
+        :param items: a collection of whitelist models, non active ones are skipped.
+        """
+
+        # prefix length -> {network: whitelist item}
+        self._ipv4 = {}
+
+        self._ipv6 = {}
+
+        # (mask, networks) pairs, longest prefix first
+        self._ipv4_plan = ()
+
+        self._ipv6_plan = ()
+
+        for item in items:
+            self.add(item)
+
+    def add(self, item: any) -> None:
+        """
+        Indexes a whitelist item.
+
+        :param item: a whitelist model.
+        """
+
+        if not item.is_active:
+            return
+
+        match item.genre:
+            case WhitelistGenreModel.IPV4.value:
+                self._insert(self._ipv4, IPv4Array.pack(item.value), 32, item)
+
+            case WhitelistGenreModel.IPV6.value:
+                self._insert(self._ipv6, IPv6Array.pack(item.value), 128, item)
+
+            case WhitelistGenreModel.CIDR_IPV4.value:
+                network = ip_network(item.value, strict = False)
+
+                self._insert(self._ipv4, int(network.network_address), network.prefixlen, item)
+
+            case WhitelistGenreModel.CIDR_IPV6.value:
+                network = ip_network(item.value, strict = False)
+
+                self._insert(self._ipv6, int(network.network_address), network.prefixlen, item)
+
+            # FQDN items are not addresses
+            case _:
+                return
+
+        self._ipv4_plan = self._compile(self._ipv4, 32)
+
+        self._ipv6_plan = self._compile(self._ipv6, 128)
+
+    def match(self, value: str) -> any:
+        """
+        Finds the most specific whitelist item covering an address.
+
+        :param value: a valid IPv4 or IPv6 string.
+        :return: the matching whitelist model or None.
+        """
+
+        if ':' in value:
+            return self._lookup(self._ipv6_plan, IPv6Array.pack(value))
+
+        return self._lookup(self._ipv4_plan, IPv4Array.pack(value))
+
+    def match_many(self, values: list) -> list:
+        """
+        Matches a whole list of addresses, such as the ticket IPv4 or IPv6 lists.
+
+        :param values: a list of valid IPv4 or IPv6 strings.
+        :return: a list, aligned with the values, of matching whitelist models or None.
+        """
+
+        ipv4_plan = self._ipv4_plan
+
+        ipv6_plan = self._ipv6_plan
+
+        output = []
+
+        for value in values:
+            if ':' in value:
+                output.append(self._lookup(ipv6_plan, IPv6Array.pack(value)) if ipv6_plan else None)
+
+            else:
+                output.append(self._lookup(ipv4_plan, IPv4Array.pack(value)) if ipv4_plan else None)
+
+        return output
+
+    def is_whitelisted(self, value: str) -> bool:
+        """
+        Checks whether an address is covered by the whitelist.
+
+        :param value: a valid IPv4 or IPv6 string.
+        :return: true if covered.
+        """
+
+        return self.match(value) is not None
+
+    def _insert(self, table: dict, network: int, prefix_length: int, item: any) -> None:
+        """
+        Registers a network under its prefix length.
+        """
+
+        table.setdefault(prefix_length, {})[network] = item
+
+    def _compile(self, table: dict, bits: int) -> tuple:
+        """
+        Precomputes the netmasks, ordered from the longest prefix.
+        """
+
+        full = (1 << bits) - 1
+
+        return tuple(
+            (full ^ ((1 << (bits - prefix_length)) - 1), table[prefix_length])
+            for prefix_length in sorted(table, reverse = True)
+        )
+
+    def _lookup(self, plan: tuple, address: int) -> any:
+        """
+        Probes the networks from the longest prefix.
+        """
+
+        for mask, networks in plan:
+            item = networks.get(address & mask)
+
+            if item is not None:
+                return item
+
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(networks) for networks in self._ipv4.values()) + sum(len(networks) for networks in self._ipv6.values())
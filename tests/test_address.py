@@ -0,0 +1,47 @@
+import pytest
+
+from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+IPV4 = ['1.2.3.4', '255.255.255.255', '0.0.0.0', '10.0.0.1']
+
+IPV6 = ['2001:db8::1', '::', 'ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff', '::ffff:1.2.3.4']
+
+@pytest.mark.parametrize('kind, values', [(IPv4Array, IPV4), (IPv6Array, IPV6)])
+def test_arrays_are_lossless(kind, values):
+    packed = kind(values)
+
+    assert packed.tolist() == values
+
+    assert list(packed) == values
+
+    assert packed == values
+
+    assert values[1] in packed
+
+    assert [packed[index] for index in range(-len(values), len(values))] == values * 2
+
+@pytest.mark.parametrize('kind, values', [(IPv4Array, IPV4), (IPv6Array, IPV6)])
+def test_arrays_slice(kind, values):
+    packed = kind(values)
+
+    for index in (slice(1, None), slice(None, -1), slice(None, None, -1), slice(0, 4, 2), slice(3, 1)):
+        assert isinstance(packed[index], kind)
+
+        assert packed[index].tolist() == values[index]
+
+@pytest.mark.parametrize('kind, values', [(IPv4Array, IPV4), (IPv6Array, IPV6)])
+def test_arrays_index_out_of_range(kind, values):
+    with pytest.raises(IndexError):
+        kind(values)[len(values)]
+
+def test_arrays_sort_numerically():
+    packed = IPv4Array(['10.0.0.2', '9.0.0.1', '10.0.0.10'])
+
+    packed.sort()
+
+    assert packed.tolist() == ['9.0.0.1', '10.0.0.2', '10.0.0.10']
+
+def test_empty_arrays_equal_empty_lists():
+    assert IPv4Array() == [] and IPv6Array() == []
+
+    assert IPv4Array(['1.2.3.4']) != []
@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.ticket.model import TicketModel, TicketModelTicketIdException
+from piracyshield_data_model.ticket.error.model import TicketErrorModel
+from piracyshield_data_model.ticket.item.batch.model import TicketItemBatchModel
+from piracyshield_data_model.ticket.item.processed.model import TicketItemProcessedModel, TicketItemProcessedModelProviderIdentifierMissingException
+
+def test_to_dict_leaves_out_empty_ticket_lists():
+    data = TicketModel('a' * 32, 'b' * 32, ['example.com'], [], [], None).to_dict()
+
+    assert data['fqdn'] == ['example.com']
+
+    assert 'ipv4' not in data and 'ipv6' not in data
+
+    # optional fields never set are not exported either
+    assert 'description' not in data and 'assigned_to' not in data
+
+def test_to_dict_leaves_out_empty_ticket_error_lists():
+    data = TicketErrorModel('c' * 32, 'a' * 32, [], ['1.2.3.4'], []).to_dict()
+
+    assert data['ipv4'] == ['1.2.3.4']
+
+    assert 'fqdn' not in data and 'ipv6' not in data
+
+def test_from_trusted_applies_constructor_defaults():
+    stored = TicketModel('a' * 32, 'b' * 32, ['example.com', 'example.org'], [], [], None).to_dict()
+
+    model = TicketModel.from_trusted(stored)
+
+    assert model.ipv4 == [] and model.ipv6 == []
+
+    # every model owns its lists
+    assert model.ipv4 is not TicketModel.from_trusted(stored).ipv4
+
+    assert model.description is None
+
+    items = [item for chunk in model.fan_out(['c' * 32], lambda: 'd' * 32) for item in chunk]
+
+    assert [item.value for item in items] == ['example.com', 'example.org']
+
+    assert len(TicketItemBatchModel.from_ticket(model, ['c' * 32, 'e' * 32])) == 4
+
+def test_from_row_applies_constructor_defaults():
+    row = tuple(['example.com'] if key == 'fqdn' else None for key in TicketModel._fields)
+
+    model = TicketModel.from_row(row)
+
+    assert model.fqdn == ['example.com'] and model.ipv4 == []
+
+def test_verify_skips_only_optional_fields():
+    stored = TicketModel('a' * 32, 'b' * 32, ['example.com'], [], [], None).to_dict()
+
+    TicketModel.from_trusted(stored, verify = True)
+
+    with pytest.raises(TicketModelTicketIdException):
+        TicketModel.from_trusted(dict(stored, ticket_id = ''), verify = True)
+
+    with pytest.raises(TicketItemProcessedModelProviderIdentifierMissingException):
+        TicketItemProcessedModel.from_trusted({'provider_id': '', 'value': 'example.com'}, verify = True)
+
+    processed = TicketItemProcessedModel.from_trusted({'provider_id': 'c' * 32, 'value': 'example.com', 'note': ''}, verify = True)
+
+    assert processed.note == ''
+
+def test_subclass_generates_its_own_functions_after_the_parent():
+    from piracyshield_data_model.base import BaseModel
+
+    class ParentModel(BaseModel):
+
+        __slots__ = ('name',)
+
+    parent = ParentModel.from_trusted({'name': 'parent'})
+
+    assert parent.to_dict() == {'name': 'parent'}
+
+    # defined once the parent functions already exist
+    class ChildModel(ParentModel):
+
+        __slots__ = ('age',)
+
+    assert not ChildModel._compiled
+
+    assert ChildModel.from_row(('child', 3)).to_dict() == {'name': 'child', 'age': 3}
+
+    assert ChildModel.from_trusted_many([{'name': 'a'}, {'name': 'b', 'age': 1}])[1].to_dict() == {'name': 'b', 'age': 1}
@@ -0,0 +1,277 @@
+import struct
+import zipfile
+
+import pytest
+
+from piracyshield_data_model.forensic.format.inspector import (
+    ForensicFormatInspector,
+    ForensicFormatInspectorArchiveMissingException,
+    ForensicFormatInspectorEntriesException,
+    ForensicFormatInspectorMagicException,
+    ForensicFormatInspectorNonValidException,
+    ForensicFormatInspectorRatioException,
+    ForensicFormatInspectorSizeException
+)
+
+def vint(value: int) -> bytes:
+    """
+    Encodes a RAR 5.0 variable length integer.
+    """
+
+    output = bytearray()
+
+    while True:
+        byte = value & 0x7f
+
+        value >>= 7
+
+        if not value:
+            output.append(byte)
+
+            return bytes(output)
+
+        output.append(byte | 0x80)
+
+def rar4(entries: list, end: bool = True, encrypted_headers: bool = False) -> bytes:
+    """
+    Builds a RAR 4.x archive of (name, data, uncompressed size, flags) entries, with blank CRCs.
+    """
+
+    output = ForensicFormatInspector.RAR4_MAGIC
+
+    # archive header, with its 6 reserved bytes
+    output += struct.pack('<HBHH', 0, 0x73, 0x80 if encrypted_headers else 0, 13) + bytes(6)
+
+    for name, data, uncompressed_size, flags in entries:
+        fields = struct.pack('<LLBLLBBHL', len(data), uncompressed_size, 0, 0, 0, 29, 0x33, len(name), 0x20)
+
+        output += struct.pack('<HBHH', 0, 0x74, 0x8000 | flags, 7 + len(fields) + len(name)) + fields + name + data
+
+    if end:
+        output += struct.pack('<HBHH', 0, 0x7b, 0x4000, 7)
+
+    return output
+
+def rar5_block(block_type: int, body: bytes = b'', extra: bytes = b'', data: bytes = b'') -> bytes:
+    """
+    Builds a RAR 5.0 block, with a blank CRC.
+    """
+
+    fields = vint(block_type) + vint((0x1 if extra else 0) | (0x2 if data else 0))
+
+    if extra:
+        fields += vint(len(extra))
+
+    if data:
+        fields += vint(len(data))
+
+    fields += body + extra
+
+    return bytes(4) + vint(len(fields)) + fields + data
+
+def rar5(entries: list, end: bool = True) -> bytes:
+    """
+    Builds a RAR 5.0 archive of (name, data, uncompressed size, encrypted) entries.
+    """
+
+    output = ForensicFormatInspector.RAR5_MAGIC + rar5_block(1, vint(0))
+
+    for name, data, uncompressed_size, encrypted in entries:
+        # file flags, unpacked size, attributes, compression info, host OS, name
+        body = vint(0) + vint(uncompressed_size) + vint(0x20) + vint(0) + vint(1) + vint(len(name)) + name
+
+        extra = b''
+
+        if encrypted:
+            # a file encryption record: version, flags, KDF count, salt and IV
+            record = vint(0x01) + vint(0) + vint(0) + bytes(33)
+
+            extra = vint(len(record)) + record
+
+        output += rar5_block(2, body, extra, data)
+
+    if end:
+        output += rar5_block(5, vint(0))
+
+    return output
+
+def write(tmp_path, content: bytes, name: str = 'archive') -> str:
+    path = tmp_path / name
+
+    path.write_bytes(content)
+
+    return str(path)
+
+def write_zip(tmp_path, compression: int, files: dict) -> str:
+    path = tmp_path / 'archive.zip'
+
+    with zipfile.ZipFile(path, 'w', compression) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+
+    return str(path)
+
+def test_stored_zip(tmp_path):
+    path = write_zip(tmp_path, zipfile.ZIP_STORED, {'a.txt': b'a' * 100, 'b.txt': b'b' * 50})
+
+    report = ForensicFormatInspector().inspect(path, 'zip')
+
+    assert report == {
+        'format': 'zip',
+        'entries': 2,
+        'compressed_size': 150,
+        'uncompressed_size': 150,
+        'ratio': 1.0,
+        'encrypted': False
+    }
+
+def test_deflated_zip(tmp_path):
+    path = write_zip(tmp_path, zipfile.ZIP_DEFLATED, {'a.txt': b'a' * 100_000})
+
+    report = ForensicFormatInspector().inspect(path)
+
+    with zipfile.ZipFile(path) as archive:
+        compressed_size = archive.getinfo('a.txt').compress_size
+
+    assert report['entries'] == 1
+
+    assert report['uncompressed_size'] == 100_000 and report['compressed_size'] == compressed_size
+
+    assert report['ratio'] == 100_000 / compressed_size
+
+def test_zip64(tmp_path, monkeypatch):
+    # small limits so a small archive takes the ZIP64 records
+    monkeypatch.setattr(zipfile, 'ZIP64_LIMIT', 1000)
+
+    monkeypatch.setattr(zipfile, 'ZIP_FILECOUNT_LIMIT', 3)
+
+    files = {f'{index}.bin': bytes([index]) * (500 + index * 300) for index in range(5)}
+
+    path = write_zip(tmp_path, zipfile.ZIP_STORED, files)
+
+    with open(path, 'rb') as handle:
+        data = handle.read()
+
+    assert b'PK\x06\x06' in data and b'PK\x06\x07' in data
+
+    report = ForensicFormatInspector().inspect(path)
+
+    total = sum(len(value) for value in files.values())
+
+    assert report['entries'] == 5
+
+    assert report['compressed_size'] == total and report['uncompressed_size'] == total
+
+def test_encrypted_zip_entry(tmp_path):
+    data = bytearray(open(write_zip(tmp_path, zipfile.ZIP_STORED, {'a.txt': b'secret'}), 'rb').read())
+
+    # general purpose flags of the central directory entry
+    data[data.find(b'PK\x01\x02') + 8] |= 0x1
+
+    assert ForensicFormatInspector().inspect(write(tmp_path, bytes(data), 'encrypted.zip'))['encrypted'] is True
+
+def test_truncated_zip(tmp_path):
+    data = open(write_zip(tmp_path, zipfile.ZIP_STORED, {'a.txt': b'a' * 100}), 'rb').read()
+
+    with pytest.raises(ForensicFormatInspectorNonValidException):
+        ForensicFormatInspector().inspect(write(tmp_path, data[:-30], 'truncated.zip'))
+
+def test_zip_central_directory_out_of_bounds(tmp_path):
+    data = bytearray(open(write_zip(tmp_path, zipfile.ZIP_STORED, {'a.txt': b'a' * 100}), 'rb').read())
+
+    # central directory offset of the end record
+    eocd = data.rfind(b'PK\x05\x06')
+
+    data[eocd + 16:eocd + 20] = struct.pack('<L', len(data) + 1000)
+
+    with pytest.raises(ForensicFormatInspectorNonValidException):
+        ForensicFormatInspector().inspect(write(tmp_path, bytes(data), 'broken.zip'))
+
+def test_rar4(tmp_path):
+    path = write(tmp_path, rar4([(b'a.txt', b'x' * 40, 400, 0), (b'b.txt', b'y' * 10, 10, 0)]))
+
+    report = ForensicFormatInspector().inspect(path, 'rar')
+
+    assert report == {
+        'format': 'rar',
+        'entries': 2,
+        'compressed_size': 50,
+        'uncompressed_size': 410,
+        'ratio': 8.2,
+        'encrypted': False
+    }
+
+def test_rar4_encryption(tmp_path):
+    inspector = ForensicFormatInspector()
+
+    assert inspector.inspect(write(tmp_path, rar4([(b'a.txt', b'x' * 40, 40, 0x4)]), 'file.rar'))['encrypted'] is True
+
+    # nothing past the archive header can be read
+    report = inspector.inspect(write(tmp_path, rar4([], end = False, encrypted_headers = True), 'headers.rar'))
+
+    assert report['encrypted'] is True and report['entries'] == 0
+
+def test_rar5(tmp_path):
+    path = write(tmp_path, rar5([(b'a.txt', b'x' * 40, 400, False), (b'b.txt', b'y' * 200, 200, False)]))
+
+    report = ForensicFormatInspector().inspect(path)
+
+    assert report['format'] == 'rar'
+
+    assert report['entries'] == 2
+
+    assert report['compressed_size'] == 240 and report['uncompressed_size'] == 600
+
+    assert report['encrypted'] is False
+
+def test_rar5_encrypted_entry(tmp_path):
+    path = write(tmp_path, rar5([(b'a.txt', b'x' * 40, 40, False), (b'b.txt', b'y' * 40, 40, True)]))
+
+    report = ForensicFormatInspector().inspect(path)
+
+    assert report['encrypted'] is True and report['entries'] == 2
+
+def test_rar5_encrypted_headers(tmp_path):
+    data = ForensicFormatInspector.RAR5_MAGIC + rar5_block(4, vint(0) + vint(0) + bytes(17))
+
+    assert ForensicFormatInspector().inspect(write(tmp_path, data))['encrypted'] is True
+
+@pytest.mark.parametrize('content', [
+    rar4([(b'a.txt', b'x' * 40, 40, 0)], end = False),
+    rar4([(b'a.txt', b'x' * 40, 40, 0)])[:-20],
+    rar5([(b'a.txt', b'x' * 40, 40, False)], end = False),
+    rar5([(b'a.txt', b'x' * 40, 40, False)])[:-20]
+], ids = ['rar4 without end', 'rar4 cut', 'rar5 without end', 'rar5 cut'])
+def test_truncated_rar(tmp_path, content):
+    with pytest.raises(ForensicFormatInspectorNonValidException):
+        ForensicFormatInspector().inspect(write(tmp_path, content))
+
+@pytest.mark.parametrize('content', [b'not an archive', b'', b'PK'], ids = ['text', 'empty', 'short'])
+def test_wrong_magic(tmp_path, content):
+    with pytest.raises(ForensicFormatInspectorMagicException):
+        ForensicFormatInspector().inspect(write(tmp_path, content))
+
+def test_format_mismatch(tmp_path):
+    path = write_zip(tmp_path, zipfile.ZIP_STORED, {'a.txt': b'a'})
+
+    with pytest.raises(ForensicFormatInspectorMagicException):
+        ForensicFormatInspector().inspect(path, 'rar')
+
+def test_missing_archive(tmp_path):
+    with pytest.raises(ForensicFormatInspectorArchiveMissingException):
+        ForensicFormatInspector().inspect(str(tmp_path / 'missing.zip'))
+
+def test_limits(tmp_path):
+    path = write_zip(tmp_path, zipfile.ZIP_DEFLATED, {'a.txt': b'a' * 100_000, 'b.txt': b'b'})
+
+    with pytest.raises(ForensicFormatInspectorEntriesException):
+        ForensicFormatInspector(max_entries = 1).inspect(path)
+
+    with pytest.raises(ForensicFormatInspectorSizeException):
+        ForensicFormatInspector(max_uncompressed_size = 50_000).inspect(path)
+
+    with pytest.raises(ForensicFormatInspectorRatioException):
+        ForensicFormatInspector(max_ratio = 10).inspect(path)
+
+    # within every limit
+    assert ForensicFormatInspector(max_entries = 2, max_uncompressed_size = 100_001, max_ratio = 10_000).inspect(path)['entries'] == 2
@@ -0,0 +1,146 @@
+import hashlib
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.forensic.status.model import ForensicArchiveStatusModel
+from piracyshield_data_model.forensic.hash.model import ForensicHashModel
+from piracyshield_data_model.forensic.hash.verifier import (
+    ForensicHashVerifier,
+    ForensicHashVerifierArchiveMissingException,
+    ForensicHashVerifierChunkSizeException,
+    ForensicHashVerifierHashMissingException,
+    ForensicHashVerifierStatusException
+)
+
+@pytest.fixture
+def archive(tmp_path) -> tuple:
+    data = os.urandom(10_000)
+
+    path = tmp_path / 'archive.zip'
+
+    path.write_bytes(data)
+
+    return str(path), data
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_digest_matches_hashlib(archive, use_mmap):
+    path, data = archive
+
+    verifier = ForensicHashVerifier(chunk_size = 4096, use_mmap = use_mmap)
+
+    assert verifier.digest(path, 'sha256') == hashlib.sha256(data).hexdigest()
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_empty_archive_digest(tmp_path, use_mmap):
+    path = tmp_path / 'empty.zip'
+
+    path.write_bytes(b'')
+
+    assert ForensicHashVerifier(use_mmap = use_mmap).digest(str(path), 'SHA512') == hashlib.sha512().hexdigest()
+
+def test_chunk_size_must_be_positive():
+    for chunk_size in (0, -1):
+        with pytest.raises(ForensicHashVerifierChunkSizeException):
+            ForensicHashVerifier(chunk_size = chunk_size)
+
+def test_missing_archive(tmp_path):
+    with pytest.raises(ForensicHashVerifierArchiveMissingException):
+        ForensicHashVerifier().digest(str(tmp_path / 'missing.zip'), 'SHA256')
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_verify_moves_the_hash_out_of_pending(archive, use_mmap):
+    path, data = archive
+
+    verifier = ForensicHashVerifier(chunk_size = 4096, use_mmap = use_mmap)
+
+    # upper case digests are accepted as well
+    approved = ForensicHashModel(hashlib.sha256(data).hexdigest().upper(), 'SHA256')
+
+    rejected = ForensicHashModel(hashlib.sha256(b'other').hexdigest(), 'SHA256')
+
+    assert approved.status == ForensicArchiveStatusModel.PENDING.value
+
+    assert verifier.verify(approved, path) is True
+
+    assert approved.status == ForensicArchiveStatusModel.APPROVED.value
+
+    assert verifier.verify(rejected, path) is False
+
+    assert rejected.status == ForensicArchiveStatusModel.REJECTED.value
+
+    # already verified
+    with pytest.raises(ForensicHashVerifierStatusException):
+        verifier.verify(approved, path)
+
+def test_verify_many_judges_every_hash(archive):
+    path, data = archive
+
+    sha256 = ForensicHashModel(hashlib.sha256(data).hexdigest(), 'SHA256')
+
+    blake2b = ForensicHashModel(hashlib.blake2b(b'other').hexdigest(), 'BLAKE2B')
+
+    assert ForensicHashVerifier(chunk_size = 4096).verify_many([sha256, blake2b], path) is False
+
+    assert sha256.status == ForensicArchiveStatusModel.APPROVED.value
+
+    assert blake2b.status == ForensicArchiveStatusModel.REJECTED.value
+
+def test_verify_many_refuses_an_empty_list(archive):
+    path, data = archive
+
+    with pytest.raises(ForensicHashVerifierHashMissingException):
+        ForensicHashVerifier().verify_many([], path)
+
+    with pytest.raises(ForensicHashVerifierHashMissingException):
+        ForensicHashVerifier().digests(path, [])
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+@pytest.mark.parametrize('threaded', [False, True])
+def test_digests_match_hashlib_over_many_chunks(tmp_path, use_mmap, threaded):
+    # several chunks and a partial one at the end
+    data = os.urandom(7 * 4096 + 123)
+
+    path = tmp_path / 'archive.zip'
+
+    path.write_bytes(data)
+
+    hash_types = ['SHA256', 'SHA512', 'BLAKE2B', 'BLAKE2S']
+
+    digests = ForensicHashVerifier(chunk_size = 4096, use_mmap = use_mmap).digests(str(path), hash_types, threaded)
+
+    assert digests == {hash_type: hashlib.new(hash_type.lower(), data).hexdigest() for hash_type in hash_types}
+
+class SlowHasher:
+
+    """
+    Records the chunks after a pause, so the next read overlaps the update.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def update(self, view: memoryview) -> None:
+        time.sleep(0.001)
+
+        self.chunks.append(bytes(view))
+
+def test_double_buffer_never_overwrites_a_chunk_being_hashed(tmp_path):
+    data = os.urandom(20 * 1000 + 7)
+
+    path = tmp_path / 'archive.zip'
+
+    path.write_bytes(data)
+
+    hashers = [SlowHasher(), SlowHasher()]
+
+    with ThreadPoolExecutor(max_workers = 2) as executor, open(path, 'rb') as handle:
+        ForensicHashVerifier(chunk_size = 1000)._update_buffer(hashers, handle, executor)
+
+    for hasher in hashers:
+        assert b''.join(hasher.chunks) == data
@@ -0,0 +1,91 @@
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.base import BaseModel
+from piracyshield_data_model.instrumentation import Instrumentation
+
+from piracyshield_data_model.ticket.item.batch.model import TicketItemBatchModel, TicketItemBatchModelProviderIdentifierNonValidException
+from piracyshield_data_model.ticket.item.genre.classifier import TicketItemGenreClassifier
+from piracyshield_data_model.ticket.item.report.model import TicketItemReportModel
+
+@pytest.fixture
+def instrumentation():
+    Instrumentation.reset()
+
+    Instrumentation.enable()
+
+    yield Instrumentation
+
+    Instrumentation.disable()
+
+    Instrumentation.reset()
+
+def test_models_imported_after_enable_are_instrumented(instrumentation):
+    class LazyModel(BaseModel):
+
+        __slots__ = ('name',)
+
+        def _validate_name(self, value: str) -> str:
+            return value
+
+        def _validate_patch(self, changed: tuple) -> None:
+            pass
+
+    model = LazyModel.__new__(LazyModel)
+
+    model._validate_name('lazy')
+
+    model._validate_patch(('name',))
+
+    fields = instrumentation.snapshot()['fields']
+
+    assert fields[('LazyModel', 'name')]['calls'] == 1
+
+    # the cross-field hook is not a field
+    assert ('LazyModel', 'patch') not in fields
+
+def test_disable_stops_instrumenting_new_models(instrumentation):
+    instrumentation.disable()
+
+    assert instrumentation._instrument not in BaseModel._class_hooks
+
+    class LaterModel(BaseModel):
+
+        __slots__ = ('name',)
+
+        def _validate_name(self, value: str) -> str:
+            return value
+
+    assert LaterModel.__dict__['_validate_name'].__qualname__.endswith('LaterModel._validate_name')
+
+    assert not hasattr(LaterModel._validate_name, '__wrapped__')
+
+def test_validators_outside_base_model_are_instrumented(instrumentation):
+    TicketItemReportModel('c' * 32, [('report.example.com', 'processed', None, None, None)])
+
+    TicketItemGenreClassifier.classify('classified.example.com')
+
+    with pytest.raises(TicketItemBatchModelProviderIdentifierNonValidException):
+        TicketItemBatchModel.from_ticket(None, ['not an identifier'])
+
+    fields = instrumentation.snapshot()['fields']
+
+    assert fields[('TicketItemReportModel', 'value')]['calls'] == 1
+
+    assert fields[('TicketItemGenreClassifier', 'value')]['calls'] == 2
+
+    assert fields[('TicketItemBatchModel', 'provider_id')]['failures'] == 1
+
+def test_rule_cache_hits_are_counted(instrumentation):
+    for _ in range(3):
+        TicketItemGenreClassifier.classify('cached.example.com')
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot['cache_hits'][('TicketItemGenreClassifier', 'value')] == 2
+
+    # the rules ran only for the first call
+    assert {metric['calls'] for key, metric in snapshot['rules'].items() if key[0] == 'TicketItemGenreClassifier'} == {1}
+
+    assert 'piracyshield_validation_cache_hits_total{model="TicketItemGenreClassifier",field="value"} 2' in instrumentation.to_prometheus()
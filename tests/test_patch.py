@@ -0,0 +1,100 @@
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.address import IPv4Array
+
+from piracyshield_data_model.patch import PatchModel, PatchModelFieldNonValidException, PatchModelFieldNotEditableException
+
+from piracyshield_data_model.account.model import AccountModel, AccountModelConfirmPasswordMismatchException
+from piracyshield_data_model.ticket.model import TicketModel, TicketModelNoDataException, TicketModelFQDNNonValidException
+from piracyshield_data_model.ticket.item.processed.model import TicketItemProcessedModel
+from piracyshield_data_model.whitelist.model import WhitelistModel, WhitelistModelASCodeMissingException
+
+PASSWORD = 'Secret-Password-123!'
+
+@pytest.fixture
+def ticket() -> TicketModel:
+    return TicketModel.from_trusted(TicketModel('a' * 32, 'b' * 32, ['example.com', 'example.org'], ['1.2.3.4'], [], None, 'Ticket').to_dict())
+
+def test_patch_diff_holds_only_the_changes(ticket):
+    patch = PatchModel(ticket, {'fqdn': ['example.com', 'example.org', 'example.net'], 'description': 'Ticket'})
+
+    assert patch.diff == {'fqdn': ['example.com', 'example.org', 'example.net']}
+
+    assert patch.model.fqdn == ['example.com', 'example.org', 'example.net']
+
+    # the base model is untouched
+    assert ticket.fqdn == ['example.com', 'example.org']
+
+def test_patch_validates_only_the_added_items(ticket):
+    with pytest.raises(TicketModelFQDNNonValidException) as error:
+        PatchModel(ticket, {'fqdn': ['example.com', 'example.org', 'bad one']})
+
+    # indexes refer to the added items
+    assert [(index, value) for index, value, errors in error.value.args[0]] == [(0, 'bad one')]
+
+def test_patch_clears_optional_fields(ticket):
+    patch = PatchModel(ticket, {'description': None, 'ipv4': []})
+
+    assert patch.diff == {'description': None, 'ipv4': []}
+
+    with pytest.raises(TicketModelNoDataException):
+        PatchModel(ticket, {'fqdn': [], 'ipv4': []})
+
+def test_patch_refuses_unknown_and_identifier_fields(ticket):
+    with pytest.raises(PatchModelFieldNonValidException):
+        PatchModel(ticket, {'unknown': 1})
+
+    # no validator
+    with pytest.raises(PatchModelFieldNotEditableException):
+        PatchModel(ticket, {'status': 'closed'})
+
+    for key in ('ticket_id', 'dda_id'):
+        with pytest.raises(PatchModelFieldNotEditableException):
+            PatchModel(ticket, {key: 'c' * 32})
+
+    with pytest.raises(PatchModelFieldNotEditableException):
+        PatchModel(ticket, {'description': 'Other'}, editable = ('fqdn',))
+
+    # identifiers can still be allowed explicitly
+    assert PatchModel(ticket, {'dda_id': 'c' * 32}, editable = ('dda_id',)).diff == {'dda_id': 'c' * 32}
+
+def test_patch_leaves_out_transient_fields():
+    account = AccountModel.from_trusted({'account_id': 'a' * 32, 'name': 'Name', 'email': 'name@example.com', 'password': 'hashed', 'role': 100, 'is_active': True})
+
+    with pytest.raises(AccountModelConfirmPasswordMismatchException):
+        PatchModel(account, {'password': PASSWORD, 'confirm_password': 'Other-Password-123!'})
+
+    patch = PatchModel(account, {'name': 'Other', 'password': PASSWORD, 'confirm_password': PASSWORD})
+
+    assert patch.diff == {'name': 'Other'}
+
+    assert set(patch.changed) == {'name', 'password', 'confirm_password'}
+
+    assert patch.model.password == PASSWORD
+
+    with pytest.raises(PatchModelFieldNotEditableException):
+        PatchModel(account, {'account_id': 'b' * 32})
+
+def test_patch_reports_derived_fields():
+    item = TicketItemProcessedModel('c' * 32, 'example.com', '2024-01-01T00:00:00Z')
+
+    assert PatchModel(item, {'value': '1.2.3.4', 'timestamp': None}).diff == {'value': '1.2.3.4', 'timestamp': None, 'genre': 'ipv4', 'timestamp_epoch': None}
+
+def test_patch_checks_the_whitelist_genre_rules():
+    item = WhitelistModel('fqdn', 'example.com', True, registrar = 'Registrar')
+
+    with pytest.raises(WhitelistModelASCodeMissingException):
+        PatchModel(item, {'genre': 'ipv4', 'value': '8.8.8.8'})
+
+    assert PatchModel(item, {'genre': 'ipv4', 'value': '8.8.8.8', 'as_code': 'AS15169'}).diff == {'genre': 'ipv4', 'value': '8.8.8.8', 'as_code': 'AS15169', 'registrar': None}
+
+def test_patch_keeps_packed_lists_packed(ticket):
+    ticket.pack()
+
+    patch = PatchModel(ticket, {'ipv4': ['1.2.3.4', '5.6.7.8'], 'fqdn': ['example.com', 'example.org']})
+
+    assert patch.diff == {'ipv4': ['1.2.3.4', '5.6.7.8']}
+
+    assert isinstance(patch.model.ipv4, IPv4Array) and patch.model.ipv4 == ['1.2.3.4', '5.6.7.8']
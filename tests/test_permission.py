@@ -0,0 +1,56 @@
+import pytest
+
+from piracyshield_data_model.account.role.model import AccountRoleModel
+
+from piracyshield_data_model.permission.model import PermissionModel
+from piracyshield_data_model.permission.bitset import PermissionSet, PermissionSetNonValidException
+from piracyshield_data_model.permission.matrix import PermissionMatrix, PermissionMatrixRoleNonValidException, PermissionMatrixPermissionNonValidException
+
+def test_permission_set_packs_permissions():
+    permissions = PermissionSet.from_permissions([PermissionModel.VIEW_TICKET, PermissionModel.CREATE_TICKET])
+
+    assert PermissionModel.VIEW_TICKET in permissions
+
+    assert PermissionModel.EDIT_TICKET not in permissions
+
+    assert len(permissions) == 2
+
+    assert permissions.has_all(PermissionSet.mask_of([PermissionModel.VIEW_TICKET]))
+
+    assert PermissionSet.from_permissions(permissions.to_list()) == permissions
+
+    with pytest.raises(PermissionSetNonValidException):
+        PermissionSet.mask_of([-1])
+
+def test_matrix_uses_the_supplied_assignments():
+    matrix = PermissionMatrix({
+        AccountRoleModel.REPORTER: [PermissionModel.CREATE_TICKET, PermissionModel.VIEW_TICKET],
+        AccountRoleModel.GUEST.value: [PermissionModel.VIEW_TICKET]
+    })
+
+    assert matrix.has_permission(AccountRoleModel.REPORTER, PermissionModel.CREATE_TICKET)
+
+    assert not matrix.has_permission(AccountRoleModel.GUEST, PermissionModel.CREATE_TICKET)
+
+    assert matrix.check_many(AccountRoleModel.REPORTER.value, [PermissionModel.VIEW_TICKET, PermissionModel.EDIT_TICKET]) == [True, False]
+
+    assert matrix.has_permissions(AccountRoleModel.REPORTER, PermissionSet.mask_of([PermissionModel.CREATE_TICKET, PermissionModel.VIEW_TICKET]))
+
+    assert matrix.roles_with(PermissionModel.VIEW_TICKET) == [AccountRoleModel.GUEST, AccountRoleModel.REPORTER]
+
+def test_matrix_grants_nothing_to_unassigned_roles():
+    matrix = PermissionMatrix({})
+
+    assert not any(matrix.has_permission(role, permission) for role in AccountRoleModel for permission in PermissionModel)
+
+def test_matrix_refuses_non_valid_roles_and_permissions():
+    with pytest.raises(PermissionMatrixRoleNonValidException):
+        PermissionMatrix({1: [PermissionModel.VIEW_TICKET]})
+
+    matrix = PermissionMatrix({AccountRoleModel.GUEST: [PermissionModel.VIEW_TICKET]})
+
+    with pytest.raises(PermissionMatrixRoleNonValidException):
+        matrix.has_permission(1, PermissionModel.VIEW_TICKET)
+
+    with pytest.raises(PermissionMatrixPermissionNonValidException):
+        matrix.has_permission(AccountRoleModel.GUEST, -1)
@@ -0,0 +1,140 @@
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.plan import RulePlan
+
+from piracyshield_data_model.ticket.rule import TicketRule
+
+def test_partition_splits_valid_and_non_valid_items():
+    valid, invalid = RulePlan.compile(TicketRule.IPV4).partition(['1.2.3.4', 'nope', '5.6.7.8', '1.2.3'])
+
+    assert valid == ['1.2.3.4', '5.6.7.8']
+
+    assert [(index, value) for index, value, errors in invalid] == [(1, 'nope'), (3, '1.2.3')]
+
+    assert all(errors for index, value, errors in invalid)
+
+def test_partition_reports_every_repeated_non_valid_item():
+    valid, invalid = RulePlan.compile(TicketRule.IPV4).partition(['nope', '1.2.3.4', 'nope', '1.2.3.4'])
+
+    assert valid == ['1.2.3.4', '1.2.3.4']
+
+    assert [index for index, value, errors in invalid] == [0, 2]
+
+def test_partition_accepts_unhashable_values():
+    valid, invalid = RulePlan.compile(TicketRule.IPV4).partition([['1.2.3.4'], '1.2.3.4'])
+
+    assert valid == ['1.2.3.4']
+
+    assert [index for index, value, errors in invalid] == [0]
+
+def test_partition_in_a_process_pool():
+    from piracyshield_data_model.plan import ParallelValidation
+
+    values = [f'10.0.{index // 250}.{index % 250}' if index % 9 else f'10.0.0.{300 + index}' for index in range(200)]
+
+    parallel = ParallelValidation(threshold = 50, chunk_size = 40, workers = 2)
+
+    assert RulePlan.compile(TicketRule.IPV4).partition(values, parallel) == RulePlan.compile(TicketRule.IPV4).partition(values)
+
+def test_ticket_starts_one_pool_for_all_its_lists(monkeypatch):
+    import concurrent.futures
+
+    from piracyshield_data_model.plan import ParallelValidation
+
+    from piracyshield_data_model.ticket.model import TicketModel
+
+    pools = []
+
+    shutdowns = []
+
+    class CountedPool(concurrent.futures.ProcessPoolExecutor):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+
+            pools.append(self)
+
+        def shutdown(self, *args, **kwargs):
+            shutdowns.append(self)
+
+            super().shutdown(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', CountedPool)
+
+    fqdn = [f'host{index}.example.com' for index in range(60)]
+
+    ipv4 = [f'10.0.0.{index}' for index in range(60)]
+
+    ipv6 = [f'2001:db8::{index:x}' for index in range(60)]
+
+    parallel = ParallelValidation(threshold = 50, chunk_size = 20, workers = 2)
+
+    model = TicketModel('a' * 32, 'b' * 32, fqdn, ipv4, ipv6, None, parallel = parallel)
+
+    assert model.ipv6 == ipv6
+
+    assert len(pools) == 1
+
+    # shut down with the construction
+    assert shutdowns == pools
+
+    # the settings themselves never keep a pool
+    assert parallel.executor is None
+
+def test_worker_reuses_its_plan_across_chunks():
+    import pickle
+
+    from piracyshield_data_model import plan as module
+
+    rules = TicketRule.IPV4
+
+    # every chunk unpickles a new copy of the rules
+    first = module._partition_chunk(id(rules), pickle.loads(pickle.dumps(rules)), 0, ['1.2.3.4', 'nope'])
+
+    plan = module._worker_plans[id(rules)]
+
+    second = module._partition_chunk(id(rules), pickle.loads(pickle.dumps(rules)), 2, ['nope'])
+
+    assert module._worker_plans[id(rules)] is plan
+
+    assert [index for index, value, errors in first + second] == [1, 2]
+
+class IntegerOnly:
+
+    """
+    Accepts plain integers only.
+    """
+
+    def __init__(self):
+        self.errors = []
+
+    def __call__(self, value: any) -> None:
+        if type(value) is not int:
+            self.errors.append('not an integer')
+
+def test_cache_keeps_equal_values_of_different_types_apart():
+    plan = RulePlan([IntegerOnly()])
+
+    assert plan.is_valid(1)
+
+    # equal to 1 and hashed alike, but not integers
+    assert not plan.is_valid(True)
+
+    assert not plan.is_valid(1.0)
+
+    valid, invalid = plan.partition([1, True, 1.0, 1])
+
+    assert valid == [1, 1]
+
+    assert [index for index, value, errors in invalid] == [1, 2]
+
+def test_partition_leaves_the_shared_cache_alone():
+    cache = RulePlan.cache
+
+    before = (cache.hits, cache.misses, len(cache._entries))
+
+    RulePlan.compile(TicketRule.IPV4).partition([f'10.1.{index // 256}.{index % 256}' for index in range(1000)])
+
+    assert (cache.hits, cache.misses, len(cache._entries)) == before
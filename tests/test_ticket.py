@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.plan import ParallelValidation
+from piracyshield_data_model.address import IPv4Array, IPv6Array
+
+from piracyshield_data_model.ticket.model import (
+    TicketModel,
+    TicketModelFQDNNonValidException,
+    TicketModelIPv4NonValidException,
+    TicketModelIPv6NonValidException,
+    TicketModelNoDataException
+)
+from piracyshield_data_model.ticket.error.model import TicketErrorModel, TicketErrorModelIPv4NonValidException
+
+def test_validate_lists_reports_every_non_valid_item():
+    report = TicketModel.validate_lists(
+        fqdn = ['example.com', 'not a domain', 'example.org', 'also_bad!'],
+        ipv4 = ['1.2.3.4', '999.1.1.1'],
+        ipv6 = ['2001:db8::1']
+    )
+
+    assert sorted(report) == ['fqdn', 'ipv4']
+
+    assert [(index, value) for index, value, errors in report['fqdn']] == [(1, 'not a domain'), (3, 'also_bad!')]
+
+    assert [(index, value) for index, value, errors in report['ipv4']] == [(1, '999.1.1.1')]
+
+    assert all(errors for index, value, errors in report['fqdn'] + report['ipv4'])
+
+def test_validate_lists_empty_report_when_valid():
+    assert TicketModel.validate_lists(fqdn = ['example.com'], ipv4 = ['1.2.3.4']) == {}
+
+    assert TicketModel.validate_lists() == {}
+
+def test_validate_lists_parallel_matches_in_process():
+    fqdn = [f'host{index}.example.com' if index % 7 else f'bad host {index}' for index in range(50)]
+
+    with ThreadPoolExecutor(max_workers = 2) as executor:
+        parallel = ParallelValidation(threshold = 10, chunk_size = 8, executor = executor)
+
+        assert TicketModel.validate_lists(fqdn = fqdn, parallel = parallel) == TicketModel.validate_lists(fqdn = fqdn)
+
+def ticket(**kwargs) -> dict:
+    parameters = {
+        'ticket_id': 'a' * 32,
+        'dda_id': 'b' * 32,
+        'fqdn': ['example.com'],
+        'ipv4': [],
+        'ipv6': [],
+        'assigned_to': None
+    }
+
+    parameters.update(kwargs)
+
+    return parameters
+
+def test_strict_ticket_reports_every_non_valid_item():
+    with pytest.raises(TicketModelFQDNNonValidException) as error:
+        TicketModel(**ticket(fqdn = ['bad one', 'example.com', 'bad two']))
+
+    assert [(index, value) for index, value, errors in error.value.args[0]] == [(0, 'bad one'), (2, 'bad two')]
+
+def test_partial_ticket_drops_non_valid_items():
+    model = TicketModel(**ticket(fqdn = ['bad one', 'example.com'], ipv4 = ['1.2.3.4', '300.0.0.1']), partial = True)
+
+    assert model.fqdn == ['example.com']
+
+    assert model.ipv4 == ['1.2.3.4']
+
+    assert [(index, value) for index, value, errors in model.rejected['fqdn']] == [(0, 'bad one')]
+
+    assert [(index, value) for index, value, errors in model.rejected['ipv4']] == [(1, '300.0.0.1')]
+
+    assert 'ipv6' not in model.rejected
+
+    # the rejected items are not part of the data
+    assert '_rejected' not in model.to_dict()
+
+def test_partial_ticket_with_nothing_valid_is_refused():
+    with pytest.raises(TicketModelNoDataException):
+        TicketModel(**ticket(fqdn = ['bad one'], ipv4 = ['300.0.0.1']), partial = True)
+
+def test_strict_ticket_error_reports_every_non_valid_item():
+    with pytest.raises(TicketErrorModelIPv4NonValidException) as error:
+        TicketErrorModel('c' * 32, 'a' * 32, [], ['1.2.3.4', 'nope', '1.2.3'], [])
+
+    assert [index for index, value, errors in error.value.args[0]] == [1, 2]
+
+def test_packed_ticket_keeps_the_compact_lists():
+    model = TicketModel(**ticket(ipv4 = ['1.2.3.4', '5.6.7.8'], ipv6 = ['2001:db8::1']), packed = True)
+
+    assert isinstance(model.ipv4, IPv4Array) and isinstance(model.ipv6, IPv6Array)
+
+    assert model.packed_ipv4() is model.ipv4
+
+    # exported as strings, as it would be unpacked
+    assert model.to_dict() == TicketModel(**ticket(ipv4 = ['1.2.3.4', '5.6.7.8'], ipv6 = ['2001:db8::1'])).to_dict()
+
+    items = [item.value for chunk in model.fan_out(['c' * 32], lambda: 'd' * 32) for item in chunk]
+
+    assert items == ['example.com', '1.2.3.4', '5.6.7.8', '2001:db8::1']
+
+    assert model.unpack().ipv4 == ['1.2.3.4', '5.6.7.8']
+
+def test_trusted_ticket_can_be_packed():
+    stored = TicketModel(**ticket(ipv4 = ['1.2.3.4'])).to_dict()
+
+    model = TicketModel.from_trusted(stored).pack()
+
+    assert isinstance(model.ipv6, IPv6Array) and not model.ipv6
+
+    assert model.to_dict() == stored
+
+    model.verify()
+
+def test_packing_reports_values_the_platform_refuses():
+    with pytest.raises(TicketModelIPv6NonValidException) as error:
+        TicketModel._pack(IPv6Array, ['2001:db8::1', 'fe80::1%eth0'], TicketModelIPv6NonValidException)
+
+    assert [(index, value) for index, value, errors in error.value.args[0]] == [(1, 'fe80::1%eth0')]
+
+    with pytest.raises(TicketModelIPv4NonValidException):
+        TicketModel._pack(IPv4Array, ['1.2.3.4', '1.2.3.4\x00'], TicketModelIPv4NonValidException)
+
+def test_packed_ticket_with_a_zone_index_is_refused():
+    # never a bare OSError, whether the rule or the packing refuses it
+    with pytest.raises(TicketModelIPv6NonValidException):
+        TicketModel(**ticket(ipv6 = ['fe80::1%eth0']), packed = True)
+
+def test_packed_ticket_exports_the_canonical_form():
+    model = TicketModel(**ticket(ipv6 = ['2001:DB8::1', '2001:0db8:0000::2']), packed = True)
+
+    assert model.to_dict()['ipv6'] == ['2001:db8::1', '2001:db8::2']
+
+    # unpacked tickets keep the input as it is
+    assert TicketModel(**ticket(ipv6 = ['2001:DB8::1'])).to_dict()['ipv6'] == ['2001:DB8::1']
+
+def test_fan_out_accepts_a_generator_of_providers():
+    model = TicketModel(**ticket(fqdn = ['example.com', 'example.org']))
+
+    providers = (provider_id for provider_id in ['c' * 32, 'e' * 32])
+
+    items = [item for chunk in model.fan_out(providers, lambda: 'd' * 32) for item in chunk]
+
+    assert [(item.value, item.provider_id) for item in items] == [
+        ('example.com', 'c' * 32),
+        ('example.com', 'e' * 32),
+        ('example.org', 'c' * 32),
+        ('example.org', 'e' * 32)
+    ]
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.ticket.item.processed.model import TicketItemProcessedModel, TicketItemProcessedModelTimestampNonValidException
+from piracyshield_data_model.ticket.item.unprocessed.model import TicketItemUnprocessedModel, TicketItemUnprocessedModelTimestampNonValidException
+
+PROVIDER_ID = 'c' * 32
+
+def test_processed_keeps_timestamp_epoch():
+    model = TicketItemProcessedModel(PROVIDER_ID, 'example.com', '2024-01-01T00:00:00Z')
+
+    assert model.genre == 'fqdn'
+
+    assert model.timestamp_epoch == 1704067200.0
+
+@pytest.mark.parametrize('timestamp', ['yesterday', ['2024-01-01T00:00:00Z'], {'date': '2024-01-01'}])
+def test_processed_refuses_non_valid_timestamp(timestamp):
+    with pytest.raises(TicketItemProcessedModelTimestampNonValidException):
+        TicketItemProcessedModel(PROVIDER_ID, 'example.com', timestamp)
+
+@pytest.mark.parametrize('timestamp', ['yesterday', ['2024-01-01T00:00:00Z']])
+def test_unprocessed_refuses_non_valid_timestamp(timestamp):
+    with pytest.raises(TicketItemUnprocessedModelTimestampNonValidException):
+        TicketItemUnprocessedModel(PROVIDER_ID, '1.2.3.4', 'ALREADY_BLOCKED', timestamp)
@@ -0,0 +1,78 @@
+import itertools
+
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.ticket.model import TicketModel
+from piracyshield_data_model.ticket.item.batch.model import (
+    TicketItemBatchModel,
+    TicketItemBatchModelProviderIdentifierMissingException,
+    TicketItemBatchModelProviderIdentifierNonValidException,
+    TicketItemBatchModelTicketItemIdentifierMissingException
+)
+
+PROVIDER_IDS = ['c' * 32, 'd' * 32]
+
+@pytest.fixture
+def batch() -> TicketItemBatchModel:
+    ticket = TicketModel('a' * 32, 'b' * 32, ['example.com'], ['1.2.3.4', '5.6.7.8'], [], None)
+
+    return TicketItemBatchModel.from_ticket(ticket, PROVIDER_IDS)
+
+def test_batch_rows_are_grouped_by_value(batch):
+    assert len(batch) == 6
+
+    assert [(row['value'], row['genre'], row['provider_id']) for row in batch.to_dicts()] == [
+        (value, genre, provider_id)
+        for value, genre in (('example.com', 'fqdn'), ('1.2.3.4', 'ipv4'), ('5.6.7.8', 'ipv4'))
+        for provider_id in PROVIDER_IDS
+    ]
+
+def test_batch_flags_by_value(batch):
+    batch.set_flag_by_value('is_duplicate', {'1.2.3.4'})
+
+    assert batch.rows_with('is_duplicate') == [2, 3]
+
+    batch.set_flag('is_active', [0], False)
+
+    assert batch.rows_with('is_active', False) == [0]
+
+def test_batch_rows_own_their_settings(batch):
+    first, second = batch.to_dicts(0, 2)
+
+    first['settings']['update_max_time'] = 0
+
+    assert second['settings']['update_max_time'] == 172800
+
+    assert batch.settings['update_max_time'] == 172800
+
+def test_batch_items_need_identifiers(batch):
+    with pytest.raises(TicketItemBatchModelTicketItemIdentifierMissingException):
+        batch.item(0)
+
+    counter = itertools.count()
+
+    batch.assign_identifiers(lambda: f'{next(counter):032x}')
+
+    item = batch.item(5)
+
+    assert (item.ticket_item_id, item.value, item.provider_id) == (f'{5:032x}', '5.6.7.8', PROVIDER_IDS[1])
+
+    assert item.to_dict() == batch.row(5)
+
+def test_batch_from_a_generator_of_providers():
+    ticket = TicketModel('a' * 32, 'b' * 32, ['example.com'], ['1.2.3.4'], [], None)
+
+    batch = TicketItemBatchModel.from_ticket(ticket, (provider_id for provider_id in PROVIDER_IDS))
+
+    assert len(batch) == 4 and batch.provider_ids == PROVIDER_IDS
+
+def test_batch_refuses_missing_and_non_valid_providers():
+    ticket = TicketModel('a' * 32, 'b' * 32, ['example.com'], [], [], None)
+
+    with pytest.raises(TicketItemBatchModelProviderIdentifierMissingException):
+        TicketItemBatchModel.from_ticket(ticket, ['c' * 32, ''])
+
+    with pytest.raises(TicketItemBatchModelProviderIdentifierNonValidException):
+        TicketItemBatchModel.from_ticket(ticket, ['not an identifier'])
@@ -0,0 +1,65 @@
+import pytest
+
+from piracyshield_data_model.ticket.item.duplicate import TicketItemDuplicateIndex, TicketItemDuplicateIndexNotPartialException
+
+def test_index_uses_canonical_values():
+    index = TicketItemDuplicateIndex()
+
+    index.add('fqdn', 'Example.COM.')
+
+    index.add('ipv6', '2001:DB8:0::1')
+
+    assert index.contains('fqdn', 'example.com')
+
+    assert index.contains('ipv6', '2001:db8::1')
+
+    assert index.contains('ipv4', '1.2.3.4') is False
+
+    assert index.find_duplicates(fqdn = ['example.com', 'example.org'], ipv6 = ['2001:db8::1']) == {'fqdn': ['example.com'], 'ipv6': ['2001:db8::1']}
+
+def test_index_counts_the_items_carrying_a_value():
+    index = TicketItemDuplicateIndex()
+
+    index.add('ipv4', '1.2.3.4')
+
+    index.add('ipv4', '1.2.3.4')
+
+    index.remove('ipv4', '1.2.3.4')
+
+    assert index.contains('ipv4', '1.2.3.4')
+
+    index.remove('ipv4', '1.2.3.4')
+
+    assert not index.contains('ipv4', '1.2.3.4')
+
+@pytest.mark.parametrize('bloom_size', [None, 1 << 16])
+def test_complete_index_answers_exactly(bloom_size):
+    index = TicketItemDuplicateIndex(bloom_size = bloom_size)
+
+    index.add('ipv4', '1.2.3.4')
+
+    assert index.contains_many('ipv4', ['1.2.3.4', '5.6.7.8']) == [True, False]
+
+    with pytest.raises(TicketItemDuplicateIndexNotPartialException):
+        index.add('ipv4', '5.6.7.8', exact = False)
+
+def test_partial_index_tells_only_what_it_knows():
+    index = TicketItemDuplicateIndex(bloom_size = 1 << 16, partial = True)
+
+    index.add('ipv4', '1.2.3.4')
+
+    # known to the filter only
+    index.add('ipv4', '5.6.7.8', exact = False)
+
+    assert index.contains_many('ipv4', ['1.2.3.4', '5.6.7.8', '9.9.9.9']) == [True, None, False]
+
+    assert index.find_duplicates(ipv4 = ['1.2.3.4', '5.6.7.8']) == {'ipv4': ['1.2.3.4']}
+
+    assert index.might_contain('ipv4', '5.6.7.8')
+
+def test_partial_index_without_filter_cannot_tell_misses():
+    index = TicketItemDuplicateIndex(partial = True)
+
+    index.add('fqdn', 'example.com')
+
+    assert index.contains_many('fqdn', ['example.com', 'example.org']) == [True, None]
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip('piracyshield_component')
+
+from piracyshield_data_model.ticket.item.report.model import (
+    TicketItemReportModel,
+    TicketItemReportModelRowNonValidException,
+    TicketItemReportModelTimestampNonValidException,
+    TicketItemReportModelValueNonValidException
+)
+
+PROVIDER_ID = 'c' * 32
+
+def test_report_keeps_valid_rows_and_records_the_others():
+    report = TicketItemReportModel(PROVIDER_ID, [
+        ('example.com', 'processed', None, '2024-01-01T00:00:00Z', None),
+        ('not a value', 'processed', None, None, None),
+        ('1.2.3.4', 'unprocessed', 'ALREADY_BLOCKED', None, 'Already blocked'),
+        ('too', 'short'),
+        ('2001:db8::1', 'processed', None, ['2024-01-01T00:00:00Z'], None)
+    ])
+
+    assert len(report) == 2
+
+    assert report.values == ['example.com', '1.2.3.4']
+
+    assert report.rows_with('unprocessed') == [1]
+
+    assert [(index, type(exception)) for index, row, exception in report.errors] == [
+        (1, TicketItemReportModelValueNonValidException),
+        (3, TicketItemReportModelRowNonValidException),
+        (4, TicketItemReportModelTimestampNonValidException)
+    ]
+
+def test_report_rows_match_the_item_layout():
+    report = TicketItemReportModel(PROVIDER_ID, [
+        ('example.com', 'processed', 'ALREADY_BLOCKED', '2024-01-01T00:00:00Z', None),
+        ('1.2.3.4', 'unprocessed', 'UNKNOWN', None, None)
+    ])
+
+    first, second = report.to_dicts()
+
+    assert first['genre'] == 'fqdn' and first['timestamp_epoch'] == 1704067200.0
+
+    # processed items carry no reason
+    assert 'reason' not in first
+
+    assert second['genre'] == 'ipv4' and second['reason'] == 'UNKNOWN'
+
+def test_malformed_timestamp_does_not_abort_the_report():
+    rows = [('example.com', 'processed', None, '2024-01-01T00:00:00Z', None)] * 1000
+
+    rows[500] = ('example.com', 'processed', None, {'date': 'today'}, None)
+
+    report = TicketItemReportModel(PROVIDER_ID, rows)
+
+    assert len(report) == 999
+
+    assert [index for index, row, exception in report.errors] == [500]
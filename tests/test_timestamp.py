@@ -0,0 +1,53 @@
+import pytest
+
+from piracyshield_data_model.timestamp import Timestamp, TimestampFormatException
+
+def test_epoch_parses_iso8601():
+    assert Timestamp.epoch('2024-01-01T00:00:00Z') == 1704067200.0
+
+    assert Timestamp.epoch('2024-01-01T01:00:00+01:00') == 1704067200.0
+
+    # no offset means UTC
+    assert Timestamp.epoch('2024-01-01T00:00:00') == 1704067200.0
+
+@pytest.mark.parametrize('value', ['yesterday', '', None, 1704067200, ['2024-01-01T00:00:00Z'], {'date': '2024-01-01'}])
+def test_epoch_refuses_non_valid_values(value):
+    with pytest.raises(TimestampFormatException):
+        Timestamp.epoch(value)
+
+@pytest.mark.parametrize('value, epoch', [
+    ('2024-01-01', 1704067200.0),
+    ('2024-01-01T00:00Z', 1704067200.0),
+    ('2024-01-01 00:00:00z', 1704067200.0),
+    ('2024-01-01T00:00:00.12Z', 1704067200.12),
+    ('2024-01-01T00:00:00.000001+00:00', 1704067200.000001),
+    ('2023-12-31T19:30:00-04:30', 1704067200.0)
+])
+def test_epoch_accepts_the_pinned_profile(value, epoch):
+    assert Timestamp.epoch(value) == pytest.approx(epoch, abs = 1e-6)
+
+@pytest.mark.parametrize('value', [
+    # basic format, accepted by fromisoformat only from Python 3.11
+    '20240101T000000Z',
+    '2024-01-01T000000',
+    '2024-01-01T00:00:00+0100',
+    # week and ordinal dates
+    '2024-W01-1',
+    '2024-001',
+    # more than microseconds
+    '2024-01-01T00:00:00.1234567Z',
+    # hours alone
+    '2024-01-01T00',
+    # out of range
+    '2024-13-01',
+    '2024-02-30',
+    '2024-01-01T24:00:00',
+    '2024-01-01T00:00:00+24:00',
+    '2024-01-01T00:00:00+01:60',
+    # non ASCII digits
+    '２０２４-01-01',
+    '2024-01-01T00:00:00Z ',
+])
+def test_epoch_refuses_outside_the_pinned_profile(value):
+    with pytest.raises(TimestampFormatException):
+        Timestamp.epoch(value)
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+from piracyshield_data_model.whitelist.domain import WhitelistDomainMatcher
+
+def item(value: str, genre: str = 'fqdn', is_active: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(genre = genre, value = value, is_active = is_active)
+
+def test_exact_and_parent_matches():
+    parent = item('example.com')
+
+    child = item('www.example.com')
+
+    matcher = WhitelistDomainMatcher([parent, child])
+
+    assert matcher.match('example.com') is parent
+
+    assert matcher.match('www.example.com') is child
+
+    # the most specific whitelisted domain wins
+    assert matcher.match('cdn.www.example.com') is child
+
+    assert matcher.match('mail.example.com') is parent
+
+    assert matcher.match_exact('mail.example.com') is None
+
+    assert matcher.match_exact('www.example.com') is child
+
+    # parents are not covered by their subdomains
+    assert WhitelistDomainMatcher([child]).match('example.com') is None
+
+def test_case_and_trailing_dot_are_normalized():
+    whitelisted = item('Example.COM.')
+
+    matcher = WhitelistDomainMatcher([whitelisted])
+
+    assert matcher.match('example.com') is whitelisted
+
+    assert matcher.match('WWW.EXAMPLE.COM.') is whitelisted
+
+    assert matcher.match_exact('EXAMPLE.com') is whitelisted
+
+def test_labels_match_whole():
+    matcher = WhitelistDomainMatcher([item('example.com')])
+
+    assert matcher.match('xexample.com') is None
+
+    assert matcher.match('example.com.evil.net') is None
+
+    assert matcher.match('com') is None
+
+def test_match_many():
+    parent = item('example.com')
+
+    other = item('example.org')
+
+    matcher = WhitelistDomainMatcher([parent, other])
+
+    values = ['a.example.com', 'example.net', 'EXAMPLE.ORG', 'xexample.com']
+
+    assert matcher.match_many(values) == [parent, None, other, None]
+
+    assert WhitelistDomainMatcher().match_many(values) == [None] * 4
+
+def test_inactive_and_address_items_are_skipped():
+    matcher = WhitelistDomainMatcher([
+        item('example.com', is_active = False),
+        item('192.0.2.1', genre = 'ipv4')
+    ])
+
+    assert len(matcher) == 0
+
+    assert not matcher.is_whitelisted('example.com')
+
+def test_len_counts_each_domain_once():
+    matcher = WhitelistDomainMatcher([item('example.com'), item('EXAMPLE.com.'), item('www.example.com')])
+
+    assert len(matcher) == 2
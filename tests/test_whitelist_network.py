@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+from piracyshield_data_model.whitelist.network import WhitelistNetworkMatcher
+
+def item(genre: str, value: str, is_active: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(genre = genre, value = value, is_active = is_active)
+
+def test_longest_prefix_wins_whatever_the_insertion_order():
+    wide = item('cidr_ipv4', '10.0.0.0/8')
+
+    narrow = item('cidr_ipv4', '10.1.0.0/16')
+
+    host = item('ipv4', '10.1.2.3')
+
+    for items in ([wide, narrow, host], [host, narrow, wide]):
+        matcher = WhitelistNetworkMatcher(items)
+
+        assert matcher.match('10.1.2.3') is host
+
+        assert matcher.match('10.1.2.4') is narrow
+
+        assert matcher.match('10.2.0.1') is wide
+
+        assert matcher.match('11.0.0.1') is None
+
+def test_default_route_and_host_prefixes():
+    everything = item('cidr_ipv4', '0.0.0.0/0')
+
+    host = item('cidr_ipv4', '192.0.2.1/32')
+
+    ipv6_host = item('cidr_ipv6', '2001:db8::1/128')
+
+    matcher = WhitelistNetworkMatcher([everything, host, ipv6_host])
+
+    assert matcher.match('192.0.2.1') is host
+
+    assert matcher.match('192.0.2.2') is everything
+
+    assert matcher.match('255.255.255.255') is everything
+
+    assert matcher.match('2001:db8::1') is ipv6_host
+
+    # the IPv4 default route does not cover IPv6
+    assert matcher.match('2001:db8::2') is None
+
+    ipv6_everything = item('cidr_ipv6', '::/0')
+
+    matcher.add(ipv6_everything)
+
+    assert matcher.match('2001:db8::2') is ipv6_everything
+
+def test_host_bits_of_a_network_are_ignored():
+    network = item('cidr_ipv6', '2001:db8::1/32')
+
+    assert WhitelistNetworkMatcher([network]).match('2001:db8:ffff::1') is network
+
+def test_match_many_mixes_ipv4_and_ipv6():
+    ipv4 = item('cidr_ipv4', '192.0.2.0/24')
+
+    ipv6 = item('cidr_ipv6', '2001:db8::/32')
+
+    matcher = WhitelistNetworkMatcher([ipv4, ipv6])
+
+    values = ['192.0.2.10', '2001:db8::5', '198.51.100.1', '2001:db9::1', '::ffff:192.0.2.10']
+
+    assert matcher.match_many(values) == [ipv4, ipv6, None, None, None]
+
+    assert matcher.match_many(values) == [matcher.match(value) for value in values]
+
+def test_match_many_with_only_one_family():
+    ipv4 = item('ipv4', '192.0.2.10')
+
+    assert WhitelistNetworkMatcher([ipv4]).match_many(['192.0.2.10', '2001:db8::1']) == [ipv4, None]
+
+def test_inactive_and_fqdn_items_are_skipped():
+    matcher = WhitelistNetworkMatcher([
+        item('cidr_ipv4', '10.0.0.0/8', is_active = False),
+        item('fqdn', 'example.com'),
+        item('ipv6', '2001:db8::1', is_active = False)
+    ])
+
+    assert len(matcher) == 0
+
+    assert not matcher.is_whitelisted('10.0.0.1')
+
+    assert not matcher.is_whitelisted('2001:db8::1')
+
+def test_len_counts_the_indexed_networks():
+    matcher = WhitelistNetworkMatcher([
+        item('ipv4', '10.0.0.1'),
+        item('cidr_ipv4', '10.0.0.0/8'),
+        item('cidr_ipv6', '2001:db8::/32')
+    ])
+
+    assert len(matcher) == 3
+
+    assert matcher.is_whitelisted('10.200.0.1')